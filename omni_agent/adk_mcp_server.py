@@ -2,28 +2,35 @@
 import asyncio
 import json
 import logging
+from functools import cache
+from typing import TYPE_CHECKING
 
 import mcp.server.stdio  # For running as a stdio server
-from google.adk.agents import InvocationContext
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
-
-# ADK Tool Imports
-from google.adk.tools import AgentTool, ToolContext
-
-# ADK <-> MCP Conversion Utility
-from google.adk.tools.mcp_tool.conversion_utils import adk_to_mcp_tool_type
 
 # MCP Server Imports
 from mcp import types as mcp_types  # Use alias to avoid conflict
 from mcp.server.lowlevel import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from omni_agent.agent import root_agent
+# ADK is imported by the handlers, on the first request rather than at startup
+if TYPE_CHECKING:
+    from google.adk.tools import AgentTool
 
 logger = logging.getLogger(__name__)
 
 
-adk_tool_to_expose = AgentTool(agent=root_agent)
+@cache
+def get_adk_tool_to_expose() -> "AgentTool":
+    """Wrap the root agent on first use.
+
+    The server can answer the MCP handshake before the agent graph is imported.
+    """
+    from google.adk.tools import AgentTool
+
+    from omni_agent.agent import root_agent
+
+    return AgentTool(agent=root_agent)
+
 
 # --- MCP Server Setup ---
 app = Server("adk-tool-exposing-mcp-server")
@@ -32,6 +39,10 @@ app = Server("adk-tool-exposing-mcp-server")
 @app.list_tools()
 async def list_mcp_tools() -> list[mcp_types.Tool]:
     """MCP handler to list tools this server exposes."""
+    # ADK <-> MCP Conversion Utility
+    from google.adk.tools.mcp_tool.conversion_utils import adk_to_mcp_tool_type
+
+    adk_tool_to_expose = get_adk_tool_to_expose()
     mcp_tool_schema = adk_to_mcp_tool_type(adk_tool_to_expose)
     return [mcp_tool_schema]
 
@@ -41,6 +52,11 @@ async def call_mcp_tool(
     name: str, arguments: dict
 ) -> list[mcp_types.Content]:  # MCP uses mcp_types.Content
     """MCP handler to execute a tool call requested by an MCP client."""
+    from google.adk.agents import InvocationContext
+    from google.adk.sessions.in_memory_session_service import InMemorySessionService
+    from google.adk.tools import ToolContext
+
+    adk_tool_to_expose = get_adk_tool_to_expose()
     session_service = InMemorySessionService()
     session = await session_service.create_session(
         app_name="omni_agent", user_id="test_user"
@@ -52,7 +68,7 @@ async def call_mcp_tool(
         session_service=session_service,
         session=session,
         invocation_id="omni_agent",
-        agent=root_agent,
+        agent=adk_tool_to_expose.agent,
     )
     # Check if the requested tool name matches our wrapped ADK tool
     if name == adk_tool_to_expose.name:
@@ -86,6 +102,8 @@ async def call_mcp_tool(
 # --- MCP Server Runner ---
 async def run_mcp_stdio_server():
     """Runs the MCP server, listening for connections over standard input/output."""
+    # Import the agent graph in the background while the client connects
+    warmup = asyncio.create_task(asyncio.to_thread(get_adk_tool_to_expose))
     # Use the stdio_server context manager from the mcp.server.stdio library
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
@@ -101,6 +119,12 @@ async def run_mcp_stdio_server():
                 ),
             ),
         )
+    warmup.cancel()
+    from omni_agent.core.scraper_client import scraper_client
+    from omni_agent.core.tools import close_scrape_do_client
+
+    await scraper_client.close()
+    await close_scrape_do_client()
 
 
 if __name__ == "__main__":
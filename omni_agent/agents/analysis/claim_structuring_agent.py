@@ -2,14 +2,60 @@
 
 from __future__ import annotations
 
+import logging
+
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
 
+from omni_agent.core.deadline import (
+    DEADLINE_ERROR_CODE,
+    bound_by_deadline,
+    deadline_output,
+    deadline_reached,
+)
+from omni_agent.core.llm_governor import GovernedLiteLlm
 from omni_agent.core.models import StructuredClaimsOutput
 from omni_agent.core.settings import OPENAI_GPT5_NANO_2025_08_07
 
+logger = logging.getLogger(__name__)
+
+
+def skip_after_deadline(callback_context: CallbackContext) -> types.Content | None:
+    """Structure no claims once the fact-check deadline has passed."""
+    if not deadline_reached(callback_context.invocation_id):
+        return None
+    logger.warning(
+        f"[{callback_context.invocation_id}] ClaimStructuringAgent: Skipped, the "
+        "fact-check deadline has passed"
+    )
+    callback_context.state["structured_claims"] = {"claims": []}
+    return types.Content(
+        role="model",
+        parts=[
+            types.Part(
+                text="Fact-check deadline reached before claims were structured."
+            )
+        ],
+    )
+
+
+def no_claims_after_timeout(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> LlmResponse | None:
+    """Structure no claims when the call is cut off by the fact-check deadline."""
+    if llm_response.error_code != DEADLINE_ERROR_CODE:
+        return None
+    logger.warning(
+        f"[{callback_context.invocation_id}] ClaimStructuringAgent: Cut off by the "
+        "fact-check deadline"
+    )
+    return deadline_output(StructuredClaimsOutput(claims=[]))
+
+
 claim_structuring_agent = LlmAgent(
-    model=LiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
+    model=GovernedLiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
     name="ClaimStructuringAgent",
     instruction="""
     You are given free-form text. Extract only discrete, atomic, and externally
@@ -78,6 +124,9 @@ claim_structuring_agent = LlmAgent(
     description="Transforms input text into structured, verifiable claims",
     output_schema=StructuredClaimsOutput,
     output_key="structured_claims",
+    before_agent_callback=skip_after_deadline,
+    before_model_callback=bound_by_deadline,
+    after_model_callback=no_claims_after_timeout,
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
 )
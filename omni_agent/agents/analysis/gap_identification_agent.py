@@ -2,17 +2,68 @@
 
 from __future__ import annotations
 
+import logging
+
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
 
+from omni_agent.core.deadline import (
+    DEADLINE_ERROR_CODE,
+    bound_by_research_time,
+    deadline_output,
+    deadline_reached,
+)
+from omni_agent.core.llm_governor import GovernedLiteLlm
 from omni_agent.core.models import GapQuestionsOutput
-from omni_agent.core.settings import OPENAI_GPT5_NANO_2025_08_07
+from omni_agent.core.settings import OPENAI_GPT5_NANO_2025_08_07, settings
+
+from .verdict_cache_agent import skip_when_all_claims_cached
+
+logger = logging.getLogger(__name__)
 
 MAX_GAP_QUESTIONS: int = 5
 
 
+def skip_when_no_research_time(
+    callback_context: CallbackContext,
+) -> types.Content | None:
+    """Ask no gap questions once research would have no time to answer them.
+
+    That is ``settings.synthesis_reserve`` seconds before the deadline, when the
+    research stage stops starting new questions anyway.
+    """
+    if not deadline_reached(callback_context.invocation_id, settings.synthesis_reserve):
+        return None
+    logger.warning(
+        f"[{callback_context.invocation_id}] GapIdentificationAgent: Skipped, no "
+        "research time is left before the fact-check deadline"
+    )
+    callback_context.state["gap_questions"] = {"gap_questions": []}
+    return types.Content(
+        role="model",
+        parts=[
+            types.Part(text="No research time left before the fact-check deadline.")
+        ],
+    )
+
+
+def no_questions_after_timeout(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> LlmResponse | None:
+    """Ask no gap questions when the call runs into the research cut-off."""
+    if llm_response.error_code != DEADLINE_ERROR_CODE:
+        return None
+    logger.warning(
+        f"[{callback_context.invocation_id}] GapIdentificationAgent: Cut off, no "
+        "research time is left before the fact-check deadline"
+    )
+    return deadline_output(GapQuestionsOutput(gap_questions=[]))
+
+
 gap_identification_agent = LlmAgent(
-    model=LiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
+    model=GovernedLiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
     name="GapIdentificationAgent",
     include_contents="none",
     instruction=f"""
@@ -21,7 +72,7 @@ gap_identification_agent = LlmAgent(
     be directly answerable via open-web sources (search + page content).
 
     INPUTS:
-    - structured_claims: {{structured_claims}}
+    - structured_claims: {{pending_claims}}
 
     Four question types (choose one per question):
     - TEMPORAL: validate timing or current status (e.g., "as of today").
@@ -76,6 +127,9 @@ gap_identification_agent = LlmAgent(
     description="Identifies critical gaps and potential weaknesses in claims",
     output_schema=GapQuestionsOutput,
     output_key="gap_questions",
+    before_agent_callback=[skip_when_all_claims_cached, skip_when_no_research_time],
+    before_model_callback=bound_by_research_time,
+    after_model_callback=no_questions_after_timeout,
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
 )
@@ -0,0 +1,99 @@
+"""Agent that answers previously checked claims from the verdict cache."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+
+from omni_agent.core.models import (
+    AtomicClaimOutput,
+    ClaimAdjudicationOutput,
+    StructuredClaimsOutput,
+)
+from omni_agent.core.verdict_cache import verdict_cache
+
+logger = logging.getLogger(__name__)
+
+
+def cached_claim_verdicts(state: Any) -> dict[str, ClaimAdjudicationOutput]:
+    """Verdicts VerdictCacheAgent found for this fact-check, by claim id."""
+    return {
+        claim_id: ClaimAdjudicationOutput.model_validate(verdict)
+        for claim_id, verdict in (state.get("cached_verdicts") or {}).items()
+    }
+
+
+def pending_claims(state: Any) -> list[AtomicClaimOutput]:
+    """Claims that still need research, or all of them without a cache lookup."""
+    claims = state.get("pending_claims") or state.get("structured_claims")
+    return StructuredClaimsOutput(**(claims or {"claims": []})).claims
+
+
+def skip_when_all_claims_cached(
+    callback_context: CallbackContext,
+) -> types.Content | None:
+    """Skip gap identification when every claim was answered from the cache."""
+    if "pending_claims" not in callback_context.state or pending_claims(
+        callback_context.state
+    ):
+        return None
+    # Questions of an earlier fact-check in this session must not be researched
+    callback_context.state["gap_questions"] = {"gap_questions": []}
+    return types.Content(
+        role="model",
+        parts=[types.Part(text="Every claim was answered from the verdict cache.")],
+    )
+
+
+class VerdictCacheAgent(BaseAgent):
+    """Look up each structured claim in ``verdict_cache``.
+
+    Hits are stored in ``cached_verdicts`` (by claim id) and skip gap
+    identification, research and adjudication; the other claims are stored in
+    ``pending_claims`` for the rest of the pipeline.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="VerdictCacheAgent")
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        claims = StructuredClaimsOutput(
+            **(ctx.session.state.get("structured_claims") or {"claims": []})
+        ).claims
+
+        cached: dict[str, dict] = {}
+        pending: list[AtomicClaimOutput] = []
+        for claim in claims:
+            verdict = await verdict_cache.get(claim)
+            if verdict is None:
+                pending.append(claim)
+            else:
+                cached[claim.id] = verdict.model_dump()
+
+        logger.info(
+            f"[{ctx.invocation_id}] {self.name}: {len(cached)} of {len(claims)} "
+            f"claims answered from the verdict cache ({verdict_cache.stats.as_dict()})"
+        )
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            actions=EventActions(
+                state_delta={
+                    "cached_verdicts": cached,
+                    "pending_claims": StructuredClaimsOutput(
+                        claims=pending
+                    ).model_dump(),
+                }
+            ),
+        )
+
+
+verdict_cache_agent = VerdictCacheAgent()
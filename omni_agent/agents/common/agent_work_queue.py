@@ -0,0 +1,180 @@
+"""Run agents on a sliding window of workers and interleave their events."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, Hashable
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobTiming:
+    key: Hashable
+    # Seconds from submission until a worker picked the job up
+    queued_s: float
+    run_s: float
+    # done, failed or timed_out
+    status: str
+
+
+@dataclass
+class _Job:
+    key: Hashable
+    create_agent: Callable[[], BaseAgent]
+    submitted_at: float
+    # Event loop time after which the job is cut off, or not started at all
+    ends_at: float | None
+
+
+class AgentWorkQueue:
+    """Up to ``concurrency`` agents of one invocation running at once.
+
+    Each worker starts the next submitted job as soon as its current agent
+    finishes, lowest ``priority`` first and then in submission order. Jobs may be
+    submitted while the queue runs, until ``close()``.
+    Agents run in isolated branches below ``parent``, as ParallelAgent runs its
+    sub-agents, and are never attached to the agent tree.
+    """
+
+    def __init__(
+        self, parent: BaseAgent, ctx: InvocationContext, concurrency: int
+    ) -> None:
+        self.parent = parent
+        self.ctx = ctx
+        self.concurrency = max(1, concurrency)
+        # Value each agent wrote to its output_key, by job key
+        self.outputs: dict[Hashable, Any] = {}
+        self.timings: dict[Hashable, JobTiming] = {}
+        self._pending: asyncio.PriorityQueue[tuple[float, int, _Job | None]] = (
+            asyncio.PriorityQueue()
+        )
+        self._order = itertools.count()
+        self._events: asyncio.Queue[
+            tuple[Hashable | None, Event | None, asyncio.Event | None]
+        ] = asyncio.Queue()
+
+    def submit(
+        self,
+        key: Hashable,
+        create_agent: Callable[[], BaseAgent],
+        *,
+        priority: float = 0,
+        ends_at: float | None = None,
+    ) -> None:
+        """Queue a job; at ``ends_at`` (event loop time) it is cut off."""
+        job = _Job(key, create_agent, time.monotonic(), ends_at)
+        self._pending.put_nowait((priority, next(self._order), job))
+
+    def close(self) -> None:
+        """Let workers exit once the jobs submitted so far are done."""
+        self._pending.put_nowait((math.inf, next(self._order), None))
+
+    def _create_branch_ctx(self, agent: BaseAgent) -> InvocationContext:
+        branch_ctx = self.ctx.model_copy()
+        branch_suffix = f"{self.parent.name}.{agent.name}"
+        branch_ctx.branch = (
+            f"{self.ctx.branch}.{branch_suffix}" if self.ctx.branch else branch_suffix
+        )
+        return branch_ctx
+
+    async def _work(self) -> None:
+        try:
+            while True:
+                item = await self._pending.get()
+                job = item[2]
+                if job is None:
+                    # Leave the close marker for the other workers
+                    self._pending.put_nowait(item)
+                    return
+                await self._run_job(job)
+        finally:
+            await self._events.put((None, None, None))
+
+    async def _run_job(self, job: _Job) -> None:
+        if job.ends_at is not None and asyncio.get_running_loop().time() >= job.ends_at:
+            # Too late to start: finished without a timing, as if never picked up
+            await self._events.put((job.key, None, None))
+            return
+        picked_at = time.monotonic()
+        status = "done"
+        try:
+            agent = job.create_agent()
+            output_key = getattr(agent, "output_key", None)
+            agent_events = agent.run_async(self._create_branch_ctx(agent))
+            async with asyncio.timeout_at(job.ends_at), aclosing(agent_events):
+                async for event in agent_events:
+                    state_delta = event.actions.state_delta
+                    if output_key and output_key in state_delta:
+                        self.outputs[job.key] = state_delta[output_key]
+                    consumed = asyncio.Event()
+                    await self._events.put((job.key, event, consumed))
+                    await consumed.wait()
+        except asyncio.CancelledError:
+            # The whole queue was cut off
+            status = "timed_out"
+            raise
+        except TimeoutError:
+            status = "timed_out"
+        except Exception:
+            status = "failed"
+            logger.exception(
+                f"[{self.ctx.invocation_id}] {self.parent.name}: Job {job.key} failed"
+            )
+        finally:
+            self.timings[job.key] = JobTiming(
+                key=job.key,
+                queued_s=round(picked_at - job.submitted_at, 3),
+                run_s=round(time.monotonic() - picked_at, 3),
+                status=status,
+            )
+        await self._events.put((job.key, None, None))
+
+    async def run(
+        self, ends_at: float | None = None
+    ) -> AsyncGenerator[tuple[Hashable, Event | None], None]:
+        """Run the workers until the queue is closed and drained.
+
+        Yields ``(key, event)`` for every agent event, and ``(key, None)`` when a
+        job finishes or is skipped past its own ``ends_at``, after which its output
+        is in ``outputs``. As in
+        ParallelAgent, a worker waits until its event has been consumed before it
+        continues, so state deltas are applied in the order they are yielded. At
+        ``ends_at`` (event loop time) running jobs are cancelled and jobs still
+        queued are abandoned.
+        """
+        async with asyncio.TaskGroup() as task_group:
+            workers = [
+                task_group.create_task(self._work()) for _ in range(self.concurrency)
+            ]
+
+            finished_workers = 0
+            while finished_workers < self.concurrency:
+                try:
+                    async with asyncio.timeout_at(ends_at):
+                        key, event, consumed = await self._events.get()
+                except TimeoutError:
+                    logger.warning(
+                        f"[{self.ctx.invocation_id}] {self.parent.name}: Deadline "
+                        f"reached; cancelling {self.concurrency - finished_workers} "
+                        "workers"
+                    )
+                    for worker in workers:
+                        worker.cancel()
+                    break
+                if key is None:
+                    finished_workers += 1
+                    continue
+                yield key, event
+                if consumed is not None:
+                    consumed.set()
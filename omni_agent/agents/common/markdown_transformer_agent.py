@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
 
+from omni_agent.core.llm_governor import GovernedLiteLlm
 from omni_agent.core.models import MarkdownOutput
 from omni_agent.core.settings import OPENAI_GPT5_NANO_2025_08_07
 
-
-def create_markdown_transformer_agent(raw_scraped_input: str, output_key: str) -> LlmAgent:
+# Shared by every transformer agent, so its LiteLLM client is created only once
+markdown_transformer_model = GovernedLiteLlm(model=OPENAI_GPT5_NANO_2025_08_07)
+
+
+def create_markdown_transformer_agent(
+    raw_scraped_input: str,
+    output_key: str,
+    source_url: str = "",
+    part: int = 1,
+    total_parts: int = 1,
+) -> LlmAgent:
+    source_context = f"SOURCE URL: {source_url}\n" if source_url else ""
+    if total_parts > 1:
+        source_context += f"""INPUT PART: {part} of {total_parts}
+This input is one part of a longer page; the cleaned parts are joined in order afterwards.
+Transform only this part. Do not add a title, summary or References section that is not in it.
+"""
     return LlmAgent(
-        model=LiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
+        model=markdown_transformer_model,
         name="MarkdownTransformerAgent",
         description="Cleans raw text and converts it into research-ready markdown.",
         instruction=f"""
@@ -37,6 +52,7 @@ RESEARCH READINESS:
 OUTPUT FORMAT:
 Return ONLY the final cleaned Markdown string. No JSON, no commentary.
 
+{source_context}
 RAW INPUT:
 {raw_scraped_input}
     """,
@@ -1,22 +1,43 @@
 from __future__ import annotations
 
 from google.adk.agents import SequentialAgent
+from google.adk.agents.callback_context import CallbackContext
 
 from omni_agent.agents.analysis.claim_structuring_agent import claim_structuring_agent
 from omni_agent.agents.analysis.gap_identification_agent import gap_identification_agent
+from omni_agent.agents.analysis.verdict_cache_agent import verdict_cache_agent
 from omni_agent.agents.research.research_orchestrator_agent import (
     research_orchestrator_agent,
 )
+from omni_agent.agents.synthesis.claim_adjudicator_agent import (
+    per_claim_adjudicator_agent,
+)
 from omni_agent.agents.synthesis.evidence_adjudicator_agent import (
     evidence_adjudicator_agent,
 )
+from omni_agent.agents.synthesis.pipelined_adjudicator_agent import (
+    pipelined_adjudicator_agent,
+)
+from omni_agent.core.deadline import end_deadline, start_deadline
+from omni_agent.core.settings import settings
+
+
+def start_fact_check_deadline(callback_context: CallbackContext) -> None:
+    """Start the wall-clock budget that every stage of this fact-check shares."""
+    start_deadline(callback_context.invocation_id)
+
+
+def end_fact_check_deadline(callback_context: CallbackContext) -> None:
+    end_deadline(callback_context.invocation_id)
+
 
 # Stage 1: Analysis & Strategy (Sequential)
 analysis_stage = SequentialAgent(
     name="AnalysisStage",
     sub_agents=[
         claim_structuring_agent,  # structured_claims
-        gap_identification_agent,  # structured_claims -> gap_questions
+        verdict_cache_agent,  # -> cached_verdicts, pending_claims
+        gap_identification_agent,  # pending_claims -> gap_questions
     ],
     description="Analyzes input and creates research strategy",
 )
@@ -26,18 +47,31 @@ research_stage = (
     research_orchestrator_agent  # gap_questions -> comprehensive_answer_set
 )
 
-# Stage 3: Synthesis & Verification (Sequential)
+# Stage 3: Synthesis & Verification (Sequential). Claims are adjudicated
+# concurrently and merged, or in one call with SYNTHESIS_MODE=single.
 synthesis_stage = SequentialAgent(
     name="SynthesisStage",
     sub_agents=[
-        evidence_adjudicator_agent,  # adjudicated_report
+        (
+            evidence_adjudicator_agent
+            if settings.synthesis_mode == "single"
+            else per_claim_adjudicator_agent
+        ),  # research_answers -> adjudicated_report
     ],
     description="Evidence synthesis and report transformation",
 )
 
-# Main orchestrator: Analysis -> Research -> Synthesis
+# Main orchestrator: Analysis -> Research -> Synthesis. With
+# SYNTHESIS_MODE=pipelined each claim is adjudicated as soon as its research is
+# done, while research on other claims continues.
 deep_research_orchestrator = SequentialAgent(
     name="DeepResearchOrchestrator",
-    sub_agents=[analysis_stage, research_stage, synthesis_stage],
+    sub_agents=(
+        [analysis_stage, pipelined_adjudicator_agent]
+        if settings.synthesis_mode == "pipelined"
+        else [analysis_stage, research_stage, synthesis_stage]
+    ),
     description="Deep Research Orchestrator",
+    before_agent_callback=start_fact_check_deadline,
+    after_agent_callback=end_fact_check_deadline,
 )
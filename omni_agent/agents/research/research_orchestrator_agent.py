@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import AsyncGenerator
+import time
+from typing import Any, AsyncGenerator
 
-from google.adk.agents import BaseAgent, ParallelAgent, SequentialAgent
+from google.adk.agents import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event, EventActions
 
+from omni_agent.agents.common.agent_work_queue import AgentWorkQueue
+from omni_agent.core.deadline import research_time_left
+from omni_agent.core.evidence_frontier import (
+    close_evidence_frontier,
+    open_evidence_frontier,
+)
 from omni_agent.core.models import GapQuestionsOutput
+from omni_agent.core.question_dedup import near_duplicate_representatives
+from omni_agent.core.settings import settings
 
 from .single_question_research_agent import (
     create_single_question_research_agent,
@@ -18,40 +28,103 @@ from .single_question_research_agent import (
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Why a question has no answer, by its JobTiming status ("not_started" if it was
+# never picked up)
+UNFINISHED_REASONS = {
+    "failed": "Research failed with an error.",
+    "timed_out": "Research was cut off by the fact-check deadline.",
+    "not_started": "Research did not start before the fact-check deadline.",
+    "done": "Research finished without an answer.",
+}
+
+
+def collapse_near_duplicates(invocation_id: str, questions: list[str]) -> list[int]:
+    """Index of the question each gap question is researched as.
+
+    Questions that only differ in wording are researched once, and the answer
+    is given to each of them, so every claim_id keeps its answers.
+    """
+    representatives = near_duplicate_representatives(
+        questions, settings.research_dedup_threshold
+    )
+    for i, representative in enumerate(representatives):
+        if representative != i:
+            logger.info(
+                f"[{invocation_id}] Researching gap question {i} ({questions[i]!r}) "
+                f"as question {representative} ({questions[representative]!r})"
+            )
+    return representatives
+
+
+def submit_research(
+    queue: AgentWorkQueue,
+    questions: list[str],
+    representatives: list[int],
+    ends_at: float | None = None,
+) -> None:
+    """Queue a SingleQuestionResearchAgent per distinct question, by its index."""
+    for i, question in enumerate(questions):
+        if representatives[i] != i:
+            continue
+        queue.submit(
+            i,
+            lambda question=question, i=i: create_single_question_research_agent(
+                question=question, output_key=f"research_answer_{i}"
+            ),
+            ends_at=ends_at,
+        )
 
-class ResearchOrchestratorAgent(BaseAgent):
-    """Run SingleQuestionResearchAgent in parallel for each gap question."""
 
-    def __init__(self) -> None:
-        super().__init__(name="ResearchOrchestratorAgent")
-        logger.debug(f"Initialized {self.name}")
+def research_answer(queue: AgentWorkQueue, i: int, question: str) -> Any:
+    """Answer of research job ``i`` for ``question``, or an unfinished entry."""
+    answer = queue.outputs.get(i)
+    if answer is not None:
+        return answer
+    status = queue.timings[i].status if i in queue.timings else "not_started"
+    logger.warning(
+        f"[{queue.ctx.invocation_id}] {queue.parent.name}: No answer found for key "
+        f"'research_answer_{i}' (question {i}, {status})"
+    )
+    return {
+        "question": question,
+        "status": "unfinished",
+        "reason": UNFINISHED_REASONS[status],
+        "detailed_answer": "",
+        "sources": [],
+    }
+
+
+def research_timings(queue: AgentWorkQueue, questions: list[str]) -> list[dict]:
+    """Queue and run times of the questions researched and picked up, by index."""
+    return [
+        {
+            "index": i,
+            "queued_s": queue.timings[i].queued_s,
+            "run_s": queue.timings[i].run_s,
+            "status": queue.timings[i].status,
+        }
+        for i in range(len(questions))
+        if i in queue.timings
+    ]
 
-    def _create_batch_parallel_agents(
-        self, questions: list[str], batch_size: int
-    ) -> list[ParallelAgent]:
-        """Create ParallelAgent instances for batched question processing."""
-        question_batches = [
-            questions[i : i + batch_size] for i in range(0, len(questions), batch_size)
-        ]
 
-        batch_parallel_agents: list[ParallelAgent] = []
+class ResearchOrchestratorAgent(BaseAgent):
+    """Research gap questions with SingleQuestionResearchAgent on a work queue.
 
-        for batch_idx, batch_questions in enumerate(question_batches):
-            batch_worker_agents = [
-                create_single_question_research_agent(
-                    question=question,
-                    output_key=f"research_answer_{batch_idx * batch_size + q_idx}",
-                )
-                for q_idx, question in enumerate(batch_questions)
-            ]
+    Up to ``settings.research_concurrency`` questions are researched at once, and a
+    worker starts the next question as soon as its current one finishes, so one
+    slow question does not hold back the others. Research stops when the
+    invocation's deadline leaves only ``settings.synthesis_reserve`` seconds, and
+    questions left without an answer are reported as unfinished.
 
-            batch_parallel_agent = ParallelAgent(
-                name=f"SingleBatchBatchResearchAgent_{batch_idx}",
-                sub_agents=batch_worker_agents,
-            )
-            batch_parallel_agents.append(batch_parallel_agent)
+    The module-level instance is shared by every invocation, so it keeps no
+    per-run state: research agents are built for each run, are never attached as
+    sub-agents, and their answers are read from the run's own events.
+    """
 
-        return batch_parallel_agents
+    def __init__(self) -> None:
+        super().__init__(name="ResearchOrchestratorAgent")
+        logger.debug(f"Initialized {self.name}")
 
     async def _run_async_impl(
         self, ctx: InvocationContext
@@ -71,53 +144,63 @@ class ResearchOrchestratorAgent(BaseAgent):
             logger.error(
                 f"[{ctx.invocation_id}] {self.name}: No gap questions found in session state"
             )
-            return
-
-        # Step 2: Create batched parallel workflow
-        batch_size = 5
-        batch_parallel_agents = self._create_batch_parallel_agents(
-            questions, batch_size
-        )
-
-        if not batch_parallel_agents:
-            logger.warning(
-                f"[{ctx.invocation_id}] {self.name}: No batch agents created"
+            # The adjudicator still runs and reports the claims as unverified
+            yield Event(
+                invocation_id=ctx.invocation_id,
+                author=self.name,
+                actions=EventActions(state_delta={"research_answers": []}),
             )
             return
 
-        # Step 3: Create sequential workflow to orchestrate batches
-        sequential_workflow = SequentialAgent(
-            name="BatchSequentialResearchAgent",
-            sub_agents=batch_parallel_agents,
+        # Research the questions and yield the workers' events. Workers of this
+        # invocation share one evidence frontier for search results and pages.
+        representatives = collapse_near_duplicates(ctx.invocation_id, questions)
+        queue = AgentWorkQueue(self, ctx, settings.research_concurrency)
+        submit_research(queue, questions, representatives)
+        queue.close()
+        time_left = research_time_left(ctx.invocation_id)
+        ends_at = (
+            None if time_left is None else asyncio.get_running_loop().time() + time_left
+        )
+        started_at = time.monotonic()
+        open_evidence_frontier(ctx.invocation_id)
+        try:
+            async for _, event in queue.run(ends_at):
+                if event is not None:
+                    yield event
+        finally:
+            close_evidence_frontier(ctx.invocation_id)
+
+        elapsed_s = time.monotonic() - started_at
+        work_s = sum(timing.run_s for timing in queue.timings.values())
+        logger.info(
+            f"[{ctx.invocation_id}] {self.name}: Researched {len(questions)} questions "
+            f"({len(set(representatives))} distinct) in {elapsed_s:.1f}s ({work_s:.1f}s of work, concurrency "
+            f"{settings.research_concurrency})"
         )
 
-        self.sub_agents.append(sequential_workflow)
-
-        # Step 4: Execute the sequential workflow and yield its events
-        async for event in sequential_workflow.run_async(ctx):
-            yield event
-
-        research_answers: list[dict] = []
-        for i, question in enumerate(questions):
-            output_key = f"research_answer_{i}"
-            research_answer = ctx.session.state.get(output_key)
-            if research_answer is None:
-                logger.warning(
-                    f"[{ctx.invocation_id}] {self.name}: No answer found for key '{output_key}' (question {i})"
-                )
-                continue
-            research_answers.append(research_answer)
-
+        research_answers = [
+            research_answer(queue, representatives[i], question)
+            for i, question in enumerate(questions)
+        ]
         logger.info(
-            f"[{ctx.invocation_id}] {self.name}: Retrieved {len(research_answers)} research answers"
+            f"[{ctx.invocation_id}] {self.name}: Retrieved {len(queue.outputs)} research "
+            f"answers ({len(set(representatives)) - len(queue.outputs)} unfinished)"
         )
 
+        timings = research_timings(queue, questions)
         ctx.session.state["research_answers"] = research_answers
+        ctx.session.state["research_timings"] = timings
 
         state_update_event = Event(
             invocation_id=ctx.invocation_id,
             author=self.name,
-            actions=EventActions(state_delta={"research_answers": research_answers}),
+            actions=EventActions(
+                state_delta={
+                    "research_answers": research_answers,
+                    "research_timings": timings,
+                }
+            ),
         )
         yield state_update_event
 
@@ -6,14 +6,19 @@ import logging
 from typing import Any
 
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools import BaseTool, ToolContext
 
+from omni_agent.core.llm_governor import GovernedLiteLlm
+from omni_agent.core.passage_retrieval import research_question_key
 from omni_agent.core.settings import OPENAI_GPT5_NANO_2025_08_07
 from omni_agent.core.tools import groq_search_tool, scrape_websites_tool
 
 logger = logging.getLogger(__name__)
 
+# Shared by every research worker, so its LiteLLM client is created only once
+research_model = GovernedLiteLlm(model=OPENAI_GPT5_NANO_2025_08_07)
+
 MAX_NUMBER_OF_SEARCH_TOOL_CALLS = 2
 MAX_NUMBER_OF_SCRAPE_TOOL_CALLS = 1
 
@@ -31,7 +36,8 @@ def enforce_tool_call_limits(
     agent_name = tool_context.agent_name
     tool_name = tool.name
 
-    key = f"{agent_name}_{tool_name}_calls"
+    # Scoped to the invocation: worker names repeat across fact-checks in a session
+    key = f"{tool_context.invocation_id}_{agent_name}_{tool_name}_calls"
     number_of_calls = tool_context.state.get(key, 0)
 
     max_number_of_calls = tool_max_calls.get(tool_name, 0)
@@ -64,16 +70,28 @@ def enforce_tool_call_limits(
     return None
 
 
+def remember_research_question(question: str):
+    """Build a callback that stores the agent's question for scrape_tool to rank by."""
+
+    def before_agent_callback(callback_context: CallbackContext) -> None:
+        callback_context.state[research_question_key(callback_context.agent_name)] = (
+            question
+        )
+
+    return before_agent_callback
+
+
 def create_single_question_research_agent(question: str, output_key: str) -> LlmAgent:
     """
     Factory function to create a new instance of a UnifiedResearchAgent.
-    This is necessary to comply with ADK's single-parent rule for agents.
+    Workers are built per invocation and are not attached to the agent tree, so
+    they are released when the research run ends.
     """
 
     return LlmAgent(
         # Each agent instance needs a unique name.
         name=f"UnifiedResearchAgent_{output_key}",
-        model=LiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
+        model=research_model,
         description=f"Intelligent research agent for: {question[:100]}...",
         # sinclude_contents="none",
         instruction=f"""You are an intelligent research agent. Your task is to thoroughly research the following question using available tools.
@@ -102,6 +120,7 @@ TOOL USAGE INSTRUCTIONS:
 - If you quote from scraped content, the quoted page's URL MUST match exactly one of the URLs you passed to 'scrape_tool'.
 - Every cited URL must originate from 'search_tool' results or be one of the URLs passed to 'scrape_tool'.
 - **Prioritize quality sources**: academic, news, official websites over blogs or forums
+- Search results that include 'scraped_excerpt' were already scraped by a parallel research worker: quote from that excerpt with the result's URL instead of passing the URL to 'scrape_tool'.
 
 RESEARCH WORKFLOW:
 1. Start by searching for information using the search_tool
@@ -114,6 +133,7 @@ RESEARCH WORKFLOW:
 SOURCE CAPTURE RULES (mandatory):
 - From search_tool: you MAY use the search snippet verbatim as the citation, and you MUST attach the exact result URL that snippet came from.
 - From scrape_tool: you MUST quote verbatim text from the scraped page, and the URL MUST be exactly one of the URLs passed to 'scrape_tool'.
+- From a search result's 'scraped_excerpt': you MUST quote verbatim text from the excerpt, and attach that search result's exact URL.
 
 OUTPUT FORMAT:
 Provide your response as a JSON object with this exact structure:
@@ -148,6 +168,7 @@ Question to research: {question}""",
             groq_search_tool,
             scrape_websites_tool,
         ],
+        before_agent_callback=remember_research_question(question),
         before_tool_callback=enforce_tool_call_limits,
         output_key=output_key,
     )
@@ -0,0 +1,245 @@
+"""Agents that adjudicate each claim on its own and merge the verdicts."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncGenerator
+
+from google.adk.agents import BaseAgent, LlmAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
+from pydantic import ValidationError
+
+from ...core.adjudication import (
+    merge_claim_adjudications,
+    route_research_answers,
+    unadjudicated_claim,
+)
+from ...core.deadline import get_deadline
+from ...core.llm_governor import GovernedLiteLlm
+from ...core.models import (
+    AtomicClaimOutput,
+    ClaimAdjudicationOutput,
+    EvidenceAdjudicatorOutput,
+    GapQuestionsOutput,
+    StructuredClaimsOutput,
+)
+from ...core.settings import OPENAI_GPT5_NANO_2025_08_07, settings
+from ...core.verdict_cache import verdict_cache
+from ..analysis.verdict_cache_agent import cached_claim_verdicts
+from ..common.agent_work_queue import AgentWorkQueue
+
+logger = logging.getLogger(__name__)
+
+# Shared by every claim adjudicator, so its LiteLLM client is created only once
+claim_adjudicator_model = GovernedLiteLlm(model=OPENAI_GPT5_NANO_2025_08_07)
+
+# Explanation of a claim left without a verdict, by its JobTiming status
+# ("not_started" if it was never picked up)
+ADJUDICATION_FAILURES = {
+    "failed": "Adjudication of this claim failed with an error.",
+    "timed_out": "Adjudication of this claim was cut off by the fact-check deadline.",
+    "not_started": "Adjudication of this claim did not start before the fact-check deadline.",
+    "done": "Adjudication of this claim produced no valid verdict.",
+}
+
+
+def create_claim_adjudicator_agent(
+    claim: AtomicClaimOutput, research_answers: list[Any], output_key: str
+) -> LlmAgent:
+    """Create an agent that adjudicates one claim against its research answers."""
+    claim_json = json.dumps(claim.model_dump(), ensure_ascii=False)
+    research_json = json.dumps(research_answers, ensure_ascii=False, default=str)
+    instruction = f"""You are a fact-checking agent adjudicating ONE claim. Use ONLY
+the provided research_answers. Do not use outside knowledge or invent
+facts/URLs. If evidence is missing or inconclusive, say so plainly.
+
+INPUTS:
+- claim: {claim_json}
+- research_answers: {research_json}
+
+APPROACH:
+1) Evaluate credibility, recency, relevance, and consistency of the evidence.
+2) Resolve conflicts explicitly and prefer conservative conclusions when in
+   doubt.
+
+VERDICT CRITERIA:
+- true: Strong, credible, and convergent evidence supports the claim.
+- false: Strong, credible evidence contradicts the claim.
+- could_not_be_verified: Evidence is missing, weak, contradictory, or only
+  partially supports the claim; or data cannot be found.
+
+OUTPUT (must validate against ClaimAdjudicationOutput):
+- claim_id and claim_text: copied from the claim.
+- verdict: true, false, or could_not_be_verified.
+- argumentative_explanation: 1–3 sentences, evidence-backed. Use bracketed
+  citations like [1], [2] that refer to entries in references (index
+  starting at 1).
+- references: de-duplicated ReferenceOutput objects cited in the
+  explanation, in citation order. Each has is_supportive (true if it
+  supports the claim, false if it refutes it), citation (exact quote or key
+  datum) and url (one of the provided source URLs; never invent a URL).
+
+STRICT CONSTRAINTS:
+- research_answers with "status": "unfinished" carry no evidence; their
+  "reason" says why research stopped. If only they address the claim, the
+  verdict is could_not_be_verified and the explanation must say that
+  research for it did not finish.
+- Be concise, precise, and avoid hedging language.
+"""
+
+    return LlmAgent(
+        model=claim_adjudicator_model,
+        name="ClaimAdjudicatorAgent",
+        description="Adjudicates a single claim against its research answers.",
+        include_contents="none",
+        # An instruction provider is not templated, so braces in the evidence
+        # are never read as session state placeholders
+        instruction=lambda _: instruction,
+        output_schema=ClaimAdjudicationOutput,
+        output_key=output_key,
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
+
+
+def submit_claim_adjudication(
+    queue: AgentWorkQueue,
+    i: int,
+    claim: AtomicClaimOutput,
+    research_answers: list[Any],
+    priority: float = 0,
+) -> None:
+    """Queue the adjudication of claim ``i``, keyed by ``("claim", i)``."""
+    queue.submit(
+        ("claim", i),
+        lambda: create_claim_adjudicator_agent(
+            claim, research_answers, f"claim_adjudication_{i}"
+        ),
+        priority=priority,
+    )
+
+
+def claim_adjudication(
+    queue: AgentWorkQueue, i: int, claim: AtomicClaimOutput
+) -> ClaimAdjudicationOutput:
+    """Verdict for claim ``i``, or could_not_be_verified saying why there is none."""
+    key = ("claim", i)
+    status = queue.timings[key].status if key in queue.timings else "not_started"
+    try:
+        return ClaimAdjudicationOutput.model_validate(queue.outputs.get(key))
+    except ValidationError:
+        logger.warning(
+            f"[{queue.ctx.invocation_id}] {queue.parent.name}: No verdict for claim "
+            f"{claim.id} ({status})"
+        )
+        return unadjudicated_claim(claim, ADJUDICATION_FAILURES[status])
+
+
+def claim_verdict_event(
+    ctx: InvocationContext, author: str, i: int, verdict: ClaimAdjudicationOutput
+) -> Event:
+    """Event announcing the verdict of claim ``i`` as soon as it is known.
+
+    Citations are still local to the verdict's own references; the merged
+    ``adjudicated_report`` renumbers them.
+    """
+    return Event(
+        invocation_id=ctx.invocation_id,
+        author=author,
+        content=types.Content(
+            role="model", parts=[types.Part(text=verdict.model_dump_json())]
+        ),
+        actions=EventActions(
+            state_delta={f"claim_adjudication_{i}": verdict.model_dump()}
+        ),
+    )
+
+
+def adjudicated_report_event(
+    ctx: InvocationContext, author: str, report: EvidenceAdjudicatorOutput, **state
+) -> Event:
+    """Final event with the merged report, as evidence_adjudicator_agent ends."""
+    return Event(
+        invocation_id=ctx.invocation_id,
+        author=author,
+        content=types.Content(
+            role="model", parts=[types.Part(text=report.model_dump_json())]
+        ),
+        actions=EventActions(
+            state_delta={**state, "adjudicated_report": report.model_dump()}
+        ),
+    )
+
+
+class PerClaimAdjudicatorAgent(BaseAgent):
+    """Adjudicate every claim concurrently and merge the verdicts.
+
+    Each claim only sees the research answers of its own gap questions, so the
+    prompt size does not grow with the whole fact-check and a failed claim does
+    not fail the report. Claims answered from the verdict cache are reported
+    as they are, and new true or false verdicts are added to the cache. The
+    merged ``adjudicated_report`` has the same ``EvidenceAdjudicatorOutput`` shape
+    as ``evidence_adjudicator_agent``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="PerClaimAdjudicatorAgent")
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        claims = StructuredClaimsOutput(
+            **(state.get("structured_claims") or {"claims": []})
+        ).claims
+        gap_questions = GapQuestionsOutput(
+            **(state.get("gap_questions") or {"gap_questions": []})
+        ).gap_questions
+        adjudications = cached_claim_verdicts(state)
+        for i, claim in enumerate(claims):
+            if claim.id in adjudications:
+                yield claim_verdict_event(ctx, self.name, i, adjudications[claim.id])
+        pending = [claim for claim in claims if claim.id not in adjudications]
+        routed = route_research_answers(
+            pending, gap_questions, state.get("research_answers") or []
+        )
+
+        queue = AgentWorkQueue(self, ctx, settings.adjudication_concurrency)
+        for i, claim in enumerate(claims):
+            if claim.id in routed:
+                submit_claim_adjudication(queue, i, claim, routed[claim.id])
+        queue.close()
+        deadline = get_deadline(ctx.invocation_id)
+        ends_at = (
+            None
+            if deadline is None
+            else asyncio.get_running_loop().time() + deadline.remaining()
+        )
+        async for key, event in queue.run(ends_at):
+            if event is not None:
+                yield event
+                continue
+            _, i = key
+            verdict = claim_adjudication(queue, i, claims[i])
+            adjudications[claims[i].id] = verdict
+            await verdict_cache.put(claims[i], verdict)
+            yield claim_verdict_event(ctx, self.name, i, verdict)
+
+        # Claims cut off by the deadline have not been reported yet
+        for i, claim in enumerate(claims):
+            if claim.id not in adjudications:
+                adjudications[claim.id] = claim_adjudication(queue, i, claim)
+
+        report = merge_claim_adjudications(claims, adjudications)
+        logger.info(
+            f"[{ctx.invocation_id}] {self.name}: Adjudicated {len(claims)} claims "
+            f"with {len(report.references)} references"
+        )
+        yield adjudicated_report_event(ctx, self.name, report)
+
+
+per_claim_adjudicator_agent = PerClaimAdjudicatorAgent()
@@ -2,14 +2,128 @@
 
 from __future__ import annotations
 
+import logging
+
 from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
 
-from ...core.models import EvidenceAdjudicatorOutput
+from ...core.adjudication import (
+    merge_claim_adjudications,
+    split_report,
+    unadjudicated_claim,
+)
+from ...core.deadline import (
+    DEADLINE_ERROR_CODE,
+    bound_by_deadline,
+    deadline_output,
+    deadline_reached,
+)
+from ...core.llm_governor import GovernedLiteLlm
+from ...core.models import (
+    AtomicClaimOutput,
+    EvidenceAdjudicatorOutput,
+    StructuredClaimsOutput,
+)
 from ...core.settings import OPENAI_GPT5_NANO_2025_08_07
+from ...core.verdict_cache import verdict_cache
+from ..analysis.verdict_cache_agent import cached_claim_verdicts, pending_claims
+from .claim_adjudicator_agent import ADJUDICATION_FAILURES
+
+logger = logging.getLogger(__name__)
+
+EMPTY_REPORT = EvidenceAdjudicatorOutput(
+    what_was_true=[], what_was_false=[], what_could_not_be_verified=[], references=[]
+)
+
+
+def report_cached_verdicts(callback_context: CallbackContext) -> types.Content | None:
+    """Build the report without an LLM call when every claim was cached."""
+    state = callback_context.state
+    if "pending_claims" not in state or pending_claims(state):
+        return None
+    return _report_with_cached_verdicts(callback_context, EMPTY_REPORT)
+
+
+def report_unverified_after_deadline(
+    callback_context: CallbackContext,
+) -> types.Content | None:
+    """Report the remaining claims as unverified once the deadline has passed."""
+    if not deadline_reached(callback_context.invocation_id):
+        return None
+    claims = pending_claims(callback_context.state)
+    logger.warning(
+        f"[{callback_context.invocation_id}] EvidenceAdjudicatorAgent: Skipped, the "
+        f"fact-check deadline has passed with {len(claims)} claims to adjudicate"
+    )
+    report = _unverified_report(claims, ADJUDICATION_FAILURES["not_started"])
+    return _report_with_cached_verdicts(callback_context, report)
+
+
+def report_unverified_after_timeout(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> LlmResponse | None:
+    """Report the claims as unverified when the call is cut off by the deadline.
+
+    The report replaces the model's, so ``merge_cached_verdicts`` still adds the
+    cached verdicts to it.
+    """
+    if llm_response.error_code != DEADLINE_ERROR_CODE:
+        return None
+    claims = pending_claims(callback_context.state)
+    logger.warning(
+        f"[{callback_context.invocation_id}] EvidenceAdjudicatorAgent: Cut off by "
+        f"the fact-check deadline with {len(claims)} claims to adjudicate"
+    )
+    return deadline_output(
+        _unverified_report(claims, ADJUDICATION_FAILURES["timed_out"])
+    )
+
+
+async def merge_cached_verdicts(
+    callback_context: CallbackContext,
+) -> types.Content | None:
+    """Cache the new verdicts and add the cached ones to the report."""
+    state = callback_context.state
+    report = EvidenceAdjudicatorOutput.model_validate(
+        state.get("adjudicated_report") or EMPTY_REPORT
+    )
+    adjudications = split_report(report)
+    for claim in pending_claims(state):
+        if claim.id in adjudications:
+            await verdict_cache.put(claim, adjudications[claim.id])
+    if not state.get("cached_verdicts"):
+        return None
+    return _report_with_cached_verdicts(callback_context, report)
+
+
+def _unverified_report(
+    claims: list[AtomicClaimOutput], reason: str
+) -> EvidenceAdjudicatorOutput:
+    return merge_claim_adjudications(
+        claims, {claim.id: unadjudicated_claim(claim, reason) for claim in claims}
+    )
+
+
+def _report_with_cached_verdicts(
+    callback_context: CallbackContext, report: EvidenceAdjudicatorOutput
+) -> types.Content:
+    state = callback_context.state
+    claims = StructuredClaimsOutput(
+        **(state.get("structured_claims") or {"claims": []})
+    ).claims
+    merged = merge_claim_adjudications(
+        claims, {**split_report(report), **cached_claim_verdicts(state)}
+    )
+    state["adjudicated_report"] = merged.model_dump()
+    return types.Content(
+        role="model", parts=[types.Part(text=merged.model_dump_json())]
+    )
+
 
 evidence_adjudicator_agent = LlmAgent(
-    model=LiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
+    model=GovernedLiteLlm(model=OPENAI_GPT5_NANO_2025_08_07),
     name="EvidenceAdjudicatorAgent",
     description=(
         "Primary fact-checking agent. Synthesizes provided research into a "
@@ -21,7 +135,7 @@ structured_claims and research_answers. Do not use outside knowledge or invent
 facts/URLs. If evidence is missing or inconclusive, say so plainly.
 
 INPUTS:
-- structured_claims: {structured_claims}
+- structured_claims: {pending_claims}
 - research_answers: {research_answers}
 
 APPROACH (reason stepwise, keep functions separate):
@@ -55,6 +169,10 @@ STRICT CONSTRAINTS:
 - Only use the provided research_answers and their URLs.
 - If no adequate evidence is found for a claim, place it under
   what_could_not_be_verified.
+- research_answers with "status": "unfinished" carry no evidence; their
+  "reason" says why research stopped (e.g. the fact-check deadline). A claim
+  that only they address goes under what_could_not_be_verified, and its
+  explanation must say that research for it did not finish.
 - Be concise, precise, and avoid hedging language.
 
 QUALITY BAR:
@@ -64,6 +182,10 @@ QUALITY BAR:
 """,
     output_schema=EvidenceAdjudicatorOutput,
     output_key="adjudicated_report",
+    before_agent_callback=[report_cached_verdicts, report_unverified_after_deadline],
+    before_model_callback=bound_by_deadline,
+    after_model_callback=report_unverified_after_timeout,
+    after_agent_callback=merge_cached_verdicts,
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
 )
@@ -0,0 +1,159 @@
+"""Agent that adjudicates each claim as soon as its research is done."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+
+from ...core.adjudication import merge_claim_adjudications
+from ...core.deadline import get_deadline, research_time_left
+from ...core.evidence_frontier import close_evidence_frontier, open_evidence_frontier
+from ...core.models import GapQuestionsOutput, StructuredClaimsOutput
+from ...core.settings import settings
+from ...core.verdict_cache import verdict_cache
+from ..analysis.verdict_cache_agent import cached_claim_verdicts
+from ..common.agent_work_queue import AgentWorkQueue
+from ..research.research_orchestrator_agent import (
+    collapse_near_duplicates,
+    research_answer,
+    research_timings,
+    submit_research,
+)
+from .claim_adjudicator_agent import (
+    adjudicated_report_event,
+    claim_adjudication,
+    claim_verdict_event,
+    submit_claim_adjudication,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PipelinedAdjudicatorAgent(BaseAgent):
+    """Research gap questions and adjudicate each claim once they are answered.
+
+    Research and adjudication share one work queue of
+    ``settings.research_concurrency`` workers. When the last gap question of a
+    claim finishes, the claim's adjudication is queued ahead of the questions
+    still waiting, and its verdict is emitted as soon as it is known, while
+    research for other claims continues. A claim without gap questions waits
+    for all of them, as it is given every answer. Claims answered from the
+    verdict cache are reported right away, and new true or false verdicts are
+    added to the cache.
+
+    Research stops ``settings.synthesis_reserve`` seconds before the deadline,
+    like ResearchOrchestratorAgent, and adjudication at the deadline. The run
+    ends with the same ``research_answers``, ``research_timings`` and merged
+    ``adjudicated_report`` state as the research and synthesis stages.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="PipelinedAdjudicatorAgent")
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        claims = StructuredClaimsOutput(
+            **(state.get("structured_claims") or {"claims": []})
+        ).claims
+        gap_questions = GapQuestionsOutput(
+            **(state.get("gap_questions") or {"gap_questions": []})
+        ).gap_questions
+        questions = [item.question for item in gap_questions]
+        adjudications = cached_claim_verdicts(state)
+        for i, claim in enumerate(claims):
+            if claim.id in adjudications:
+                yield claim_verdict_event(ctx, self.name, i, adjudications[claim.id])
+
+        # Gap questions each claim is adjudicated on, and those still unanswered
+        claim_questions = {
+            i: [q for q, item in enumerate(gap_questions) if item.claim_id == claim.id]
+            or list(range(len(questions)))
+            for i, claim in enumerate(claims)
+            if claim.id not in adjudications
+        }
+        representatives = collapse_near_duplicates(ctx.invocation_id, questions)
+        # Research jobs each claim waits for, keyed by their representative question
+        waiting = {
+            i: {representatives[q] for q in indices}
+            for i, indices in claim_questions.items()
+        }
+
+        loop = asyncio.get_running_loop()
+        time_left = research_time_left(ctx.invocation_id)
+        research_ends_at = None if time_left is None else loop.time() + time_left
+        deadline = get_deadline(ctx.invocation_id)
+        ends_at = None if deadline is None else loop.time() + deadline.remaining()
+
+        queue = AgentWorkQueue(self, ctx, settings.research_concurrency)
+        submit_research(queue, questions, representatives, research_ends_at)
+
+        def submit_ready_claims() -> None:
+            for i in [i for i, pending in waiting.items() if not pending]:
+                del waiting[i]
+                # Near-duplicate questions share one answer, which a claim needs once
+                jobs = {representatives[q]: q for q in reversed(claim_questions[i])}
+                answers = [
+                    research_answer(queue, job, questions[q])
+                    for job, q in sorted(jobs.items(), key=lambda item: item[1])
+                ]
+                # Finishing a claim comes before starting another question
+                submit_claim_adjudication(queue, i, claims[i], answers, priority=-1)
+            if not waiting:
+                queue.close()
+
+        submit_ready_claims()
+        started_at = time.monotonic()
+        first_verdict_s = None
+        open_evidence_frontier(ctx.invocation_id)
+        try:
+            async for key, event in queue.run(ends_at):
+                if event is not None:
+                    yield event
+                elif isinstance(key, tuple):
+                    _, i = key
+                    verdict = claim_adjudication(queue, i, claims[i])
+                    adjudications[claims[i].id] = verdict
+                    await verdict_cache.put(claims[i], verdict)
+                    if first_verdict_s is None:
+                        first_verdict_s = time.monotonic() - started_at
+                    yield claim_verdict_event(ctx, self.name, i, verdict)
+                elif waiting:
+                    for pending in waiting.values():
+                        pending.discard(key)
+                    submit_ready_claims()
+        finally:
+            close_evidence_frontier(ctx.invocation_id)
+
+        # Claims cut off by the deadline have not been reported yet
+        for i, claim in enumerate(claims):
+            if claim.id not in adjudications:
+                adjudications[claim.id] = claim_adjudication(queue, i, claim)
+
+        logger.info(
+            f"[{ctx.invocation_id}] {self.name}: Researched {len(questions)} questions "
+            f"and adjudicated {len(claims)} claims in "
+            f"{time.monotonic() - started_at:.1f}s (first verdict after "
+            f"{'-' if first_verdict_s is None else f'{first_verdict_s:.1f}'}s)"
+        )
+        research_answers = [
+            research_answer(queue, representatives[i], question)
+            for i, question in enumerate(questions)
+        ]
+        yield adjudicated_report_event(
+            ctx,
+            self.name,
+            merge_claim_adjudications(claims, adjudications),
+            research_answers=research_answers,
+            research_timings=research_timings(queue, questions),
+        )
+
+
+pipelined_adjudicator_agent = PipelinedAdjudicatorAgent()
@@ -0,0 +1,165 @@
+"""Route research to claims and merge per-claim verdicts into one report."""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any
+
+from .models import (
+    AtomicClaimOutput,
+    ClaimAdjudicationOutput,
+    EvidenceAdjudicatorOutput,
+    GapQuestionOutput,
+    ReferenceOutput,
+    SectionItemOutput,
+)
+from .url_utils import evidence_url_key
+
+logger = logging.getLogger(__name__)
+
+# ClaimAdjudicationOutput.verdict -> EvidenceAdjudicatorOutput section
+VERDICT_SECTIONS = {
+    "true": "what_was_true",
+    "false": "what_was_false",
+    "could_not_be_verified": "what_could_not_be_verified",
+}
+UNVERIFIED_SECTION = "what_could_not_be_verified"
+CITATION = re.compile(r"\[(\d+(?:\s*,\s*\d+)*)\]")
+
+
+def route_research_answers(
+    claims: list[AtomicClaimOutput],
+    gap_questions: list[GapQuestionOutput],
+    research_answers: list[Any],
+) -> dict[str, list[Any]]:
+    """Research answers relevant to each claim, by claim id.
+
+    ``research_answers[i]`` answers ``gap_questions[i]`` and goes to that
+    question's ``claim_id``. A claim that no question was asked for gets every
+    answer, as the single adjudication prompt would see them.
+    """
+    if len(gap_questions) != len(research_answers):
+        logger.warning(
+            f"{len(research_answers)} research answers for {len(gap_questions)} "
+            "gap questions; routing every answer to every claim"
+        )
+        return {claim.id: list(research_answers) for claim in claims}
+
+    routed: dict[str, list[Any]] = {claim.id: [] for claim in claims}
+    for question, answer in zip(gap_questions, research_answers):
+        # Near-duplicate questions share one answer, which a claim needs once
+        if question.claim_id in routed and answer not in routed[question.claim_id]:
+            routed[question.claim_id].append(answer)
+    for claim_id, answers in routed.items():
+        if not answers:
+            routed[claim_id] = list(research_answers)
+    return routed
+
+
+def unadjudicated_claim(
+    claim: AtomicClaimOutput, reason: str
+) -> ClaimAdjudicationOutput:
+    """Verdict for a claim whose adjudication did not produce a result."""
+    return ClaimAdjudicationOutput(
+        claim_id=claim.id,
+        claim_text=claim.text,
+        verdict="could_not_be_verified",
+        argumentative_explanation=reason,
+        references=[],
+    )
+
+
+def _renumber_citations(text: str, numbers: dict[int, int]) -> str:
+    """Rewrite local ``[n]`` citations to global reference numbers."""
+
+    def renumber(match: re.Match[str]) -> str:
+        cited = [int(number) for number in match.group(1).split(",")]
+        renumbered = sorted({numbers[number] for number in cited if number in numbers})
+        if not renumbered:
+            return ""
+        return "[" + ", ".join(str(number) for number in renumbered) + "]"
+
+    return CITATION.sub(renumber, text)
+
+
+def split_report(
+    report: EvidenceAdjudicatorOutput,
+) -> dict[str, ClaimAdjudicationOutput]:
+    """Per-claim verdicts of a merged report, by claim id.
+
+    Each claim keeps the references its explanation cites, renumbered from 1 in
+    citation order, so ``merge_claim_adjudications`` can merge it again.
+    """
+    adjudications: dict[str, ClaimAdjudicationOutput] = {}
+    for verdict, section in VERDICT_SECTIONS.items():
+        for item in getattr(report, section):
+            cited: list[int] = []
+            for match in CITATION.finditer(item.argumentative_explanation):
+                for text in match.group(1).split(","):
+                    number = int(text)
+                    if 1 <= number <= len(report.references) and number not in cited:
+                        cited.append(number)
+            adjudications[item.claim_id] = ClaimAdjudicationOutput(
+                claim_id=item.claim_id,
+                claim_text=item.claim_text,
+                verdict=verdict,
+                argumentative_explanation=_renumber_citations(
+                    item.argumentative_explanation,
+                    {number: local for local, number in enumerate(cited, start=1)},
+                ),
+                references=[
+                    report.references[number - 1].model_copy() for number in cited
+                ],
+            )
+    return adjudications
+
+
+def merge_claim_adjudications(
+    claims: list[AtomicClaimOutput],
+    adjudications: dict[str, ClaimAdjudicationOutput],
+) -> EvidenceAdjudicatorOutput:
+    """Merge per-claim verdicts into one report, independent of completion order.
+
+    Claims keep their ``structured_claims`` order within each section.
+    References are numbered globally in claim order, as they first appear. Only
+    references with the same page (by ``evidence_url_key``), quote and polarity
+    are merged, so every claim keeps the quote it cited and whether that quote
+    supports or refutes it. Each explanation's local ``[n]`` citations are
+    rewritten to the global numbers.
+    """
+    sections: dict[str, list[SectionItemOutput]] = {
+        section: [] for section in VERDICT_SECTIONS.values()
+    }
+    references: list[ReferenceOutput] = []
+    reference_numbers: dict[tuple[str, str, bool], int] = {}
+
+    for claim in claims:
+        adjudication = adjudications.get(claim.id) or unadjudicated_claim(
+            claim, "No verdict was produced for this claim."
+        )
+        local_to_global: dict[int, int] = {}
+        for position, reference in enumerate(adjudication.references, start=1):
+            key = (
+                evidence_url_key(reference.url),
+                " ".join(reference.citation.split()),
+                reference.is_supportive,
+            )
+            number = reference_numbers.get(key)
+            if number is None:
+                references.append(reference.model_copy())
+                number = reference_numbers[key] = len(references)
+            local_to_global[position] = number
+
+        section = VERDICT_SECTIONS.get(adjudication.verdict.strip().lower())
+        sections[section or UNVERIFIED_SECTION].append(
+            SectionItemOutput(
+                claim_id=claim.id,
+                claim_text=claim.text,
+                argumentative_explanation=_renumber_citations(
+                    adjudication.argumentative_explanation, local_to_global
+                ),
+            )
+        )
+
+    return EvidenceAdjudicatorOutput(**sections, references=references)
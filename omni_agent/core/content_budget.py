@@ -0,0 +1,137 @@
+"""Byte budgets for scraped content and spill-to-disk buffering of large batches."""
+
+from __future__ import annotations
+
+import tempfile
+from typing import Any
+
+from .settings import settings
+
+TRUNCATION_MARKER = "\n\n[Content truncated]"
+
+# Cut points tried from the most to the least structural
+_MARKDOWN_BOUNDARIES = ("\n#", "\n\n", "\n", ". ", " ")
+
+
+def truncate_at_boundary(text: str, max_chars: int) -> tuple[str, bool]:
+    """Shorten Markdown to at most ``max_chars`` at a heading or paragraph break.
+
+    Falls back to a hard cut only if no boundary lies in the second half of the
+    allowed text. Returns the text and whether it was truncated.
+    """
+    if len(text) <= max_chars:
+        return text, False
+    limit = max(0, max_chars - len(TRUNCATION_MARKER))
+    head = text[: _boundary_cut(text, limit)]
+    return head.rstrip() + TRUNCATION_MARKER, True
+
+
+def split_at_boundaries(text: str, max_chars: int) -> list[str]:
+    """Split Markdown into chunks of at most ``max_chars``, preferring section breaks."""
+    chunks: list[str] = []
+    while len(text) > max_chars:
+        cut = _boundary_cut(text, max_chars)
+        chunks.append(text[:cut].strip())
+        text = text[cut:]
+    chunks.append(text.strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def _boundary_cut(text: str, limit: int) -> int:
+    """Index at which to cut ``text`` so the head is at most ``limit`` characters."""
+    head = text[:limit]
+    for boundary in _MARKDOWN_BOUNDARIES:
+        cut = head.rfind(boundary)
+        if cut >= limit // 2:
+            return cut + 1 if boundary == ". " else cut
+    return limit
+
+
+def truncate_html(html: str, max_bytes: int) -> tuple[str, bool]:
+    """Cut HTML to at most ``max_bytes`` UTF-8 bytes, ending after a complete tag."""
+    encoded = html.encode()
+    if len(encoded) <= max_bytes:
+        return html, False
+    head = encoded[:max_bytes].decode(errors="ignore")
+    cut = head.rfind(">")
+    return (head[: cut + 1] if cut > 0 else head), True
+
+
+def prefix_within_bytes(text: str, max_bytes: int) -> str:
+    """Longest prefix of ``text`` that encodes to at most ``max_bytes`` bytes."""
+    return text.encode()[:max_bytes].decode(errors="ignore")
+
+
+class RequestBudget:
+    """Content bytes one scrape request may still return.
+
+    Results are charged in the order they are produced; once the budget is spent,
+    later pages are truncated at a structural boundary or dropped entirely.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self.max_bytes = max_bytes or settings.scrape_max_request_bytes
+        self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.max_bytes - self.used)
+
+    def take(self, text: str) -> tuple[str, bool]:
+        """Charge ``text`` to the budget, truncating it to what is left."""
+        size = len(text.encode())
+        if size <= self.remaining:
+            self.used += size
+            return text, False
+        # Every character cut is at least one byte, so the ASCII marker still fits
+        allowed = prefix_within_bytes(text, self.remaining)
+        text = (
+            truncate_at_boundary(text, len(allowed))[0]
+            if len(allowed) > len(TRUNCATION_MARKER)
+            else ""
+        )
+        # Later pages would only fit as fragments, so close the budget here
+        self.used = self.max_bytes
+        return text, True
+
+
+class SpooledSections:
+    """Buffer text sections in a temp file that spills to disk when it grows large.
+
+    Sections can be added in any order and are read back in index order, so pages
+    can be written as they finish and released from memory right away.
+    """
+
+    def __init__(self, max_memory_bytes: int | None = None) -> None:
+        self._file: Any = tempfile.SpooledTemporaryFile(
+            max_size=max_memory_bytes or settings.scrape_spool_memory_bytes,
+            mode="w+b",
+        )
+        self._sections: dict[int, tuple[int, int]] = {}
+
+    def __enter__(self) -> SpooledSections:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def add(self, index: int, text: str) -> None:
+        # Stored as UTF-8 bytes, so offsets are exact and "\r\n" is kept as written
+        data = text.encode("utf-8")
+        self._file.seek(0, 2)
+        self._sections[index] = (self._file.tell(), len(data))
+        self._file.write(data)
+
+    def read_ordered(self, separator: str = "") -> str:
+        parts = []
+        for index in sorted(self._sections):
+            position, length = self._sections[index]
+            self._file.seek(position)
+            parts.append(self._file.read(length).decode("utf-8"))
+        return separator.join(parts)
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,134 @@
+"""Wall-clock deadline shared by every stage of one fact-check invocation."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from pydantic import BaseModel
+
+from .settings import settings
+
+if TYPE_CHECKING:
+    from google.adk.agents.callback_context import CallbackContext
+    from google.adk.models.llm_request import LlmRequest
+
+logger = logging.getLogger(__name__)
+
+# Tool result message when a call is cut off by the deadline
+DEADLINE_MESSAGE = (
+    "Fact-check deadline reached; answer with the evidence gathered so far"
+)
+# LlmResponse.error_code of a model call cut off by the deadline
+DEADLINE_ERROR_CODE = "DEADLINE_EXCEEDED"
+
+
+@dataclass
+class Deadline:
+    """Point in ``time.monotonic()`` time by which a fact-check must finish."""
+
+    started_at: float
+    expires_at: float
+
+    def remaining(self, reserve: float = 0.0) -> float:
+        """Seconds left before the deadline, minus ``reserve`` held back for later."""
+        return max(0.0, self.expires_at - reserve - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+_deadlines: dict[str, Deadline] = {}
+
+
+def start_deadline(invocation_id: str, budget: float | None = None) -> Deadline | None:
+    """Start the deadline of an invocation; a budget of 0 disables it."""
+    budget = settings.fact_check_deadline if budget is None else budget
+    now = time.monotonic()
+    # Invocations that raised never reached end_deadline
+    for stale_id, stale in list(_deadlines.items()):
+        if stale.expires_at + budget < now:
+            del _deadlines[stale_id]
+    if budget <= 0:
+        return None
+    deadline = Deadline(started_at=now, expires_at=now + budget)
+    _deadlines[invocation_id] = deadline
+    return deadline
+
+
+def get_deadline(invocation_id: str) -> Deadline | None:
+    return _deadlines.get(invocation_id)
+
+
+def end_deadline(invocation_id: str) -> None:
+    deadline = _deadlines.pop(invocation_id, None)
+    if deadline is not None:
+        logger.info(
+            f"[{invocation_id}] Fact-check finished in {deadline.elapsed():.1f}s "
+            f"({deadline.remaining():.1f}s before the deadline)"
+        )
+
+
+def deadline_reached(invocation_id: str, reserve: float = 0.0) -> bool:
+    """True once the invocation has less than ``reserve`` seconds left.
+
+    Always False for an invocation without a deadline.
+    """
+    deadline = _deadlines.get(invocation_id)
+    return deadline is not None and deadline.remaining(reserve) <= 0
+
+
+def research_time_left(invocation_id: str) -> float | None:
+    """Seconds research may still run before the time kept for synthesis.
+
+    Returns None when the invocation has no deadline.
+    """
+    deadline = _deadlines.get(invocation_id)
+    if deadline is None:
+        return None
+    return deadline.remaining(settings.synthesis_reserve)
+
+
+def bound_by_deadline(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> None:
+    """Before-model callback cutting the call off at the fact-check deadline."""
+    _bound_model_call(callback_context.invocation_id, llm_request, 0.0)
+
+
+def bound_by_research_time(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> None:
+    """Before-model callback cutting the call off when research time runs out."""
+    _bound_model_call(
+        callback_context.invocation_id, llm_request, settings.synthesis_reserve
+    )
+
+
+def _bound_model_call(
+    invocation_id: str, llm_request: LlmRequest, reserve: float
+) -> None:
+    """Set the time left as the request's ``http_options.timeout``.
+
+    ``GovernedLiteLlm`` enforces it by answering with ``DEADLINE_ERROR_CODE``.
+    """
+    deadline = _deadlines.get(invocation_id)
+    if deadline is None:
+        return
+    config = llm_request.config = llm_request.config or types.GenerateContentConfig()
+    config.http_options = (config.http_options or types.HttpOptions()).model_copy(
+        update={"timeout": int(deadline.remaining(reserve) * 1000)}
+    )
+
+
+def deadline_output(output: BaseModel) -> LlmResponse:
+    """Model response carrying ``output``, for a call cut off by the deadline."""
+    return LlmResponse(
+        content=types.Content(
+            role="model", parts=[types.Part(text=output.model_dump_json())]
+        )
+    )
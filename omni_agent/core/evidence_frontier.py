@@ -0,0 +1,158 @@
+"""Evidence shared between the parallel research workers of one invocation."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .passage_retrieval import format_passages, select_passages
+from .settings import settings
+from .url_utils import evidence_url_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FrontierStats:
+    pages_fetched: int = 0
+    pages_reused: int = 0
+    search_results: int = 0
+    search_duplicates: int = 0
+    excerpts_attached: int = 0
+
+
+class EvidenceFrontier:
+    """URLs searched and pages scraped so far by the workers of one invocation.
+
+    Pages are keyed by ``evidence_url_key``, so AMP, mobile and tracking-parameter
+    variants of a page are fetched once. A worker asking for a page that a sibling
+    has fetched, or is still fetching, gets that sibling's Markdown instead.
+    """
+
+    def __init__(self) -> None:
+        self.stats = FrontierStats()
+        self._pages: dict[str, asyncio.Future[str | None]] = {}
+        # Pages whose Markdown cleaning task will resolve them, by page key
+        self._cleaning: set[str] = set()
+        # First spelling of each URL seen in search results, by page key
+        self._search_urls: dict[str, str] = {}
+
+    def claim(self, urls: list[str]) -> tuple[list[str], dict[str, asyncio.Future]]:
+        """Split ``urls`` into pages this caller must fetch and pages already claimed.
+
+        Several spellings of one page in ``urls`` (tracking parameters, AMP or
+        mobile variants) are fetched once, as the first of them, so a caller never
+        waits on a page it claimed itself.
+
+        Returns:
+            The URLs to fetch, and a future per shared URL that resolves to the
+            sibling's Markdown (or None if its fetch failed)
+        """
+        to_fetch: list[str] = []
+        shared: dict[str, asyncio.Future[str | None]] = {}
+        seen: set[str] = set()
+        for url in urls:
+            key = evidence_url_key(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            future = self._pages.get(key)
+            if future is not None:
+                shared[url] = future
+                self.stats.pages_reused += 1
+                continue
+            self._pages[key] = asyncio.get_running_loop().create_future()
+            to_fetch.append(url)
+        return to_fetch, shared
+
+    def resolve(self, url: str, markdown: str | None) -> None:
+        """Publish the result of a claimed fetch to waiting siblings."""
+        future = self._pages.get(evidence_url_key(url))
+        if future is not None and not future.done():
+            future.set_result(markdown or None)
+            if markdown:
+                self.stats.pages_fetched += 1
+
+    def resolve_from_task(self, url: str, task: asyncio.Task[str]) -> None:
+        """Publish a page once its Markdown cleaning task finishes."""
+        key = evidence_url_key(url)
+        self._cleaning.add(key)
+
+        def done(finished: asyncio.Task[str]) -> None:
+            self._cleaning.discard(key)
+            failed = finished.cancelled() or finished.exception() is not None
+            self.resolve(url, None if failed else finished.result())
+
+        task.add_done_callback(done)
+
+    def release(self, urls: list[str]) -> None:
+        """Mark claimed pages that were not resolved or handed to a cleaner as failed."""
+        for url in urls:
+            if evidence_url_key(url) not in self._cleaning:
+                self.resolve(url, None)
+
+    def fetched_page(self, url: str) -> str | None:
+        future = self._pages.get(evidence_url_key(url))
+        if future is None or not future.done():
+            return None
+        return future.result()
+
+    def merge_search_results(
+        self, results: list[dict[str, Any]], question: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Deduplicate search results and attach excerpts of already-scraped pages.
+
+        Results pointing at the same page collapse into the first one, and each URL
+        is reported with the spelling siblings first saw. A result whose page has
+        already been scraped carries a ``scraped_excerpt`` with its passages most
+        relevant to ``question``.
+        """
+        merged: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        excerpts = 0
+        for result in results:
+            url = result.get("url")
+            if not url:
+                continue
+            key = evidence_url_key(url)
+            self.stats.search_results += 1
+            if key in seen:
+                self.stats.search_duplicates += 1
+                continue
+            seen.add(key)
+            result = {**result, "url": self._search_urls.setdefault(key, url)}
+
+            page = self.fetched_page(url)
+            if page and excerpts < settings.frontier_max_excerpts:
+                passages = select_passages(
+                    question or result.get("title") or "",
+                    [(result["url"], page)],
+                    token_budget=settings.frontier_excerpt_tokens,
+                )
+                if passages:
+                    result["scraped_excerpt"] = format_passages(passages)
+                    excerpts += 1
+            merged.append(result)
+        self.stats.excerpts_attached += excerpts
+        return merged
+
+
+_frontiers: dict[str, EvidenceFrontier] = {}
+
+
+def open_evidence_frontier(invocation_id: str) -> EvidenceFrontier:
+    frontier = EvidenceFrontier()
+    _frontiers[invocation_id] = frontier
+    return frontier
+
+
+def get_evidence_frontier(invocation_id: str) -> EvidenceFrontier | None:
+    return _frontiers.get(invocation_id)
+
+
+def close_evidence_frontier(invocation_id: str) -> None:
+    frontier = _frontiers.pop(invocation_id, None)
+    if frontier is not None:
+        logger.info(f"[{invocation_id}] Evidence frontier: {asdict(frontier.stats)}")
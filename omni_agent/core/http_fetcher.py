@@ -0,0 +1,268 @@
+"""Plain-HTTP fetch tier that runs before falling back to browser rendering."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import io
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from .content_budget import truncate_html
+from .markdown_extractor import extract_markdown
+from .rate_limiter import scrape_rate_limiter
+from .scrape_cache import validator_metadata
+from .settings import settings
+from .url_utils import url_domain
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+PDF_AVAILABLE = importlib.util.find_spec("pypdf") is not None
+
+RATE_LIMIT_BACKEND = "http"
+TIER_HTTP = "http"
+TIER_BROWSER = "browser"
+
+BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/126.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/pdf;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+BOT_CHALLENGE_MARKERS = re.compile(
+    r"cf-browser-verification|cf_chl_|challenge-platform|just a moment\.\.\.|"
+    r"attention required|captcha|are you a robot|access denied|ddos-guard|"
+    r"perimeterx|px-captcha|datadome",
+    re.IGNORECASE,
+)
+JAVASCRIPT_REQUIRED_MARKERS = re.compile(
+    r"enable javascript|javascript is (?:disabled|required)|"
+    r"you need to enable javascript|requires javascript",
+    re.IGNORECASE,
+)
+SPA_SHELL_MARKERS = re.compile(
+    r"<div[^>]+id=[\"'](?:root|app|__next|__nuxt|svelte)[\"'][^>]*>\s*</div>|"
+    r"<app-root[^>]*>\s*</app-root>",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class HttpFetchResult:
+    """Outcome of the HTTP tier; ``escalate`` means the page needs a browser."""
+
+    url: str
+    status: str
+    content: str = ""
+    content_type: str = ""
+    confidence: float = 0.0
+    reason: str = ""
+    # True when the body was cut at settings.scrape_max_page_bytes
+    truncated: bool = False
+    # True when the site itself needs a browser (bot challenge or app shell), as
+    # opposed to this one page failing over HTTP
+    needs_browser: bool = False
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class TierMemory:
+    """Remember, per domain, whether plain HTTP was enough or a browser was needed."""
+
+    def __init__(
+        self, max_domains: int | None = None, ttl: float | None = None
+    ) -> None:
+        self.max_domains = max_domains or settings.fetch_tier_memory_size
+        self.ttl = ttl or settings.fetch_tier_memory_ttl
+        self._tiers: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def preferred_tier(self, url: str) -> str | None:
+        domain = url_domain(url)
+        entry = self._tiers.get(domain)
+        if entry is None:
+            return None
+        tier, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._tiers[domain]
+            return None
+        self._tiers.move_to_end(domain)
+        return tier
+
+    def remember(self, url: str, tier: str) -> None:
+        domain = url_domain(url)
+        self._tiers[domain] = (tier, time.monotonic() + self.ttl)
+        self._tiers.move_to_end(domain)
+        while len(self._tiers) > self.max_domains:
+            self._tiers.popitem(last=False)
+
+
+class HttpFetcher:
+    """Fetch pages with a pooled HTTP client and decide when a browser is needed.
+
+    HTML is run through ``extract_markdown``; PDFs and plain text are converted
+    directly. A page is escalated when it looks like a bot challenge, a JavaScript
+    app shell, or when extraction finds too little content.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=settings.http_fetch_http2 and HTTP2_AVAILABLE,
+                follow_redirects=True,
+                headers=BROWSER_HEADERS,
+                timeout=settings.http_fetch_timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.http_fetch_max_connections,
+                    max_keepalive_connections=settings.http_fetch_max_connections,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str) -> HttpFetchResult:
+        """Fetch ``url``, reading at most ``settings.scrape_max_page_bytes`` of it."""
+        try:
+            async with self._get_client().stream("GET", url) as response:
+                scrape_rate_limiter.record_response(
+                    url,
+                    RATE_LIMIT_BACKEND,
+                    response.status_code,
+                    response.headers.get("retry-after"),
+                )
+                metadata: dict[str, Any] = {
+                    "status_code": response.status_code,
+                    **validator_metadata(response.headers),
+                }
+                content_type = (
+                    response.headers.get("content-type", "").split(";")[0].lower()
+                )
+                result = HttpFetchResult(
+                    url=url,
+                    status="escalate",
+                    content_type=content_type,
+                    metadata=metadata,
+                )
+                if response.headers.get("cf-mitigated") == "challenge":
+                    result.reason = "bot challenge"
+                    result.needs_browser = True
+                    return result
+                if response.status_code >= 400:
+                    result.reason = f"HTTP {response.status_code}"
+                    return result
+                body, result.truncated = await _read_limited(
+                    response, settings.scrape_max_page_bytes
+                )
+                encoding = response.encoding or "utf-8"
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as exc:
+            # ValueError covers UnicodeError from hostnames IDNA encoding rejects
+            return HttpFetchResult(
+                url=url, status="escalate", reason=str(exc) or type(exc).__name__
+            )
+
+        if content_type == "application/pdf" or body[:5] == b"%PDF-":
+            return await self._handle_pdf(result, body)
+        text = body.decode(encoding, errors="replace")
+        if content_type.startswith("text/plain") or content_type in {
+            "text/markdown",
+            "application/json",
+        }:
+            result.status = "success"
+            result.content = text
+            result.confidence = 1.0
+            return result
+        if result.truncated:
+            text, _ = truncate_html(text, settings.scrape_max_page_bytes)
+        return await self._handle_html(result, text)
+
+    async def _handle_html(self, result: HttpFetchResult, html: str) -> HttpFetchResult:
+        if BOT_CHALLENGE_MARKERS.search(html[:20000]):
+            result.reason = "bot challenge"
+            result.needs_browser = True
+            return result
+
+        try:
+            extraction = await asyncio.to_thread(extract_markdown, html, result.url)
+        except Exception as exc:  # noqa: BLE001 - the browser tier may still cope
+            result.reason = f"extraction failed: {exc!r}"
+            return result
+        if extraction.text_length < settings.http_fetch_min_text_length and (
+            SPA_SHELL_MARKERS.search(html) or JAVASCRIPT_REQUIRED_MARKERS.search(html)
+        ):
+            result.reason = "javascript app shell"
+            result.needs_browser = True
+            return result
+        if extraction.confidence < settings.markdown_min_confidence:
+            result.reason = f"low extraction confidence ({extraction.confidence})"
+            return result
+
+        result.status = "success"
+        result.content = extraction.markdown
+        result.confidence = extraction.confidence
+        return result
+
+    async def _handle_pdf(
+        self, result: HttpFetchResult, data: bytes
+    ) -> HttpFetchResult:
+        result.content_type = "application/pdf"
+        if result.truncated:
+            result.status = "error"
+            result.reason = "PDF is larger than the page byte budget"
+            return result
+        if not PDF_AVAILABLE:
+            result.status = "error"
+            result.reason = "PDF extraction requires the optional 'pypdf' package"
+            return result
+        try:
+            text = await asyncio.to_thread(_pdf_to_text, data)
+        except Exception as exc:  # noqa: BLE001 - malformed PDFs are common
+            result.status = "error"
+            result.reason = f"Could not read PDF: {exc}"
+            return result
+        result.status = "success" if text.strip() else "error"
+        result.content = text
+        result.confidence = 1.0 if text.strip() else 0.0
+        result.reason = "" if text.strip() else "PDF has no extractable text"
+        return result
+
+
+async def _read_limited(response: httpx.Response, max_bytes: int) -> tuple[bytes, bool]:
+    """Read a streamed body, stopping once it grows past ``max_bytes``."""
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            return b"".join(chunks)[:max_bytes], True
+    return b"".join(chunks), False
+
+
+def _pdf_to_text(data: bytes) -> str:
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    pages = [page.extract_text() or "" for page in reader.pages]
+    return "\n\n".join(
+        f"## Page {number}\n\n{text.strip()}"
+        for number, text in enumerate(pages, start=1)
+        if text.strip()
+    )
+
+
+http_fetcher = HttpFetcher()
+tier_memory = TierMemory()
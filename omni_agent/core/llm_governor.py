@@ -0,0 +1,346 @@
+"""Rate-limit-aware governor shared by every call to an LLM or search provider."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import time
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    TypeVar,
+)
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from pydantic import BaseModel, PrivateAttr
+
+from .deadline import DEADLINE_ERROR_CODE
+from .rate_limiter import TokenBucket, parse_retry_after
+from .settings import settings
+
+if TYPE_CHECKING:
+    from google.adk.models.lite_llm import LiteLlm
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters-per-token ratio used to estimate prompt size before a call
+CHARS_PER_TOKEN = 4
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = ("APIConnectionError", "APITimeoutError", "Timeout")
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@dataclass
+class GovernorStats:
+    calls: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+    waited_s: float = 0.0
+
+
+class ProviderGovernor:
+    """Concurrency cap plus request and token pacing for one provider.
+
+    Calls wait for a slot and for room in the provider's requests-per-minute and
+    tokens-per-minute buckets. ``x-ratelimit-*`` and ``Retry-After`` headers from
+    responses and errors pause the buckets until the provider's window resets, and
+    429, 5xx and connection errors are retried with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests = TokenBucket(
+            requests_per_minute / 60, max(1, int(requests_per_minute / 60))
+        )
+        self.tokens = TokenBucket(tokens_per_minute / 60, int(tokens_per_minute))
+        self.stats = GovernorStats()
+        self._slots: asyncio.Semaphore | None = None
+
+    async def call(
+        self, fn: Callable[[], Awaitable[T]], estimated_tokens: int = 0
+    ) -> T:
+        """Run ``fn`` under the governor, retrying rate limits and transient errors."""
+        attempt = 0
+        while True:
+            attempt += 1
+            cost = await self._acquire(estimated_tokens)
+            try:
+                async with self._get_slots():
+                    result = await fn()
+            except asyncio.CancelledError:
+                self.tokens.refund(cost)
+                raise
+            except Exception as exc:
+                await self._back_off(exc, attempt, cost)
+                continue
+            self.stats.calls += 1
+            headers = getattr(result, "headers", None)
+            if headers is not None:
+                self.update_from_headers(headers)
+            return result
+
+    async def stream(
+        self, fn: Callable[[], AsyncIterator[T]], estimated_tokens: int = 0
+    ) -> AsyncGenerator[T, None]:
+        """Iterate a streamed response under the governor.
+
+        The concurrency slot is held until the stream is exhausted or closed. A
+        failure before the first item is retried like ``call``; after it, the
+        error is raised, so a stream is never replayed halfway. A call cancelled
+        while it waits gives back its slot and token reservation.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            cost = await self._acquire(estimated_tokens)
+            slots = self._get_slots()
+            try:
+                await slots.acquire()
+            except asyncio.CancelledError:
+                self._refund(cost)
+                raise
+            items = fn()
+            try:
+                first = await anext(items)
+            except StopAsyncIteration:
+                slots.release()
+                self.stats.calls += 1
+                return
+            except Exception as exc:
+                slots.release()
+                await self._back_off(exc, attempt, cost)
+                continue
+            except BaseException:
+                # Cancelled before the first item: free the slot for other calls
+                slots.release()
+                self.tokens.refund(cost)
+                raise
+            self.stats.calls += 1
+            try:
+                yield first
+                async for item in items:
+                    yield item
+            finally:
+                slots.release()
+                aclose = getattr(items, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct a call's token reservation once the real usage is known."""
+        if actual_tokens:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Pause the buckets when ``x-ratelimit-remaining-*`` reaches zero."""
+        now = time.monotonic()
+        for kind, bucket in (("requests", self.requests), ("tokens", self.tokens)):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if remaining is None:
+                continue
+            try:
+                remaining_value = float(remaining)
+            except ValueError:
+                continue
+            bucket.tokens = min(bucket.tokens, remaining_value)
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            if remaining_value <= 0 and reset:
+                bucket.blocked_until = max(bucket.blocked_until, now + reset)
+
+    def pool_stats(self) -> dict[str, Any]:
+        return {"provider": self.name, **asdict(self.stats)}
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self._slots
+
+    async def _acquire(self, estimated_tokens: int) -> int:
+        now = time.monotonic()
+        cost = min(max(estimated_tokens, 0), int(self.tokens.capacity))
+        wait = max(self.requests.reserve(now), self.tokens.reserve(now, cost))
+        if wait > 0:
+            self.stats.waited_s = round(self.stats.waited_s + wait, 3)
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._refund(cost)
+                raise
+        return cost
+
+    def _refund(self, cost: int) -> None:
+        """Give back the reservation of an attempt that never reached the API."""
+        self.requests.refund()
+        self.tokens.refund(cost)
+
+    async def _back_off(self, exc: Exception, attempt: int, cost: int) -> None:
+        """Wait before retrying a failed attempt, or re-raise if it is final."""
+        self.tokens.refund(cost)
+        delay = self._retry_delay(exc, attempt)
+        if delay is None:
+            self.stats.failures += 1
+            raise exc
+        self.stats.retries += 1
+        logger.warning(
+            f"{self.name} call failed ({type(exc).__name__}); retrying in "
+            f"{delay:.1f}s (attempt {attempt}/{settings.max_retries})"
+        )
+        await asyncio.sleep(delay)
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> float | None:
+        status_code = getattr(exc, "status_code", None)
+        retryable = status_code in RETRYABLE_STATUS_CODES or any(
+            name in type(exc).__name__ for name in RETRYABLE_ERROR_NAMES
+        )
+        if not retryable or attempt > settings.max_retries:
+            return None
+
+        delay = random.uniform(0, settings.llm_retry_base * 2 ** (attempt - 1))
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if status_code == 429:
+            self.stats.rate_limited += 1
+            if headers is not None:
+                self.update_from_headers(headers)
+                retry_after = parse_retry_after(headers.get("retry-after"))
+                if retry_after is not None:
+                    delay = retry_after
+            self.requests.blocked_until = max(
+                self.requests.blocked_until, time.monotonic() + delay
+            )
+        return min(delay, settings.llm_retry_max)
+
+
+def parse_duration(value: str | None) -> float | None:
+    """Parse rate-limit reset durations such as ``"1s"``, ``"6m0s"`` or ``"250ms"``."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * DURATION_SECONDS[unit] for amount, unit in parts)
+
+
+def estimate_tokens(*texts: str) -> int:
+    return sum(len(text) for text in texts) // CHARS_PER_TOKEN
+
+
+def request_texts(llm_request: LlmRequest) -> list[str]:
+    """Everything an LLM request sends as prompt: contents, instructions and tools."""
+    texts = [str(llm_request.contents)]
+    config = llm_request.config
+    if config is None:
+        return texts
+    if config.system_instruction:
+        texts.append(str(config.system_instruction))
+    for tool in config.tools or []:
+        texts.append(
+            tool.model_dump_json(exclude_none=True)
+            if isinstance(tool, BaseModel)
+            else str(tool)
+        )
+    return texts
+
+
+class GovernedLiteLlm(BaseLlm):
+    """``LiteLlm`` whose calls go through ``openai_governor``.
+
+    The ``LiteLlm`` itself, and with it ``litellm``, is only imported on the first
+    call, so building agents stays cheap. A call holds its governor slot until its
+    response stream is exhausted, and is retried only before its first chunk is
+    yielded, so a stream is never replayed halfway. A request with an
+    ``http_options.timeout`` (see ``bound_by_deadline``) is cut off after that many
+    milliseconds with a ``DEADLINE_ERROR_CODE`` response instead of an exception.
+    """
+
+    _delegate: LiteLlm | None = PrivateAttr(default=None)
+
+    def _get_delegate(self) -> LiteLlm:
+        if self._delegate is None:
+            from google.adk.models.lite_llm import LiteLlm
+
+            self._delegate = LiteLlm(model=self.model)
+        return self._delegate
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        estimated = estimate_tokens(*request_texts(llm_request)) + (
+            settings.llm_estimated_output_tokens
+        )
+
+        http_options = llm_request.config and llm_request.config.http_options
+        timeout = http_options and http_options.timeout
+        ends_at = (
+            None
+            if timeout is None
+            else asyncio.get_running_loop().time() + max(timeout, 0) / 1000
+        )
+
+        last = None
+        responses = openai_governor.stream(
+            lambda: self._get_delegate().generate_content_async(llm_request, stream),
+            estimated,
+        )
+        async with aclosing(responses):
+            while True:
+                deadline = asyncio.timeout_at(ends_at)
+                try:
+                    async with deadline:
+                        response = await anext(responses)
+                except StopAsyncIteration:
+                    break
+                except TimeoutError:
+                    if not deadline.expired():
+                        raise
+                    yield LlmResponse(
+                        error_code=DEADLINE_ERROR_CODE,
+                        error_message="Model call cut off by the fact-check deadline",
+                    )
+                    return
+                last = response
+                yield response
+        usage = getattr(last, "usage_metadata", None)
+        openai_governor.record_usage(
+            estimated, getattr(usage, "total_token_count", 0) or 0
+        )
+
+
+groq_governor = ProviderGovernor(
+    "groq",
+    max_concurrency=settings.groq_max_concurrency,
+    requests_per_minute=settings.groq_requests_per_minute,
+    tokens_per_minute=settings.groq_tokens_per_minute,
+)
+openai_governor = ProviderGovernor(
+    "openai",
+    max_concurrency=settings.openai_max_concurrency,
+    requests_per_minute=settings.openai_requests_per_minute,
+    tokens_per_minute=settings.openai_tokens_per_minute,
+)
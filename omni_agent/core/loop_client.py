@@ -0,0 +1,51 @@
+"""Process-wide ``httpx.AsyncClient`` kept once per event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class PerLoopClient:
+    """Create an ``httpx.AsyncClient`` on first use in each event loop and reuse it.
+
+    A client's connections belong to the loop that opened them, so every running
+    loop gets its own client instead of replacing another loop's. ``close()``
+    closes the running loop's client and is awaited on shutdown. A client left
+    behind by a loop that has since closed can no longer be closed gracefully;
+    it is dropped when the next client is created, so it does not pin the loop.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]) -> None:
+        self._factory = factory
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            self._drop_closed_loops()
+            client = self._clients[loop] = self._factory()
+        return client
+
+    def current(self) -> httpx.AsyncClient | None:
+        """The running loop's client, if one was created, without creating it."""
+        try:
+            return self._clients.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
+
+    async def close(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _drop_closed_loops(self) -> None:
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+            logger.debug("Dropped the HTTP client of a closed event loop")
@@ -0,0 +1,601 @@
+"""Deterministic, readability-style HTML to Markdown extraction."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Iterator
+from urllib.parse import urljoin
+
+VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+DROPPED_TAGS = {
+    "aside",
+    "button",
+    "canvas",
+    "dialog",
+    "embed",
+    "footer",
+    "form",
+    "head",
+    "iframe",
+    "input",
+    "nav",
+    "noscript",
+    "object",
+    "script",
+    "select",
+    "style",
+    "svg",
+    "template",
+    "textarea",
+    "video",
+    "audio",
+}
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "blockquote",
+    "body",
+    "dd",
+    "details",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "figcaption",
+    "figure",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "html",
+    "li",
+    "main",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "summary",
+    "table",
+    "tbody",
+    "td",
+    "tfoot",
+    "th",
+    "thead",
+    "tr",
+    "ul",
+}
+# Tags implicitly closed when a sibling of the same kind opens
+SELF_CLOSING_SIBLINGS = {"p", "li", "dt", "dd", "tr", "td", "th", "option"}
+IMPLICIT_CLOSE_BOUNDARY = {"ul", "ol", "dl", "table", "div", "body", "html", "section"}
+# Elements nested deeper than this are flattened into their ancestor, which keeps
+# the recursive renderer well inside the interpreter's recursion limit
+MAX_DEPTH = 100
+
+UNLIKELY_CANDIDATES = re.compile(
+    r"ad-break|advert|banner|breadcrumb|combx|comment|community|consent|cookie|"
+    r"disqus|footer|gdpr|header|menu|modal|nav|newsletter|pager|pagination|popup|"
+    r"promo|related|remark|rss|share|shoutbox|sidebar|skyscraper|social|sponsor|"
+    r"subscribe|widget",
+    re.IGNORECASE,
+)
+MAYBE_CANDIDATES = re.compile(r"and|article|body|column|content|main|shadow", re.I)
+POSITIVE_HINTS = re.compile(
+    r"article|body|content|entry|hentry|main|page|post|story|text|blog", re.I
+)
+NEGATIVE_HINTS = re.compile(
+    r"comment|footer|footnote|masthead|media|meta|outbrain|promo|related|scroll|"
+    r"share|shoutbox|sidebar|sponsor|shopping|tags|tool|widget|hidden",
+    re.I,
+)
+HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.I)
+WHITESPACE = re.compile(r"\s+")
+
+PARAGRAPH_TAGS = {"p", "pre", "td", "blockquote"}
+TAG_WEIGHTS = {
+    "article": 10,
+    "main": 10,
+    "div": 5,
+    "section": 3,
+    "pre": 3,
+    "td": 3,
+    "blockquote": 3,
+    "address": -3,
+    "ol": -3,
+    "ul": -3,
+    "dl": -3,
+    "dd": -3,
+    "dt": -3,
+    "li": -3,
+    "h1": -5,
+    "h2": -5,
+    "h3": -5,
+    "h4": -5,
+    "h5": -5,
+    "h6": -5,
+    "th": -5,
+}
+
+
+@dataclass
+class ExtractionResult:
+    """Markdown extracted from a page and how confident the extractor is in it."""
+
+    markdown: str
+    title: str
+    confidence: float
+    text_length: int
+
+
+class _Node:
+    __slots__ = ("tag", "attrs", "children", "parent", "depth")
+
+    def __init__(self, tag: str, attrs: dict[str, str], parent: _Node | None) -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.children: list[_Node | str] = []
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    def element_children(self) -> Iterator[_Node]:
+        return (child for child in self.children if isinstance(child, _Node))
+
+    def walk(self) -> Iterator[_Node]:
+        stack: list[_Node] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.element_children())))
+
+    def class_and_id(self) -> str:
+        return f"{self.attrs.get('class', '')} {self.attrs.get('id', '')}"
+
+
+class _TreeBuilder(HTMLParser):
+    """Tolerant HTML parser that builds a minimal element tree."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#root", {}, None)
+        self._current = self.root
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in SELF_CLOSING_SIBLINGS or tag in BLOCK_TAGS:
+            self._close_implicit(tag)
+        if self._current.depth >= MAX_DEPTH:
+            return
+        node = _Node(tag, {k: v or "" for k, v in attrs}, self._current)
+        self._current.children.append(node)
+        if tag not in VOID_TAGS:
+            self._current = node
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._current.depth >= MAX_DEPTH:
+            return
+        node = _Node(tag, {k: v or "" for k, v in attrs}, self._current)
+        self._current.children.append(node)
+
+    def handle_endtag(self, tag: str) -> None:
+        node: _Node | None = self._current
+        while node is not None and node is not self.root:
+            if node.tag == tag:
+                self._current = node.parent or self.root
+                return
+            node = node.parent
+
+    def handle_data(self, data: str) -> None:
+        children = self._current.children
+        if children and isinstance(children[-1], str):
+            children[-1] += data
+        else:
+            children.append(data)
+
+    def _close_implicit(self, tag: str) -> None:
+        node: _Node | None = self._current
+        while node is not None and node is not self.root:
+            if node.tag == tag and tag in SELF_CLOSING_SIBLINGS:
+                self._current = node.parent or self.root
+                return
+            if node.tag == "p" and tag in BLOCK_TAGS:
+                self._current = node.parent or self.root
+                return
+            if node.tag in IMPLICIT_CLOSE_BOUNDARY:
+                return
+            node = node.parent
+
+
+def _is_hidden(node: _Node) -> bool:
+    attrs = node.attrs
+    return (
+        "hidden" in attrs
+        or attrs.get("aria-hidden") == "true"
+        or bool(HIDDEN_STYLE.search(attrs.get("style", "")))
+    )
+
+
+def _is_unlikely(node: _Node) -> bool:
+    if node.tag in {"html", "body", "article", "main"}:
+        return False
+    if node.attrs.get("role") in {"navigation", "banner", "contentinfo", "dialog"}:
+        return True
+    hints = node.class_and_id()
+    return bool(UNLIKELY_CANDIDATES.search(hints)) and not MAYBE_CANDIDATES.search(
+        hints
+    )
+
+
+def _prune(root: _Node) -> None:
+    """Drop boilerplate, hidden and non-content elements in place."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        kept: list[_Node | str] = []
+        for child in node.children:
+            if isinstance(child, _Node):
+                if (
+                    child.tag in DROPPED_TAGS
+                    or _is_hidden(child)
+                    or _is_unlikely(child)
+                ):
+                    continue
+                stack.append(child)
+            kept.append(child)
+        node.children = kept
+
+
+def _inner_text(node: _Node) -> str:
+    parts: list[str] = []
+    stack: list[_Node | str] = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            stack.extend(reversed(item.children))
+    return WHITESPACE.sub(" ", "".join(parts)).strip()
+
+
+@dataclass
+class _TextStats:
+    text_length: int = 0
+    link_length: int = 0
+    commas: int = 0
+
+    @property
+    def link_density(self) -> float:
+        if not self.text_length:
+            return 1.0
+        return min(1.0, self.link_length / self.text_length)
+
+
+def _text_stats(root: _Node) -> dict[_Node, _TextStats]:
+    """Text, link text and comma counts of every element, in one bottom-up pass.
+
+    Lengths are of the text with whitespace runs collapsed, as ``_inner_text``
+    reads it, so scoring never walks a candidate's subtree again.
+    """
+    stats: dict[_Node, _TextStats] = {}
+    for node in reversed(list(root.walk())):
+        node_stats = _TextStats()
+        for child in node.children:
+            if isinstance(child, str):
+                node_stats.text_length += len(WHITESPACE.sub(" ", child))
+                node_stats.commas += child.count(",")
+            else:
+                child_stats = stats[child]
+                node_stats.text_length += child_stats.text_length
+                node_stats.link_length += child_stats.link_length
+                node_stats.commas += child_stats.commas
+        if node.tag == "a":
+            node_stats.link_length = node_stats.text_length
+        stats[node] = node_stats
+    return stats
+
+
+def _class_weight(node: _Node) -> int:
+    hints = node.class_and_id()
+    weight = 0
+    if NEGATIVE_HINTS.search(hints):
+        weight -= 25
+    if POSITIVE_HINTS.search(hints):
+        weight += 25
+    return weight
+
+
+def _score_candidates(
+    root: _Node, stats: dict[_Node, _TextStats]
+) -> dict[_Node, float]:
+    scores: dict[_Node, float] = {}
+
+    def ensure(node: _Node) -> None:
+        if node not in scores:
+            scores[node] = TAG_WEIGHTS.get(node.tag, 0) + _class_weight(node)
+
+    for node in root.walk():
+        is_text_block = node.tag in PARAGRAPH_TAGS or (
+            node.tag == "div"
+            and not any(child.tag in BLOCK_TAGS for child in node.element_children())
+        )
+        if not is_text_block:
+            continue
+        text_length = stats[node].text_length
+        if text_length < 25:
+            continue
+        content_score = 1 + stats[node].commas + min(text_length // 100, 3)
+        parent = node.parent
+        if parent is None or parent is root:
+            continue
+        ensure(parent)
+        scores[parent] += content_score
+        grandparent = parent.parent
+        if grandparent is not None and grandparent is not root:
+            ensure(grandparent)
+            scores[grandparent] += content_score / 2
+
+    for node in scores:
+        scores[node] *= 1 - stats[node].link_density
+    return scores
+
+
+def _select_content(root: _Node) -> tuple[list[_Node], bool]:
+    """Return the nodes holding the main content and whether a candidate was found."""
+    stats = _text_stats(root)
+    scores = _score_candidates(root, stats)
+    if not scores:
+        body = next((node for node in root.walk() if node.tag == "body"), root)
+        return [body], False
+
+    top = max(scores, key=lambda node: scores[node])
+    parent = top.parent
+    if parent is None:
+        return [top], True
+
+    threshold = max(10.0, scores[top] * 0.2)
+    selected: list[_Node] = []
+    for sibling in parent.element_children():
+        if sibling is top or scores.get(sibling, 0) >= threshold:
+            selected.append(sibling)
+        elif sibling.tag == "p":
+            sibling_stats = stats[sibling]
+            if sibling_stats.text_length > 80 and sibling_stats.link_density < 0.25:
+                selected.append(sibling)
+    return selected, True
+
+
+class _MarkdownRenderer:
+    """Render a pruned element tree as Markdown, keeping links absolute."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+
+    def render(self, nodes: list[_Node]) -> str:
+        blocks: list[str] = []
+        for node in nodes:
+            blocks.extend(self._block(node))
+        markdown = "\n\n".join(block.strip("\n") for block in blocks if block.strip())
+        return re.sub(r"\n{3,}", "\n\n", markdown).strip()
+
+    def _children_blocks(self, node: _Node) -> list[str]:
+        blocks: list[str] = []
+        inline: list[str] = []
+
+        def flush() -> None:
+            text = WHITESPACE.sub(" ", "".join(inline)).strip()
+            if text:
+                blocks.append(text)
+            inline.clear()
+
+        for child in node.children:
+            if isinstance(child, _Node) and child.tag in BLOCK_TAGS:
+                flush()
+                blocks.extend(self._block(child))
+            else:
+                inline.append(self._inline(child))
+        flush()
+        return blocks
+
+    def _block(self, node: _Node) -> list[str]:
+        tag = node.tag
+        if tag in {"h1", "h2", "h3", "h4", "h5", "h6"}:
+            text = WHITESPACE.sub(" ", self._inline_children(node)).strip()
+            return [f"{'#' * int(tag[1])} {text}"] if text else []
+        if tag == "p":
+            text = WHITESPACE.sub(" ", self._inline_children(node)).strip()
+            return [text] if text else []
+        if tag in {"ul", "ol"}:
+            return [self._list(node, ordered=tag == "ol")]
+        if tag == "blockquote":
+            inner = "\n\n".join(self._children_blocks(node))
+            return ["\n".join(f"> {line}".rstrip() for line in inner.splitlines())]
+        if tag == "pre":
+            code = "".join(self._raw_text(node)).strip("\n")
+            return [f"```\n{code}\n```"] if code.strip() else []
+        if tag == "table":
+            return self._table(node)
+        if tag == "hr":
+            return []
+        return self._children_blocks(node)
+
+    def _list(self, node: _Node, ordered: bool) -> str:
+        lines: list[str] = []
+        index = 1
+        for item in node.element_children():
+            if item.tag != "li":
+                continue
+            marker = f"{index}. " if ordered else "- "
+            index += 1
+            body = "\n".join(self._children_blocks(item)).splitlines()
+            if not body:
+                continue
+            lines.append(marker + body[0])
+            lines.extend("  " + line if line else line for line in body[1:])
+        return "\n".join(lines)
+
+    def _table(self, node: _Node) -> list[str]:
+        rows: list[list[str]] = []
+        for row in node.walk():
+            if row.tag != "tr":
+                continue
+            cells = [
+                WHITESPACE.sub(" ", self._inline_children(cell))
+                .strip()
+                .replace("|", "\\|")
+                for cell in row.element_children()
+                if cell.tag in {"td", "th"}
+            ]
+            if any(cells):
+                rows.append(cells)
+        if not rows:
+            return []
+        width = max(len(row) for row in rows)
+        if width < 2:
+            return [row[0] for row in rows if row and row[0]]
+        rows = [row + [""] * (width - len(row)) for row in rows]
+        lines = [
+            "| " + " | ".join(rows[0]) + " |",
+            "| " + " | ".join("---" for _ in range(width)) + " |",
+        ]
+        lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+        return ["\n".join(lines)]
+
+    def _inline_children(self, node: _Node) -> str:
+        return "".join(self._inline(child) for child in node.children)
+
+    def _inline(self, node: _Node | str) -> str:
+        if isinstance(node, str):
+            return WHITESPACE.sub(" ", node)
+        tag = node.tag
+        if tag == "br":
+            return "\n"
+        if tag == "img":
+            return ""
+        text = self._inline_children(node)
+        if tag == "a":
+            label = WHITESPACE.sub(" ", text).strip()
+            href = node.attrs.get("href", "").strip()
+            if not label:
+                return ""
+            if not href or href.startswith(("#", "javascript:")):
+                return text
+            try:
+                href = urljoin(self.base_url, href)
+            except ValueError:
+                # Malformed hrefs such as "http://[::1" are kept as written
+                pass
+            return f"[{label}]({href})"
+        stripped = text.strip()
+        if not stripped:
+            return text
+        if tag in {"strong", "b"}:
+            return f" **{stripped}** "
+        if tag in {"em", "i"}:
+            return f" *{stripped}* "
+        if tag == "code":
+            return f" `{stripped}` "
+        return text
+
+    def _raw_text(self, node: _Node) -> Iterator[str]:
+        for child in node.children:
+            if isinstance(child, str):
+                yield child
+            elif child.tag == "br":
+                yield "\n"
+            else:
+                yield from self._raw_text(child)
+
+
+def _find_title(root: _Node) -> str:
+    for node in root.walk():
+        if node.tag == "meta" and node.attrs.get("property") == "og:title":
+            content = node.attrs.get("content", "").strip()
+            if content:
+                return content
+    for tag in ("title", "h1"):
+        node = next((n for n in root.walk() if n.tag == tag), None)
+        if node is not None:
+            text = _inner_text(node)
+            if text:
+                return text
+    return ""
+
+
+def _confidence(markdown_text_length: int, page_text_length: int, found: bool) -> float:
+    if not markdown_text_length:
+        return 0.0
+    length_score = min(1.0, markdown_text_length / 1500)
+    coverage = markdown_text_length / page_text_length if page_text_length else 0.0
+    # Extracting almost nothing, or the whole page, are both signs of a miss
+    coverage_score = 1.0 if 0.05 <= coverage <= 0.95 else 0.5
+    score = 0.6 * length_score + 0.2 * coverage_score + (0.2 if found else 0.0)
+    return round(min(1.0, score), 2)
+
+
+def extract_markdown(html: str, url: str = "") -> ExtractionResult:
+    """Extract the main content of an HTML page as Markdown.
+
+    Args:
+        html: Raw page HTML
+        url: Page URL, used to make relative links absolute
+
+    Returns:
+        ExtractionResult with the markdown, page title and a 0..1 confidence score
+    """
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    root = builder.root
+
+    title = _find_title(root)
+    body = next((node for node in root.walk() if node.tag == "body"), root)
+    page_text_length = len(_inner_text(body))
+
+    _prune(root)
+    content_nodes, found = _select_content(root)
+    markdown = _MarkdownRenderer(url).render(content_nodes)
+
+    if title and not markdown.startswith("#"):
+        markdown = f"# {title}\n\n{markdown}" if markdown else f"# {title}"
+
+    text_length = len(WHITESPACE.sub(" ", markdown))
+    return ExtractionResult(
+        markdown=markdown,
+        title=title,
+        confidence=_confidence(text_length, page_text_length, found),
+        text_length=text_length,
+    )
+
+
+def render_page_markdown(html: str, url: str = "") -> str:
+    """Render the whole visible page as Markdown, without picking a main block.
+
+    Used for pages where ``extract_markdown`` is not confident: scripts, styles,
+    hidden elements and obvious boilerplate are still dropped, which makes the
+    result far smaller than the HTML it is handed on to the LLM cleaner as.
+    """
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    root = builder.root
+    _prune(root)
+    body = next((node for node in root.walk() if node.tag == "body"), root)
+    return _MarkdownRenderer(url).render([body])
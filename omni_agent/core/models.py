@@ -80,6 +80,23 @@ class FactCheckVerdictOutput(BaseModel):
     )
 
 
+class ClaimAdjudicationOutput(BaseModel):
+    """Output schema for adjudicating a single claim."""
+
+    claim_id: str = Field(description="ID of the claim being adjudicated")
+    claim_text: str = Field(description="Text of the claim being adjudicated")
+    verdict: str = Field(description="Verdict: true, false, or could_not_be_verified")
+    argumentative_explanation: str = Field(
+        description=(
+            "Concise, evidence-backed argument for the verdict, citing references "
+            "as [1], [2] by their position in this output's references list"
+        )
+    )
+    references: list[ReferenceOutput] = Field(
+        description="References cited in the explanation. Do not invent URLs."
+    )
+
+
 class EvidenceAdjudicatorOutput(BaseModel):
     """Compact output schema for the main fact-checker agent."""
 
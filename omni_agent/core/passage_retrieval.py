@@ -0,0 +1,162 @@
+"""Query-focused BM25 passage retrieval over scraped Markdown."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from .content_budget import split_at_boundaries
+from .settings import settings
+
+TOKEN = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset(
+    """a an and are as at be by did do does for from had has have how in is it its
+    of on or that the their this to was were what when where which who why will
+    with""".split()
+)
+# Rough characters-per-token ratio used to turn the token budget into characters
+CHARS_PER_TOKEN = 4
+
+
+def research_question_key(agent_name: str) -> str:
+    """Session state key holding the question a research agent is working on."""
+    return f"{agent_name}_research_question"
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+@dataclass
+class Passage:
+    url: str
+    text: str
+    # Index of the page in the scrape and of the passage within its page
+    page_index: int
+    position: int
+    score: float = 0.0
+
+
+def split_passages(
+    url: str, markdown: str, page_index: int, max_chars: int | None = None
+) -> list[Passage]:
+    """Split a page into passages of whole paragraphs, up to ``max_chars`` each.
+
+    Headings are kept at the start of the passage that follows them, so every
+    passage still says which section it came from.
+    """
+    max_chars = max_chars or settings.passage_max_chars
+    blocks: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", markdown):
+        paragraph = paragraph.strip()
+        if paragraph:
+            blocks.extend(split_at_boundaries(paragraph, max_chars))
+
+    texts: list[str] = []
+    current = ""
+    for block in blocks:
+        ends_with_heading = current.rstrip().split("\n")[-1].startswith("#")
+        if (
+            current
+            and len(current) + len(block) + 2 > max_chars
+            and not (ends_with_heading and len(block) <= max_chars)
+        ):
+            texts.append(current)
+            current = ""
+        current = f"{current}\n\n{block}" if current else block
+    if current:
+        texts.append(current)
+    return [
+        Passage(url=url, text=text, page_index=page_index, position=position)
+        for position, text in enumerate(texts)
+    ]
+
+
+class BM25:
+    """Okapi BM25 over a fixed set of passages."""
+
+    def __init__(self, passages: list[Passage], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._terms = [Counter(tokenize(passage.text)) for passage in passages]
+        self._lengths = [sum(terms.values()) for terms in self._terms]
+        self._average_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+        document_frequency: Counter[str] = Counter()
+        for terms in self._terms:
+            document_frequency.update(terms.keys())
+        count = len(self._terms)
+        self._idf = {
+            term: math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> list[float]:
+        query_terms = set(tokenize(query))
+        results: list[float] = []
+        for terms, length in zip(self._terms, self._lengths):
+            norm = self.k1 * (
+                1 - self.b + self.b * length / (self._average_length or 1.0)
+            )
+            results.append(
+                sum(
+                    self._idf[term] * terms[term] * (self.k1 + 1) / (terms[term] + norm)
+                    for term in query_terms
+                    if term in terms
+                )
+            )
+        return results
+
+
+def select_passages(
+    question: str,
+    pages: list[tuple[str, str]],
+    top_k: int | None = None,
+    token_budget: int | None = None,
+) -> list[Passage]:
+    """Pick the passages of ``pages`` most relevant to ``question``.
+
+    Passages are ranked with BM25 and taken best-first until ``top_k`` passages or
+    ``token_budget`` tokens are used, then returned in page and reading order.
+    """
+    top_k = top_k or settings.passage_top_k
+    char_budget = (token_budget or settings.passage_token_budget) * CHARS_PER_TOKEN
+
+    passages = [
+        passage
+        for page_index, (url, markdown) in enumerate(pages)
+        for passage in split_passages(url, markdown, page_index)
+    ]
+    for passage, score in zip(passages, BM25(passages).scores(question)):
+        passage.score = score
+
+    ranked = sorted(passages, key=lambda p: (-p.score, p.page_index, p.position))
+    selected: list[Passage] = []
+    used = 0
+    for passage in ranked:
+        if len(selected) >= top_k:
+            break
+        if used + len(passage.text) > char_budget:
+            continue
+        selected.append(passage)
+        used += len(passage.text)
+    return sorted(selected, key=lambda p: (p.page_index, p.position))
+
+
+def format_passages(passages: list[Passage]) -> str:
+    """Group selected passages under a ``# Content from <url>`` header per page."""
+    sections: list[str] = []
+    by_page: dict[int, list[Passage]] = {}
+    for passage in passages:
+        by_page.setdefault(passage.page_index, []).append(passage)
+    for page_passages in by_page.values():
+        body = "\n\n[...]\n\n".join(passage.text for passage in page_passages)
+        sections.append(f"# Content from {page_passages[0].url}\n\n{body}\n\n---\n")
+    return "\n".join(sections)
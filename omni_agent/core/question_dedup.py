@@ -0,0 +1,98 @@
+"""Find gap questions that ask the same thing in different words."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from .passage_retrieval import tokenize
+
+# Words that anchor a question in time without changing what it asks about
+FILLER = frozenset(
+    "still current currently today now presently latest nowadays".split()
+)
+NEGATION = re.compile(
+    r"\b(?:not|no|never|neither|nor|none|nobody|nothing|without|cannot)\b|n't\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class QuestionTerms:
+    """Content words of a question, in order, and how often it is negated."""
+
+    words: tuple[str, ...]
+    negations: int
+
+    @property
+    def word_set(self) -> frozenset[str]:
+        return frozenset(self.words)
+
+
+def question_terms(question: str) -> QuestionTerms:
+    words = tuple(word for word in tokenize(question) if word not in FILLER)
+    # "didn't" and "did not" both count once
+    negations = len(NEGATION.findall(question.replace("’", "'")))
+    return QuestionTerms(words=words, negations=negations)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def is_near_duplicate(
+    terms: QuestionTerms, other: QuestionTerms, threshold: float
+) -> bool:
+    """True if two questions ask the same thing, one with fewer words.
+
+    One question's words must all be in the other, so questions that each have
+    a word the other lacks, such as "CEO" and "CTO" or two different years, stay
+    apart. The words they share must come in the same order and as often, so
+    "Did X acquire Y?" and "Did Y acquire X?" stay apart, and both must be
+    negated the same number of times, so "increase" and "not increase" do too.
+    """
+    words, other_words = terms.word_set, other.word_set
+    if terms.negations != other.negations:
+        return False
+    if not (words <= other_words or other_words <= words):
+        return False
+    shared = words & other_words
+    if [word for word in terms.words if word in shared] != [
+        word for word in other.words if word in shared
+    ]:
+        return False
+    return jaccard(words, other_words) >= threshold
+
+
+def near_duplicate_representatives(questions: list[str], threshold: float) -> list[int]:
+    """For each question, the index of the question it is researched as.
+
+    Questions are visited from the most to the fewest words. A question that
+    ``is_near_duplicate`` of a kept question is researched as that question;
+    otherwise it is kept and represents itself. So a group is always researched
+    as its most specific question, and a question is never researched as a
+    broader one that would drop its detail: "Did Biden win in 2020?" is
+    researched as "Did Biden win Pennsylvania in 2020?", "What was Georgia GDP
+    growth?" as "What was Georgia GDP growth in 2023?", "When was the rally?"
+    as "When was the rally in Tbilisi on May 5?" and "Who is the current CTO of
+    Acme?" as "Is Alice Kim still CTO of Acme?", never the other way around.
+    Comparing with kept questions only means a chain of small rewordings never
+    drifts away from the question that is actually researched. A threshold of 0
+    disables it.
+    """
+    if threshold <= 0:
+        return list(range(len(questions)))
+
+    terms = [question_terms(question) for question in questions]
+    representatives = list(range(len(questions)))
+    kept: list[int] = []
+    for i in sorted(range(len(questions)), key=lambda i: -len(terms[i].word_set)):
+        for kept_index in kept:
+            if is_near_duplicate(terms[i], terms[kept_index], threshold):
+                representatives[i] = kept_index
+                break
+        else:
+            kept.append(i)
+    return representatives
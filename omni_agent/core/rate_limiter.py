@@ -0,0 +1,162 @@
+"""Per-domain and per-backend politeness scheduler for every scrape path."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+
+from .settings import settings
+from .url_utils import url_domain
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS_CODES = {429, 503}
+MAX_IDLE_BUCKETS = 1024
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of polling.
+
+    Tokens may go negative: each caller reserves a token immediately and is told
+    how long to wait for it, which keeps waiting callers in FIFO order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = max(rate, 1e-6)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+
+    def reserve(self, now: float, cost: float = 1.0) -> float:
+        """Take ``cost`` tokens and return the seconds the caller must wait for them."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= cost
+        deficit_wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(deficit_wait, self.blocked_until - now)
+
+    def refund(self, cost: float = 1.0) -> None:
+        self.tokens = min(self.capacity, self.tokens + cost)
+
+    def idle(self, now: float) -> bool:
+        refilled = self.tokens + (now - self.updated) * self.rate
+        return refilled >= self.capacity and now >= self.blocked_until
+
+
+class ScrapeRateLimiter:
+    """Token buckets per host and per scraping backend, with 429/503 backoff.
+
+    Requests to different hosts only share their backend's bucket, so they run at
+    full concurrency. A host (or backend) that answers 429 or 503 is paused for its
+    ``Retry-After`` or an exponential backoff, without slowing down other hosts.
+    """
+
+    def __init__(
+        self,
+        domain_rate: float | None = None,
+        domain_burst: int | None = None,
+        backend_rates: dict[str, float] | None = None,
+    ) -> None:
+        self.domain_rate = domain_rate or settings.scrape_domain_rate
+        self.domain_burst = domain_burst or settings.scrape_domain_burst
+        self.backend_rates = (
+            backend_rates
+            if backend_rates is not None
+            else settings.scrape_backend_rates
+        )
+        self._domains: dict[str, TokenBucket] = {}
+        self._backends: dict[str, TokenBucket] = {}
+
+    async def acquire(
+        self, url: str, backend: str, max_wait: float | None = None
+    ) -> bool:
+        """Wait for permission to fetch ``url`` through ``backend``.
+
+        Returns:
+            False, without waiting, if permission would take longer than max_wait
+        """
+        now = time.monotonic()
+        buckets = [self._domain_bucket(url, now), self._backend_bucket(backend)]
+        wait = max(bucket.reserve(now) for bucket in buckets)
+        if max_wait is not None and wait > max_wait:
+            for bucket in buckets:
+                bucket.refund()
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def record_response(
+        self,
+        url: str,
+        backend: str,
+        status_code: int,
+        retry_after: str | None = None,
+        throttled_by_backend: bool = False,
+    ) -> None:
+        """Feed a response status back; 429/503 pause the host or the backend."""
+        bucket = (
+            self._backend_bucket(backend)
+            if throttled_by_backend
+            else self._domain_bucket(url, time.monotonic())
+        )
+        if status_code not in THROTTLE_STATUS_CODES:
+            bucket.strikes = 0
+            return
+
+        bucket.strikes += 1
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = settings.scrape_backoff_base * 2 ** (bucket.strikes - 1)
+        delay = min(delay, settings.scrape_backoff_max)
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+        target = backend if throttled_by_backend else url_domain(url)
+        logger.warning(
+            f"{target} answered {status_code}; pausing it for {delay:.1f}s "
+            f"(strike {bucket.strikes})"
+        )
+
+    def _domain_bucket(self, url: str, now: float) -> TokenBucket:
+        domain = url_domain(url)
+        bucket = self._domains.get(domain)
+        if bucket is None:
+            if len(self._domains) >= MAX_IDLE_BUCKETS:
+                self._domains = {
+                    name: kept
+                    for name, kept in self._domains.items()
+                    if not kept.idle(now)
+                }
+            bucket = TokenBucket(self.domain_rate, self.domain_burst)
+            self._domains[domain] = bucket
+        return bucket
+
+    def _backend_bucket(self, backend: str) -> TokenBucket:
+        bucket = self._backends.get(backend)
+        if bucket is None:
+            rate = self.backend_rates.get(backend, settings.scrape_default_backend_rate)
+            bucket = TokenBucket(rate, max(1, int(rate)))
+            self._backends[backend] = bucket
+        return bucket
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+scrape_rate_limiter = ScrapeRateLimiter()
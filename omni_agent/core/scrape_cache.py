@@ -0,0 +1,323 @@
+"""Persistent, size-bounded cache for scraped pages."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .settings import settings
+from .url_utils import canonicalize_url, url_domain
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    content TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_last_accessed ON pages (last_accessed);
+"""
+
+
+@dataclass
+class CachedPage:
+    """A cached scrape result and the fetch metadata stored with it."""
+
+    url: str
+    content: str
+    metadata: dict[str, Any]
+    fetched_at: float
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers built from the stored ETag/Last-Modified."""
+        headers: dict[str, str] = {}
+        if self.metadata.get("etag"):
+            headers["If-None-Match"] = self.metadata["etag"]
+        if self.metadata.get("last_modified"):
+            headers["If-Modified-Since"] = self.metadata["last_modified"]
+        return headers
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    writes: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "writes": self.writes,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class ScrapeCache:
+    """SQLite-backed page cache keyed by canonical URL and fetch variant.
+
+    Entries expire after a per-domain TTL. An expired entry that carries an ETag or
+    Last-Modified validator is revalidated with a conditional GET and kept if the
+    origin answers 304. The cache is bounded by total stored bytes and evicts the
+    least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        max_bytes: int | None = None,
+        default_ttl: float | None = None,
+        domain_ttls: dict[str, float] | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        self.path = path or settings.scrape_cache_path
+        self.max_bytes = max_bytes or settings.scrape_cache_max_bytes
+        self.default_ttl = default_ttl or settings.scrape_cache_default_ttl
+        self.domain_ttls = (
+            domain_ttls
+            if domain_ttls is not None
+            else settings.scrape_cache_domain_ttls
+        )
+        self.enabled = settings.scrape_cache_enabled if enabled is None else enabled
+        self.stats = CacheStats()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._http_client: httpx.AsyncClient | None = None
+
+    def ttl_for(self, url: str) -> float:
+        """TTL in seconds for a URL, using the most specific matching domain rule."""
+        domain = url_domain(url)
+        matches = [
+            rule
+            for rule in self.domain_ttls
+            if domain == rule.lower().removeprefix("www.")
+            or domain.endswith("." + rule.lower().removeprefix("www."))
+        ]
+        if not matches:
+            return self.default_ttl
+        return self.domain_ttls[max(matches, key=len)]
+
+    @staticmethod
+    def make_key(url: str, variant: str) -> str:
+        canonical = canonicalize_url(url)
+        return hashlib.sha256(f"{variant}|{canonical}".encode()).hexdigest()
+
+    async def lookup(self, url: str, variant: str) -> CachedPage | None:
+        """Return a usable cached page, revalidating an expired one if possible."""
+        if not self.enabled:
+            return None
+
+        try:
+            key = self.make_key(url, variant)
+        except ValueError:
+            # A URL that cannot be keyed is simply scraped without the cache
+            self.stats.misses += 1
+            return None
+        try:
+            entry = await asyncio.to_thread(self._get, key)
+        except sqlite3.Error:
+            logger.exception("Failed to read scrape cache entry")
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.fresh:
+            self.stats.hits += 1
+            return entry
+
+        self.stats.stale += 1
+        if entry.validators and await self._revalidate(entry):
+            self.stats.revalidations += 1
+            self.stats.hits += 1
+            entry.expires_at = time.time() + self.ttl_for(url)
+            await asyncio.to_thread(self._refresh, key, entry.expires_at)
+            return entry
+
+        self.stats.misses += 1
+        return None
+
+    async def put(
+        self,
+        url: str,
+        variant: str,
+        content: str,
+        metadata: dict[str, Any],
+        ttl: float | None = None,
+    ) -> None:
+        """Store a scrape result and evict least recently used entries if needed.
+
+        ``ttl`` overrides the per-domain TTL from ``ttl_for``.
+        """
+        if not self.enabled:
+            return
+        try:
+            await asyncio.to_thread(self._put, url, variant, content, metadata, ttl)
+        except ValueError as exc:
+            logger.debug(f"Not caching {url}: {exc}")
+        except sqlite3.Error:
+            logger.exception("Failed to write scrape cache entry")
+
+    async def close(self) -> None:
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> CachedPage | None:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT url, content, metadata, fetched_at, expires_at "
+                "FROM pages WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE pages SET last_accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+        url, content, metadata, fetched_at, expires_at = row
+        return CachedPage(
+            url=url,
+            content=content,
+            metadata=json.loads(metadata),
+            fetched_at=fetched_at,
+            expires_at=expires_at,
+        )
+
+    def _refresh(self, key: str, expires_at: float) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE pages SET expires_at = ? WHERE key = ?", (expires_at, key)
+            )
+            conn.commit()
+
+    def _put(
+        self,
+        url: str,
+        variant: str,
+        content: str,
+        metadata: dict[str, Any],
+        ttl: float | None = None,
+    ) -> None:
+        now = time.time()
+        metadata_json = json.dumps(metadata, ensure_ascii=False)
+        size = len(content.encode()) + len(metadata_json.encode())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (key, url, variant, content, "
+                "content_hash, metadata, size, fetched_at, expires_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.make_key(url, variant),
+                    canonicalize_url(url),
+                    variant,
+                    content,
+                    hashlib.sha256(content.encode()).hexdigest(),
+                    metadata_json,
+                    size,
+                    now,
+                    now + (ttl if ttl is not None else self.ttl_for(url)),
+                    now,
+                ),
+            )
+            self.stats.writes += 1
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM pages ORDER BY last_accessed ASC"
+        ).fetchall()
+        evicted: list[str] = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append(key)
+            total -= size
+        conn.executemany("DELETE FROM pages WHERE key = ?", [(k,) for k in evicted])
+        self.stats.evictions += len(evicted)
+
+    async def _revalidate(self, entry: CachedPage) -> bool:
+        """Ask the origin whether the cached page changed; True on 304."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=settings.scrape_cache_revalidate_timeout,
+                follow_redirects=True,
+            )
+        try:
+            async with self._http_client.stream(
+                "GET", entry.url, headers=entry.validators
+            ) as response:
+                return response.status_code == 304
+        except httpx.HTTPError as exc:
+            logger.info(f"Revalidation of {entry.url} failed: {exc}")
+            return False
+
+
+def validator_metadata(headers: dict[str, str] | httpx.Headers) -> dict[str, str]:
+    """Pick the cache validators and content type out of response headers."""
+    lowered = {key.lower(): value for key, value in headers.items()}
+    metadata: dict[str, str] = {}
+    for header, key in (
+        ("etag", "etag"),
+        ("last-modified", "last_modified"),
+        ("content-type", "content_type"),
+    ):
+        if lowered.get(header):
+            metadata[key] = lowered[header]
+    return metadata
+
+
+scrape_cache = ScrapeCache()
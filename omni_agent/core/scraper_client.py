@@ -0,0 +1,120 @@
+"""Process-wide pooled HTTP client for the Lightpanda scraping service."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import logging
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator
+
+import httpx
+
+from .loop_client import PerLoopClient
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+RETRY_BACKOFF_BASE = 0.5
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+
+@dataclass
+class ScraperClientStats:
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    records: int = 0
+    clients_created: int = 0
+
+
+class ScraperServiceClient:
+    """Shared, keep-alive client for ``POST /scrape/stream`` on the scraping service.
+
+    The underlying ``httpx.AsyncClient`` is created on first use in each event
+    loop and reused by every tool call in it. Connection failures and 5xx answers
+    are retried up to ``settings.max_retries`` times with exponential backoff; if
+    a stream breaks part-way, only the URLs that have not been answered yet are
+    requested again.
+    """
+
+    def __init__(self, base_url: str | None = None) -> None:
+        self.base_url = (base_url or settings.scraper_service_url).rstrip("/")
+        self.stats = ScraperClientStats()
+        self._clients = PerLoopClient(self._create_client)
+
+    def _create_client(self) -> httpx.AsyncClient:
+        self.stats.clients_created += 1
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=settings.scraper_http2 and HTTP2_AVAILABLE,
+            timeout=settings.default_timeout,
+            limits=httpx.Limits(
+                max_connections=settings.scraper_max_connections,
+                max_keepalive_connections=settings.scraper_max_keepalive_connections,
+                keepalive_expiry=settings.scraper_keepalive_expiry,
+            ),
+        )
+
+    async def stream_records(self, urls: list[str]) -> AsyncIterator[dict[str, Any]]:
+        """Yield one scrape record per URL as the service produces it."""
+        pending = list(dict.fromkeys(urls))
+        attempt = 0
+        while True:
+            self.stats.requests += 1
+            try:
+                async with self._clients.get().stream(
+                    "POST", "/scrape/stream", json={"urls": pending}
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        record = json.loads(line)
+                        self.stats.records += 1
+                        with suppress(ValueError):
+                            pending.remove(record.get("url"))
+                        yield record
+                return
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                retryable = (
+                    not isinstance(exc, httpx.HTTPStatusError)
+                    or exc.response.status_code in RETRYABLE_STATUS_CODES
+                )
+                if not pending:
+                    return
+                if not retryable or attempt >= settings.max_retries:
+                    self.stats.failures += 1
+                    raise
+                delay = RETRY_BACKOFF_BASE * 2**attempt
+                attempt += 1
+                self.stats.retries += 1
+                logger.warning(
+                    f"Scraper service call failed ({exc}); retrying {len(pending)} "
+                    f"URLs in {delay:.1f}s (attempt {attempt}/{settings.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Request counters plus open and idle connections in the pool."""
+        connections: list[Any] = []
+        client = self._clients.current()
+        if client is not None:
+            pool = getattr(client._transport, "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+        return {
+            **asdict(self.stats),
+            "service_url": self.base_url,
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for conn in connections if conn.is_idle()),
+        }
+
+    async def close(self) -> None:
+        """Close the running event loop's client."""
+        await self._clients.close()
+
+
+scraper_client = ScraperServiceClient()
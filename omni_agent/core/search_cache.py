@@ -0,0 +1,145 @@
+"""TTL cache for web search results, keyed by normalized query and country."""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from .passage_retrieval import STOPWORDS
+from .scrape_cache import ScrapeCache
+from .settings import settings
+
+DISK_VARIANT = "search"
+TOKEN = re.compile(r"\w+", re.UNICODE)
+TIME_SENSITIVE_TERMS = re.compile(
+    r"\b(?:today|tonight|yesterday|tomorrow|now|latest|breaking|current|currently|"
+    r"recent|recently|live|this (?:week|month|morning|evening)|last (?:night|week))\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_query(query: str) -> str:
+    """Case-, punctuation- and word-order-insensitive form of a search query."""
+    text = unicodedata.normalize("NFKC", query).casefold()
+    tokens = {token for token in TOKEN.findall(text) if token not in STOPWORDS}
+    return " ".join(sorted(tokens))
+
+
+def is_time_sensitive(query: str) -> bool:
+    """True for queries about recent events, whose results go stale quickly."""
+    if TIME_SENSITIVE_TERMS.search(query):
+        return True
+    return str(date.today().year) in query
+
+
+@dataclass
+class SearchCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class SearchCache:
+    """In-memory LRU of search results with an optional SQLite tier.
+
+    Entries live for ``settings.search_cache_ttl`` seconds, or
+    ``settings.search_cache_time_sensitive_ttl`` for queries that mention recent
+    events. The memory tier holds at most ``settings.search_cache_max_entries``;
+    the disk tier reuses ``ScrapeCache`` so results survive restarts and are shared
+    between processes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        ttl: float | None = None,
+        time_sensitive_ttl: float | None = None,
+        disk: ScrapeCache | None = None,
+    ) -> None:
+        self.max_entries = max_entries or settings.search_cache_max_entries
+        self.ttl = ttl or settings.search_cache_ttl
+        self.time_sensitive_ttl = (
+            time_sensitive_ttl or settings.search_cache_time_sensitive_ttl
+        )
+        self.disk = disk
+        self.stats = SearchCacheStats()
+        self._entries: OrderedDict[str, tuple[list[dict[str, Any]], float]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def make_key(query: str, country: str) -> str:
+        return f"{country.strip().lower()}|{normalize_query(query)}"
+
+    def ttl_for(self, query: str) -> float:
+        return self.time_sensitive_ttl if is_time_sensitive(query) else self.ttl
+
+    async def get(self, query: str, country: str) -> list[dict[str, Any]] | None:
+        key = self.make_key(query, country)
+        entry = self._entries.get(key)
+        if entry is not None:
+            results, expires_at = entry
+            if time.time() < expires_at:
+                self._entries.move_to_end(key)
+                self.stats.memory_hits += 1
+                return results
+            del self._entries[key]
+
+        if self.disk is not None:
+            cached = await self.disk.lookup(key, DISK_VARIANT)
+            if cached is not None:
+                results = json.loads(cached.content)
+                self._remember(key, results, cached.expires_at)
+                self.stats.disk_hits += 1
+                return results
+
+        self.stats.misses += 1
+        return None
+
+    async def put(
+        self, query: str, country: str, results: list[dict[str, Any]]
+    ) -> None:
+        key = self.make_key(query, country)
+        ttl = self.ttl_for(query)
+        self._remember(key, results, time.time() + ttl)
+        self.stats.writes += 1
+        if self.disk is not None:
+            await self.disk.put(
+                key, DISK_VARIANT, json.dumps(results, ensure_ascii=False), {}, ttl=ttl
+            )
+
+    def _remember(
+        self, key: str, results: list[dict[str, Any]], expires_at: float
+    ) -> None:
+        self._entries[key] = (results, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+search_cache = SearchCache(
+    disk=ScrapeCache(path=settings.search_cache_path, enabled=True)
+    if settings.search_cache_disk_enabled
+    else None
+)
@@ -30,19 +30,306 @@ class AppSettings(BaseSettings):
     )
     max_retries: int = Field(default=3, description="Maximum number of HTTP retries")
 
+    scrape_fetch_profile: str = Field(
+        default="text+scripts",
+        description="Default resource-blocking profile: full, text+scripts, text-only",
+    )
+    scrape_blocked_domains: list[str] = Field(
+        default_factory=list,
+        description="Extra tracker/ad domains to block on top of the built-in list",
+    )
+
+    # Scrape politeness settings
+    scrape_domain_rate: float = Field(
+        default=1.0, description="Sustained requests per second allowed per host"
+    )
+    scrape_domain_burst: int = Field(
+        default=3, description="Requests a host may receive in a burst"
+    )
+    scrape_backend_rates: dict[str, float] = Field(
+        default_factory=lambda: {"lightpanda": 10.0, "scrape.do": 5.0, "http": 20.0},
+        description="Requests per second allowed per scraping backend",
+    )
+    scrape_default_backend_rate: float = Field(
+        default=5.0, description="Requests per second for backends not listed above"
+    )
+    scrape_backoff_base: float = Field(
+        default=2.0,
+        description="First backoff in seconds after a 429/503 without Retry-After",
+    )
+    scrape_backoff_max: float = Field(
+        default=60.0, description="Longest pause in seconds applied to a throttled host"
+    )
+
+    # Scrape cache settings
+    scrape_cache_enabled: bool = Field(
+        default=True, description="Cache scraped pages on local disk"
+    )
+    scrape_cache_path: str = Field(
+        default=".cache/scrape_cache.sqlite3",
+        description="SQLite file backing the scrape cache",
+    )
+    scrape_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Maximum bytes stored in the scrape cache before LRU eviction",
+    )
+    scrape_cache_default_ttl: float = Field(
+        default=6 * 3600.0, description="Default scrape cache freshness in seconds"
+    )
+    scrape_cache_domain_ttls: dict[str, float] = Field(
+        default_factory=dict,
+        description='Per-domain scrape cache TTLs in seconds, e.g. {"bbc.com": 600}',
+    )
+    scrape_cache_revalidate_timeout: float = Field(
+        default=10.0,
+        description="Timeout in seconds for conditional revalidation requests",
+    )
+
+    # scrape.do backend settings
+    scrape_do_concurrency: int = Field(
+        default=5, description="scrape.do requests run at once per scrape call"
+    )
+    scrape_do_timeout: float = Field(
+        default=30.0, description="Timeout in seconds for one scrape.do attempt"
+    )
+    scrape_do_retry_base: float = Field(
+        default=1.0,
+        description="Upper bound in seconds of the first jittered scrape.do retry delay",
+    )
+
+    # Search result cache settings
+    search_cache_ttl: float = Field(
+        default=6 * 3600.0, description="Seconds a cached search result stays fresh"
+    )
+    search_cache_time_sensitive_ttl: float = Field(
+        default=900.0,
+        description="Freshness in seconds for queries about recent events",
+    )
+    search_cache_max_entries: int = Field(
+        default=1000, description="Search results kept in the in-memory cache"
+    )
+    search_cache_disk_enabled: bool = Field(
+        default=False, description="Also keep search results in a SQLite cache"
+    )
+    search_cache_path: str = Field(
+        default=".cache/search_cache.sqlite3",
+        description="SQLite file for the on-disk search result cache",
+    )
+
+    # Claim verdict cache settings
+    verdict_cache_enabled: bool = Field(
+        default=True, description="Reuse true/false verdicts of claims seen before"
+    )
+    verdict_cache_ttl: float = Field(
+        default=24 * 3600.0, description="Seconds a cached verdict stays fresh"
+    )
+    verdict_cache_time_sensitive_ttl: float = Field(
+        default=900.0,
+        description="Freshness in seconds for verdicts on claims about recent events",
+    )
+    verdict_cache_max_entries: int = Field(
+        default=1000, description="Verdicts kept in the in-memory cache"
+    )
+    verdict_cache_disk_enabled: bool = Field(
+        default=True, description="Also keep verdicts in a SQLite cache"
+    )
+    verdict_cache_path: str = Field(
+        default=".cache/verdict_cache.sqlite3",
+        description="SQLite file for the on-disk verdict cache",
+    )
+
     # Content processing settings
     max_content_length: int = Field(
-        default=10000, description="Maximum content length for processing"
+        default=10000, description="Maximum Markdown characters kept per scraped page"
+    )
+    scrape_max_page_bytes: int = Field(
+        default=2 * 1024 * 1024,
+        description="Maximum raw bytes read for a single page",
+    )
+    scrape_max_request_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        description="Maximum content bytes returned for a single scrape request",
+    )
+    scrape_spool_memory_bytes: int = Field(
+        default=1024 * 1024,
+        description="Combined content kept in memory before spilling to a temp file",
+    )
+    markdown_min_confidence: float = Field(
+        default=0.4,
+        description="Extraction confidence below which a page is cleaned by the LLM",
+    )
+    markdown_llm_fallback: bool = Field(
+        default=True,
+        description="Clean low-confidence extractions with the markdown LLM agent",
+    )
+    markdown_chunk_chars: int = Field(
+        default=12000, description="Maximum characters sent to one LLM cleaning call"
+    )
+    markdown_max_chunks_per_page: int = Field(
+        default=8, description="Maximum LLM cleaning calls spent on a single page"
+    )
+    passage_retrieval_enabled: bool = Field(
+        default=True,
+        description="Return only the scraped passages relevant to the research question",
+    )
+    passage_max_chars: int = Field(
+        default=1000, description="Maximum characters in one retrieval passage"
+    )
+    passage_top_k: int = Field(
+        default=12, description="Maximum passages returned by one scrape_tool call"
+    )
+    passage_token_budget: int = Field(
+        default=3000, description="Approximate tokens of passages per scrape_tool call"
+    )
+    frontier_max_excerpts: int = Field(
+        default=3,
+        description="Search results per call given excerpts of already-scraped pages",
+    )
+    frontier_excerpt_tokens: int = Field(
+        default=400, description="Approximate tokens in one scraped-page excerpt"
+    )
+    markdown_transform_concurrency: int = Field(
+        default=4, description="LLM cleaning calls run at once per scrape_tool call"
+    )
+
+    # Research scheduling
+    research_concurrency: int = Field(
+        default=5, description="Gap questions researched at once per fact-check"
+    )
+    research_dedup_threshold: float = Field(
+        default=0.5,
+        description=(
+            "Word-set similarity at which a gap question is researched as an "
+            "earlier one; 0 researches every question"
+        ),
+    )
+    fact_check_deadline: float = Field(
+        default=300.0,
+        description="Wall-clock seconds for one fact-check; 0 disables the deadline",
+    )
+    synthesis_reserve: float = Field(
+        default=60.0,
+        description="Seconds of the deadline kept for adjudication after research",
+    )
+    synthesis_mode: str = Field(
+        default="per_claim",
+        description=(
+            "per_claim: adjudicate claims concurrently after research; pipelined: "
+            "adjudicate each claim once its research is done; single: one call"
+        ),
+    )
+    adjudication_concurrency: int = Field(
+        default=4, description="Claims adjudicated at once per fact-check"
     )
 
     groq_api_key: str = Field(default="", description="Groq API key")
 
+    # Provider rate limit governor settings
+    groq_max_concurrency: int = Field(
+        default=4, description="Groq calls in flight at once across the process"
+    )
+    groq_requests_per_minute: float = Field(
+        default=30.0, description="Groq requests per minute to pace calls to"
+    )
+    groq_tokens_per_minute: float = Field(
+        default=70000.0, description="Groq tokens per minute to pace calls to"
+    )
+    openai_max_concurrency: int = Field(
+        default=8, description="OpenAI calls in flight at once across the process"
+    )
+    openai_requests_per_minute: float = Field(
+        default=500.0, description="OpenAI requests per minute to pace calls to"
+    )
+    openai_tokens_per_minute: float = Field(
+        default=200000.0, description="OpenAI tokens per minute to pace calls to"
+    )
+    llm_estimated_output_tokens: int = Field(
+        default=1000, description="Output tokens reserved for an LLM call up front"
+    )
+    llm_retry_base: float = Field(
+        default=1.0, description="Upper bound of the first jittered LLM retry delay"
+    )
+    llm_retry_max: float = Field(
+        default=60.0, description="Longest wait in seconds before an LLM retry"
+    )
+
     # Lightpanda remote browser/CDP settings
     lightpanda_ws_base: str = Field(
         default="wss://cloud.lightpanda.io/ws",
         description="Lightpanda WebSocket base URI for CDP",
     )
     lightpanda_token: str = Field(default="", description="Lightpanda access token")
+    lightpanda_pool_size: int = Field(
+        default=2, description="Number of long-lived CDP connections to Lightpanda"
+    )
+    lightpanda_max_pages_per_context: int = Field(
+        default=50,
+        description="Pages served by one browser context before it is recycled",
+    )
+    lightpanda_health_check_interval: float = Field(
+        default=30.0,
+        description="Seconds between health checks of pooled Lightpanda connections",
+    )
+
+    # Scrape scheduling settings
+    scrape_max_open_pages: int = Field(
+        default=16, description="Maximum pages open at once across the scrape service"
+    )
+    scrape_max_pages_per_request: int = Field(
+        default=5, description="Maximum pages open at once for a single scrape request"
+    )
+    scrape_page_timeout: float = Field(
+        default=30.0, description="Deadline in seconds for scraping a single URL"
+    )
+    scrape_network_idle_timeout: float = Field(
+        default=5.0,
+        description="Seconds to wait for network idle after load before reading a page",
+    )
+
+    # Scraping service client settings (used by the research agents)
+    scraper_service_url: str = Field(
+        default="http://localhost:8003",
+        description="Base URL of the Lightpanda scraping service",
+    )
+    scraper_http2: bool = Field(
+        default=False,
+        description="Talk HTTP/2 to the scraping service when h2 is installed",
+    )
+    scraper_max_connections: int = Field(
+        default=10, description="Maximum connections to the scraping service"
+    )
+    scraper_max_keepalive_connections: int = Field(
+        default=5, description="Idle keep-alive connections kept to the service"
+    )
+    scraper_keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle service connection is kept open"
+    )
+
+    # Plain-HTTP fetch tier settings
+    http_fetch_enabled: bool = Field(
+        default=True,
+        description="Try a plain HTTP GET before rendering a page in the browser",
+    )
+    http_fetch_http2: bool = Field(
+        default=True, description="Use HTTP/2 for the HTTP tier when h2 is installed"
+    )
+    http_fetch_timeout: float = Field(
+        default=15.0, description="Timeout in seconds for a plain HTTP fetch"
+    )
+    http_fetch_max_connections: int = Field(
+        default=20, description="Connection pool size of the HTTP fetch tier"
+    )
+    http_fetch_min_text_length: int = Field(
+        default=200,
+        description="Extracted text length below which a JS app shell is escalated",
+    )
+    fetch_tier_memory_size: int = Field(
+        default=1024, description="Domains whose working fetch tier is remembered"
+    )
+    fetch_tier_memory_ttl: float = Field(
+        default=6 * 3600.0,
+        description="Seconds a domain's working fetch tier is remembered",
+    )
 
 
 # Create application settings instance
@@ -0,0 +1,46 @@
+"""Coalesce concurrent identical calls into one in-flight task."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight call between concurrent callers asking for the same key.
+
+    The first caller for a key starts the work; callers arriving before it finishes
+    await the same task instead of repeating it. The task is shielded, so a caller
+    that gets cancelled does not cancel the work for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run ``fn`` for ``key`` or join the call already running.
+
+        Returns:
+            The result and whether it was shared with an earlier caller
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task), shared
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
@@ -2,130 +2,245 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import random
+import time
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from google.adk.tools import FunctionTool, MCPToolset
+from google.adk.tools import FunctionTool, ToolContext
 from google.adk.tools import google_search as adk_google_search
-from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams
-from groq import AsyncGroq
 
 from omni_agent.core.web_scraper import scrape_tool
 
+from .deadline import DEADLINE_MESSAGE, research_time_left
+from .evidence_frontier import get_evidence_frontier
+from .llm_governor import estimate_tokens, groq_governor
+from .loop_client import PerLoopClient
+from .passage_retrieval import research_question_key
+from .rate_limiter import scrape_rate_limiter
+from .scrape_cache import scrape_cache, validator_metadata
+from .search_cache import search_cache
 from .settings import settings
+from .single_flight import SingleFlight
+from .url_utils import canonicalize_url
+
+if TYPE_CHECKING:
+    from google.adk.tools import MCPToolset
+    from groq import AsyncGroq
 
 logger = logging.getLogger(__name__)
-groq_client = AsyncGroq(api_key=settings.groq_api_key)
+RATE_LIMIT_BACKEND = "scrape.do"
 
 
-async def _scrape_single_website(
-    url: str, country_code: str, client: httpx.AsyncClient
-) -> dict[str, Any]:
+_scrape_do_inflight: SingleFlight[dict[str, Any]] = SingleFlight()
+_search_inflight: SingleFlight[dict[str, Any]] = SingleFlight()
+# Shared by every scrape.do request, so a fetch joined by other callers never
+# runs on a client one of them has already closed
+_scrape_do_clients = PerLoopClient(
+    lambda: httpx.AsyncClient(timeout=settings.default_timeout)
+)
+
+
+@cache
+def get_groq_client() -> AsyncGroq:
+    """Create the Groq client on first use rather than when tools are imported."""
+    from groq import AsyncGroq
+
+    # Retries are left to groq_governor, which also honours rate-limit headers
+    return AsyncGroq(api_key=settings.groq_api_key, max_retries=0)
+
+
+async def _scrape_single_website(url: str, country_code: str) -> dict[str, Any]:
     """Scrape content from a single website using scrape.do API.
 
+    Concurrent calls for the same canonical URL and country share one scrape.do
+    request.
+
     Args:
         url: The URL to scrape
         country_code: Country code for geo-location
-        client: HTTP client instance
 
     Returns:
         Dictionary containing the scraped content and metadata
     """
-    try:
-        params = {
-            "token": settings.scrape_do_token,
-            "url": url,
-            "geoCode": country_code.upper(),
-            "super": True,
-            "output": "markdown",
-            "render": True,
-        }
-
-        response = await client.get("https://api.scrape.do", params=params)
-        response.raise_for_status()
-
-        # Get the markdown content from scrape.do
-        content = response.text
-
+    key = f"{country_code.upper()}|{canonicalize_url(url)}"
+    result, shared = await _scrape_do_inflight.do(
+        key, lambda: _fetch_single_website(url, country_code)
+    )
+    if shared:
+        return {**result, "url": url, "coalesced": True}
+    return result
+
+
+async def _fetch_single_website(url: str, country_code: str) -> dict[str, Any]:
+    started_at = time.perf_counter()
+    cache_variant = f"scrape.do:{country_code.upper()}"
+    cached = await scrape_cache.lookup(url, cache_variant)
+    if cached is not None:
         return {
             "url": url,
-            "content": content,
+            "content": cached.content,
             "format": "markdown",
             "country_code": country_code.upper(),
             "status": "success",
-            "content_length": len(content),
-        }
-    except Exception as e:
-        logger.exception("Error in _scrape_single_website")
-        return {
-            "url": url,
-            "error": str(e),
-            "content": "",
-            "status": "error",
-            "status_code": 0,
-            "api_used": "scrape.do",
+            "content_length": len(cached.content),
+            "cached": True,
+            "attempts": 0,
+            "elapsed_ms": _elapsed_ms(started_at),
         }
 
+    params = {
+        "token": settings.scrape_do_token,
+        "url": url,
+        "geoCode": country_code.upper(),
+        "super": True,
+        "output": "markdown",
+        "render": True,
+    }
+    status_code = 0
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            await scrape_rate_limiter.acquire(url, RATE_LIMIT_BACKEND)
+            response = await _scrape_do_clients.get().get(
+                "https://api.scrape.do",
+                params=params,
+                timeout=settings.scrape_do_timeout,
+            )
+            status_code = response.status_code
+            # scrape.do answers 429 for its own concurrency limit, not the target's
+            scrape_rate_limiter.record_response(
+                url,
+                RATE_LIMIT_BACKEND,
+                response.status_code,
+                response.headers.get("retry-after"),
+                throttled_by_backend=response.status_code == 429,
+            )
+            response.raise_for_status()
+
+            # Get the markdown content from scrape.do
+            content = response.text
+            if content.strip():
+                await scrape_cache.put(
+                    url,
+                    cache_variant,
+                    content,
+                    {
+                        "status_code": response.status_code,
+                        **validator_metadata(response.headers),
+                    },
+                )
+
+            return {
+                "url": url,
+                "content": content,
+                "format": "markdown",
+                "country_code": country_code.upper(),
+                "status": "success",
+                "status_code": status_code,
+                "content_length": len(content),
+                "cached": False,
+                "attempts": attempt,
+                "elapsed_ms": _elapsed_ms(started_at),
+            }
+        except Exception as e:
+            if _is_transient(e) and attempt <= settings.max_retries:
+                # Full jitter keeps retries of concurrent URLs from lining up
+                delay = random.uniform(
+                    0, settings.scrape_do_retry_base * 2 ** (attempt - 1)
+                )
+                logger.warning(
+                    f"scrape.do failed for {url} ({e}); retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{settings.max_retries})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            logger.exception("Error in _scrape_single_website")
+            return {
+                "url": url,
+                "error": str(e),
+                "content": "",
+                "status": "timeout"
+                if isinstance(e, httpx.TimeoutException)
+                else "error",
+                "status_code": status_code,
+                "api_used": "scrape.do",
+                "attempts": attempt,
+                "elapsed_ms": _elapsed_ms(started_at),
+            }
+
+
+async def close_scrape_do_client() -> None:
+    """Close the running event loop's scrape.do client."""
+    await _scrape_do_clients.close()
+
+
+def _is_transient(error: Exception) -> bool:
+    """Network errors, timeouts, 429 and 5xx answers are worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _elapsed_ms(started_at: float) -> float:
+    return round((time.perf_counter() - started_at) * 1000, 1)
+
 
 async def scrape_tool1(urls: list[str]) -> dict[str, Any]:
-    """Scrape content from multiple websites sequentially using scrape.do API.
+    """Scrape content from multiple websites concurrently using scrape.do API.
+
+    At most ``settings.scrape_do_concurrency`` URLs are fetched at once. Transient
+    failures are retried with exponential backoff and jitter, and each attempt is
+    bounded by ``settings.scrape_do_timeout``.
 
     Args:
         urls: List of URLs to scrape
 
     Returns:
-        Dictionary containing combined results from all scraped websites
+        Dictionary containing combined results from all scraped websites and a
+        per-URL status record (status, status_code, attempts, elapsed_ms)
     """
     # Validate input
     if not urls:
         return {
             "status": "error",
             "combined_content": "",
+            "results": [],
         }
 
     country_code = "US"  # Fixed default
-    delay_between_requests = 1.0  # Fixed default for safe scraping
-    results: list[dict[str, Any]] = []
-    successful_scrapes = 0
-    failed_scrapes = 0
-
-    # Use a single HTTP client for all requests
-    async with httpx.AsyncClient(timeout=settings.default_timeout) as client:
-        for i, url in enumerate(urls):
-            # Add delay between requests (except for the first one)
-            if i > 0:
-                await asyncio.sleep(delay_between_requests)
-
-            # Scrape individual website
-            result = await _scrape_single_website(url, country_code, client)
-            results.append(result)
-
-            # Track success/failure
-            if result.get("status") == "success":
-                successful_scrapes += 1
-            else:
-                failed_scrapes += 1
+    slots = asyncio.Semaphore(settings.scrape_do_concurrency)
+
+    async def scrape(url: str) -> dict[str, Any]:
+        async with slots:
+            return await _scrape_single_website(url, country_code)
+
+    results = await asyncio.gather(*(scrape(url) for url in urls))
 
     # Combine all successful content and omit failed results
-    combined_content = ""
-    successful_results = [r for r in results if r.get("status") == "success"]
-
-    if successful_results:
-        content_parts = []
-        for result in successful_results:
-            url = result["url"]
-            content = result["content"]
-            if content.strip():  # Only include if content is not empty
-                content_parts.append(f"# Content from {url}\n\n{content}\n\n---\n")
-        combined_content = "\n".join(content_parts)
+    content_parts = [
+        f"# Content from {result['url']}\n\n{result['content']}\n\n---\n"
+        for result in results
+        if result.get("status") == "success" and result["content"].strip()
+    ]
+    successful_scrapes = sum(1 for r in results if r.get("status") == "success")
 
     return {
         "status": "success" if successful_scrapes > 0 else "error",
-        "combined_content": combined_content,
+        "combined_content": "\n".join(content_parts),
+        "results": [
+            {key: value for key, value in result.items() if key != "content"}
+            for result in results
+        ],
     }
 
 
-async def search_tool(query: str, country: str) -> dict[str, Any]:
+async def search_tool(
+    query: str, country: str, tool_context: ToolContext
+) -> dict[str, Any]:
     """
     Performs intelligent web search using Groq Compound AI with regional optimization.
 
@@ -147,7 +262,38 @@ async def search_tool(query: str, country: str) -> dict[str, Any]:
                 * url: Source URL
                 * description: Content snippet or summary
                 * score: Relevance score from search engine
+                * scraped_excerpt: Passages of the page, when a parallel research
+                  worker already scraped it
     """
+    cached_results = await search_cache.get(query, country)
+    logger.debug(f"Search cache: {search_cache.stats.as_dict()}")
+    if cached_results is not None:
+        result = {"status": "success", "results": cached_results, "cached": True}
+    else:
+        try:
+            # The shared search keeps running for other callers after a timeout
+            async with asyncio.timeout(research_time_left(tool_context.invocation_id)):
+                result, _ = await _search_inflight.do(
+                    search_cache.make_key(query, country),
+                    lambda: _groq_search(query, country),
+                )
+        except TimeoutError:
+            logger.warning(f"search_tool stopped at the fact-check deadline: {query}")
+            return {"status": "error", "message": DEADLINE_MESSAGE}
+
+    frontier = get_evidence_frontier(tool_context.invocation_id)
+    if frontier and result.get("results"):
+        question = tool_context.state.get(
+            research_question_key(tool_context.agent_name)
+        )
+        result = {
+            **result,
+            "results": frontier.merge_search_results(result["results"], question),
+        }
+    return result
+
+
+async def _groq_search(query: str, country: str) -> dict[str, Any]:
     try:
         system_prompt = (
             "You are a world-class fact-check searcher. Support Georgian and English. "
@@ -170,22 +316,32 @@ async def search_tool(query: str, country: str) -> dict[str, Any]:
             "nl": "netherlands",
         }
 
-        response = await groq_client.chat.completions.create(
-            model="groq/compound",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": (
-                        "Search information on the web for query; add time range if helpful: "
-                        + query
-                    ),
-                },
-            ],
-            search_settings={
-                country: country_map.get(country.lower(), country.lower())
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {
+                "role": "user",
+                "content": (
+                    "Search information on the web for query; add time range if helpful: "
+                    + query
+                ),
             },
+        ]
+        estimated_tokens = estimate_tokens(system_prompt, query) + (
+            settings.llm_estimated_output_tokens
         )
+        raw_response = await groq_governor.call(
+            lambda: get_groq_client().chat.completions.with_raw_response.create(
+                model="groq/compound",
+                messages=messages,
+                search_settings={
+                    country: country_map.get(country.lower(), country.lower())
+                },
+            ),
+            estimated_tokens,
+        )
+        response = raw_response.parse()
+        if response.usage:
+            groq_governor.record_usage(estimated_tokens, response.usage.total_tokens)
 
         results = []
         executed_tools = response.choices[0].message.executed_tools
@@ -209,6 +365,8 @@ async def search_tool(query: str, country: str) -> dict[str, Any]:
                                 }
                             )
 
+        if results:
+            await search_cache.put(query, country, results)
         return {"status": "success", "results": results}
     except Exception:  # noqa: BLE001 - surface clean error string
         logger.exception("Error in groq_search")
@@ -219,20 +377,36 @@ async def search_tool(query: str, country: str) -> dict[str, Any]:
 scrape_websites_tool = FunctionTool(scrape_tool)
 groq_search_tool = FunctionTool(search_tool)
 
-scrape_with_lightpanda_tool = MCPToolset(
-    connection_params=SseConnectionParams(
-        url=f"{settings.lightpanda_ws_base}?token={settings.lightpanda_token}",
-    ),
-    # Filter tools for security in production
-    tool_filter=[
-        "goto",
-        "markdown",
-    ],
-)
+
+@cache
+def get_lightpanda_toolset() -> MCPToolset:
+    """Create the Lightpanda MCP toolset on first use."""
+    from google.adk.tools import MCPToolset
+    from google.adk.tools.mcp_tool.mcp_session_manager import SseConnectionParams
+
+    return MCPToolset(
+        connection_params=SseConnectionParams(
+            url=f"{settings.lightpanda_ws_base}?token={settings.lightpanda_token}",
+        ),
+        # Filter tools for security in production
+        tool_filter=[
+            "goto",
+            "markdown",
+        ],
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # `scrape_with_lightpanda_tool` stays importable without building it eagerly
+    if name == "scrape_with_lightpanda_tool":
+        return get_lightpanda_toolset()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Export all tools for easy import
 __all__ = [
     "adk_google_search",  # Use built-in ADK Google search tool
-    "scrape_with_lightpanda_tool",
+    "get_lightpanda_toolset",
     "groq_search_tool",
     "scrape_websites_tool",
     "search_tool",
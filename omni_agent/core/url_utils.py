@@ -0,0 +1,129 @@
+"""URL helpers shared by the scraping and caching layers."""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_", "pk_", "hsa_")
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mkt_tok",
+    "_ga",
+    "_gl",
+    "ref_src",
+    "cmpid",
+    "ocid",
+    "spm",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+MOBILE_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+AMP_PARAMS = {"amp", "outputtype", "output"}
+AMP_CACHE_SUFFIX = ".cdn.ampproject.org"
+
+
+def _is_tracking_param(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so that trivially different spellings share one key.
+
+    Lowercases the scheme and host, drops default ports, fragments and tracking
+    parameters, and sorts the remaining query parameters. A URL that cannot be
+    parsed, such as ``http://[::1``, is returned as written.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host if port in (None, DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+    if parts.username:
+        netloc = f"{parts.username}@{netloc}"
+
+    path = parts.path or "/"
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking_param(name)
+        )
+    )
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_domain(url: str) -> str:
+    """Return the lowercase host of a URL without a leading ``www.``.
+
+    A URL that cannot be parsed is its own domain, lowercased.
+    """
+    try:
+        host = (urlsplit(url.strip()).hostname or "").lower()
+    except ValueError:
+        return url.strip().lower()
+    return host.removeprefix("www.")
+
+
+def evidence_url_key(url: str) -> str:
+    """Key under which different versions of the same page are treated as one.
+
+    Goes further than ``canonicalize_url``: the scheme is ignored, AMP cache,
+    AMP and mobile variants (``m.``, ``amp.``, ``/amp``, ``?amp=1``,
+    ``?outputType=amp``) map to the desktop page, and trailing slashes are dropped.
+    """
+    canonical = canonicalize_url(url)
+    try:
+        parts = urlsplit(canonical)
+    except ValueError:
+        return canonical
+    if not parts.netloc:
+        return canonical
+
+    host = parts.hostname or ""
+    path = parts.path
+    if host.endswith(AMP_CACHE_SUFFIX):
+        # https://www-example-com.cdn.ampproject.org/c/s/example.com/article
+        segments = [segment for segment in path.split("/") if segment]
+        while segments and segments[0] in ("c", "v", "s", "i"):
+            segments.pop(0)
+        if segments:
+            host, path = segments[0], "/" + "/".join(segments[1:])
+
+    for prefix in MOBILE_HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host.removeprefix(prefix)
+            break
+
+    if path.startswith("/amp/"):
+        path = path.removeprefix("/amp")
+    path = path.rstrip("/")
+    for suffix in ("/amp", ".amp"):
+        path = path.removesuffix(suffix)
+    if path.endswith(".amp.html"):
+        path = path.removesuffix(".amp.html") + ".html"
+
+    query = urlencode(
+        [
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not (
+                name.lower() in AMP_PARAMS
+                and (name.lower() == "amp" or value.lower() == "amp")
+            )
+        ]
+    )
+    return urlunsplit(("", host, path, query, ""))
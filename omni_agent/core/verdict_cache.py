@@ -0,0 +1,127 @@
+"""TTL cache of claim verdicts, keyed by normalized claim text."""
+
+from __future__ import annotations
+
+import time
+import unicodedata
+from collections import OrderedDict
+
+from .models import AtomicClaimOutput, ClaimAdjudicationOutput
+from .scrape_cache import ScrapeCache
+from .search_cache import TOKEN, SearchCacheStats, is_time_sensitive
+from .settings import settings
+
+DISK_VARIANT = "verdict"
+# Inconclusive verdicts often come from research that was cut short, so they are
+# checked again rather than served to every later request
+CACHEABLE_VERDICTS = frozenset({"true", "false"})
+
+
+def normalize_claim(text: str) -> str:
+    """Case-, punctuation- and spacing-insensitive form of a claim.
+
+    Unlike ``normalize_query``, word order and stopwords are kept: "A beat B"
+    and "B beat A", or a claim and its negation, are different claims.
+    """
+    return " ".join(TOKEN.findall(unicodedata.normalize("NFKC", text).casefold()))
+
+
+class VerdictCache:
+    """In-memory LRU of claim verdicts with an optional SQLite tier.
+
+    Only true and false verdicts are stored. They stay fresh for
+    ``settings.verdict_cache_ttl`` seconds, or
+    ``settings.verdict_cache_time_sensitive_ttl`` for claims about recent events.
+    A hit is the stored ``ClaimAdjudicationOutput``, with its references and
+    citations, relabelled with the id and text of the claim being checked.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        ttl: float | None = None,
+        time_sensitive_ttl: float | None = None,
+        disk: ScrapeCache | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        self.max_entries = max_entries or settings.verdict_cache_max_entries
+        self.ttl = ttl or settings.verdict_cache_ttl
+        self.time_sensitive_ttl = (
+            time_sensitive_ttl or settings.verdict_cache_time_sensitive_ttl
+        )
+        self.disk = disk
+        self.enabled = settings.verdict_cache_enabled if enabled is None else enabled
+        self.stats = SearchCacheStats()
+        self._entries: OrderedDict[str, tuple[ClaimAdjudicationOutput, float]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        return normalize_claim(text)
+
+    def ttl_for(self, text: str) -> float:
+        return self.time_sensitive_ttl if is_time_sensitive(text) else self.ttl
+
+    async def get(self, claim: AtomicClaimOutput) -> ClaimAdjudicationOutput | None:
+        key = self.make_key(claim.text)
+        if not self.enabled or not key:
+            return None
+
+        verdict = None
+        entry = self._entries.get(key)
+        if entry is not None:
+            if time.time() < entry[1]:
+                self._entries.move_to_end(key)
+                self.stats.memory_hits += 1
+                verdict = entry[0]
+            else:
+                del self._entries[key]
+
+        if verdict is None and self.disk is not None:
+            cached = await self.disk.lookup(key, DISK_VARIANT)
+            if cached is not None:
+                verdict = ClaimAdjudicationOutput.model_validate_json(cached.content)
+                self._remember(key, verdict, cached.expires_at)
+                self.stats.disk_hits += 1
+
+        if verdict is None:
+            self.stats.misses += 1
+            return None
+        return verdict.model_copy(
+            update={"claim_id": claim.id, "claim_text": claim.text}, deep=True
+        )
+
+    async def put(
+        self, claim: AtomicClaimOutput, verdict: ClaimAdjudicationOutput
+    ) -> None:
+        key = self.make_key(claim.text)
+        if (
+            not self.enabled
+            or not key
+            or verdict.verdict.strip().lower() not in CACHEABLE_VERDICTS
+        ):
+            return
+        ttl = self.ttl_for(claim.text)
+        self._remember(key, verdict, time.time() + ttl)
+        self.stats.writes += 1
+        if self.disk is not None:
+            await self.disk.put(
+                key, DISK_VARIANT, verdict.model_dump_json(), {}, ttl=ttl
+            )
+
+    def _remember(
+        self, key: str, verdict: ClaimAdjudicationOutput, expires_at: float
+    ) -> None:
+        self._entries[key] = (verdict, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+verdict_cache = VerdictCache(
+    disk=ScrapeCache(path=settings.verdict_cache_path, enabled=True)
+    if settings.verdict_cache_disk_enabled
+    else None
+)
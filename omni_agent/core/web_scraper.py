@@ -1,17 +1,108 @@
+import asyncio
+import logging
 from typing import Any
 
-import httpx
 from google.adk.tools import ToolContext
 
 from omni_agent.agents.common.markdown_transformer_agent import (
     create_markdown_transformer_agent,
 )
 
+from .content_budget import split_at_boundaries
+from .deadline import DEADLINE_MESSAGE, research_time_left
+from .evidence_frontier import EvidenceFrontier, get_evidence_frontier
+from .markdown_extractor import render_page_markdown
+from .passage_retrieval import format_passages, research_question_key, select_passages
+from .scraper_client import scraper_client
 from .settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+async def _transform_to_markdown(
+    raw_content: str,
+    output_key: str,
+    tool_context: ToolContext,
+    source_url: str = "",
+    part: int = 1,
+    total_parts: int = 1,
+) -> str:
+    """Run the markdown transformer agent on one chunk and return its markdown."""
+    markdown_transformer_agent = create_markdown_transformer_agent(
+        raw_content, output_key, source_url, part, total_parts
+    )
+
+    markdown = ""
+    async for event in markdown_transformer_agent.run_async(
+        tool_context._invocation_context
+    ):
+        output = event.actions.state_delta.get(output_key)
+        if output:
+            markdown = output.get("markdown", "")
+    return markdown
+
+
+async def _transform_page(
+    url: str,
+    raw_html: str,
+    output_key: str,
+    tool_context: ToolContext,
+    llm_slots: asyncio.Semaphore,
+) -> str:
+    """Clean one page with the LLM by mapping over size-bounded chunks.
+
+    The page is first rendered to Markdown locally, split on section boundaries
+    into chunks of ``settings.markdown_chunk_chars``, cleaned in parallel (bounded
+    by ``llm_slots``) and joined back in page order.
+    """
+    page_markdown = await asyncio.to_thread(render_page_markdown, raw_html, url)
+    chunks = split_at_boundaries(page_markdown, settings.markdown_chunk_chars)
+    if len(chunks) > settings.markdown_max_chunks_per_page:
+        logger.info(
+            f"Cleaning the first {settings.markdown_max_chunks_per_page} of "
+            f"{len(chunks)} chunks of {url}"
+        )
+        chunks = chunks[: settings.markdown_max_chunks_per_page]
+
+    async def transform_chunk(index: int, chunk: str) -> str:
+        async with llm_slots:
+            return await _transform_to_markdown(
+                chunk,
+                f"{output_key}_{index}",
+                tool_context,
+                source_url=url,
+                part=index + 1,
+                total_parts=len(chunks),
+            )
+
+    cleaned = await asyncio.gather(
+        *(transform_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+        return_exceptions=True,
+    )
+    parts: list[str] = []
+    for index, markdown in enumerate(cleaned):
+        if isinstance(markdown, BaseException):
+            logger.warning(
+                f"Markdown transformation failed for {url} #{index}: {markdown}"
+            )
+            continue
+        if markdown.strip():
+            parts.append(markdown.strip())
+    return "\n\n".join(parts)
+
 
 async def scrape_tool(urls: list[str], tool_context: ToolContext) -> dict[str, Any]:
-    """Scrape content by calling the local FastAPI Lightpanda service asynchronously.
+    """Scrape content by streaming pages from the FastAPI Lightpanda service.
+
+    Requests go through the shared ``scraper_client`` at
+    ``settings.scraper_service_url``.
+
+    The service returns Markdown extracted locally. Pages it could not extract
+    confidently are handed to the markdown transformer agent as soon as they
+    arrive, so cleaning them overlaps with fetching the slow ones.
+
+    When the calling research agent stored its question in session state, only
+    the passages that best match it (see ``select_passages``) are returned.
 
     Args:
         urls: List of URLs to scrape
@@ -26,38 +117,122 @@ async def scrape_tool(urls: list[str], tool_context: ToolContext) -> dict[str, A
             "combined_content": "",
         }
 
-    service_url = "http://localhost:8003/scrape"
+    output_key_prefix = tool_context.agent_name + "_markdown"
 
-    async with httpx.AsyncClient(timeout=settings.default_timeout) as client:
-        try:
-            response = await client.post(service_url, json={"urls": urls})
-            response.raise_for_status()
-            data = response.json()
-        except Exception as exc:  # noqa: BLE001
+    # Pages a sibling worker already fetched, or is fetching, are reused from the
+    # invocation's evidence frontier instead of being scraped again
+    frontier = get_evidence_frontier(tool_context.invocation_id)
+    to_fetch, shared = frontier.claim(urls) if frontier else (urls, {})
+    try:
+        async with asyncio.timeout(research_time_left(tool_context.invocation_id)):
+            return await _scrape_pages(
+                to_fetch, shared, output_key_prefix, tool_context, frontier
+            )
+    except TimeoutError:
+        logger.warning(f"scrape_tool stopped at the fact-check deadline: {urls}")
+        return {
+            "status": "error",
+            "message": DEADLINE_MESSAGE,
+            "combined_content": "",
+        }
+    finally:
+        if frontier:
+            frontier.release(to_fetch)
+
+
+async def _scrape_pages(
+    to_fetch: list[str],
+    shared: dict[str, asyncio.Future[str | None]],
+    output_key_prefix: str,
+    tool_context: ToolContext,
+    frontier: EvidenceFrontier | None,
+) -> dict[str, Any]:
+    llm_slots = asyncio.Semaphore(settings.markdown_transform_concurrency)
+    pages: list[tuple[str, str | asyncio.Future[str | None]]] = list(shared.items())
+    try:
+        if to_fetch:
+            async for record in scraper_client.stream_records(to_fetch):
+                if record.get("status") != "success":
+                    logger.warning(
+                        f"Scraper service skipped {record.get('url')}: "
+                        f"{record.get('status')} {record.get('error', '')}"
+                    )
+                    if frontier and record.get("url"):
+                        frontier.resolve(record["url"], None)
+                    continue
+                if not (settings.markdown_llm_fallback and record.get("raw_content")):
+                    pages.append((record["url"], record["content"]))
+                    if frontier:
+                        frontier.resolve(record["url"], record["content"])
+                    continue
+                # Extraction was not confident; fall back to the LLM cleaner
+                output_key = f"{output_key_prefix}_{len(pages)}"
+                task = asyncio.create_task(
+                    _transform_page(
+                        record["url"],
+                        record["raw_content"],
+                        output_key,
+                        tool_context,
+                        llm_slots,
+                    )
+                )
+                pages.append((record["url"], task))
+                if frontier:
+                    frontier.resolve_from_task(record["url"], task)
+    except Exception as exc:  # noqa: BLE001
+        if not pages:
             return {
                 "status": "error",
                 "combined_content": f"Failed calling scraper service: {exc}",
             }
+        logger.warning(f"Scraper stream ended early, keeping partial results: {exc}")
+    finally:
+        if frontier:
+            # Pages the stream did not return will not arrive; siblings waiting
+            # for them must not wait until this call ends
+            frontier.release(to_fetch)
+    logger.debug(f"Scraper client pool: {scraper_client.pool_stats()}")
 
-    combined_content = data.get("combined_content", "")
-    if not combined_content.strip():
+    if not pages:
         return {
             "status": "error",
             "combined_content": "Could not scrape any content from the given URLs",
         }
 
-    output_key = tool_context.agent_name + "_markdown"
+    scraped_pages: list[tuple[str, str]] = []
+    for url, markdown_or_future in pages:
+        if isinstance(markdown_or_future, asyncio.Future):
+            try:
+                # Shielded: shared futures must survive this call being cancelled
+                markdown = await asyncio.shield(markdown_or_future) or ""
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Markdown transformation failed for {url}: {exc}")
+                continue
+        else:
+            markdown = markdown_or_future
+        if markdown.strip():
+            scraped_pages.append((url, markdown))
 
-    markdown_transformer_agent = create_markdown_transformer_agent(
-        combined_content, output_key
-    )
+    if not scraped_pages:
+        return {
+            "status": "error",
+            "combined_content": "Could not scrape any content from the given URLs",
+        }
 
-    async for _ in markdown_transformer_agent.run_async(
-        tool_context._invocation_context
-    ):
-        pass
+    question = tool_context.state.get(research_question_key(tool_context.agent_name))
+    if settings.passage_retrieval_enabled and question:
+        # Only the passages relevant to the worker's question reach its context
+        passages = await asyncio.to_thread(select_passages, question, scraped_pages)
+        if passages:
+            return {
+                "status": "success",
+                "combined_content": format_passages(passages),
+            }
 
     return {
         "status": "success",
-        "combined_content": tool_context.state[output_key].get("markdown"),
+        "combined_content": "\n".join(
+            f"# Content from {url}\n\n{markdown}\n\n---\n"
+            for url, markdown in scraped_pages
+        ),
     }
@@ -0,0 +1,132 @@
+"""Measure the cold-start import time of each entry point.
+
+Every sample imports the entry point in a fresh interpreter, so nothing is shared
+with earlier samples except the OS file cache. Run with:
+
+    python -m omni_agent.import_benchmark [--repeat 5] [--top 10] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+
+# Entry point name -> module imported by that entry point
+ENTRY_POINTS = {
+    "adk web": "omni_agent.agent",
+    "mcp stdio server": "omni_agent.adk_mcp_server",
+    "scraper service": "omni_agent.playwright_lightpanda_service",
+    "a2a": "omni_agent.a2a",
+}
+IMPORT_TIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)")
+TIMER = (
+    "import time; started = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - started)"
+)
+
+
+@dataclass
+class EntryPointTiming:
+    name: str
+    module: str
+    samples_s: list[float]
+    slowest_imports: list[tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.samples_s)
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "median_s": round(self.median_s, 3)}
+
+
+def _run(module: str, import_time: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable, "-W", "ignore"]
+    if import_time:
+        command += ["-X", "importtime"]
+    command += ["-c", TIMER.format(module=module)]
+    return subprocess.run(
+        command,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+
+
+def slowest_imports(stderr: str, top: int) -> list[tuple[str, float]]:
+    """Packages by import time, from ``-X importtime`` output.
+
+    A package is charged the cumulative time of each import that enters it from
+    another package, so ``google.adk`` pulling in ``vertexai`` charges ``vertexai``
+    and not ``google``. The entry point's own package is left out.
+    """
+    # -X importtime lists children before their parent, one indent level deeper
+    parents: list[tuple[int, str]] = []
+    packages: dict[str, float] = {}
+    for line in reversed(stderr.splitlines()):
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative_us, indent, name = match.groups()
+        while parents and parents[-1][0] >= len(indent):
+            parents.pop()
+        package = name.split(".")[0]
+        if package == "google":
+            package = ".".join(name.split(".")[:2])
+        parent = parents[-1][1] if parents else None
+        if parent is not None and parent != package:
+            packages[package] = packages.get(package, 0.0) + int(cumulative_us) / 1e6
+        parents.append((len(indent), package))
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return [(name, round(seconds, 3)) for name, seconds in ranked[:top]]
+
+
+def measure(name: str, module: str, repeat: int, top: int) -> EntryPointTiming:
+    samples = [float(_run(module).stdout.strip()) for _ in range(repeat)]
+    timing = EntryPointTiming(name=name, module=module, samples_s=samples)
+    if top:
+        timing.slowest_imports = slowest_imports(
+            _run(module, import_time=True).stderr, top
+        )
+    return timing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per entry point")
+    parser.add_argument(
+        "--top", type=int, default=10, help="Slowest packages to list (0 for none)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead")
+    parser.add_argument(
+        "entry_points",
+        nargs="*",
+        choices=list(ENTRY_POINTS),
+        help="Entry points to measure (default: all)",
+    )
+    args = parser.parse_args()
+
+    timings = [
+        measure(name, ENTRY_POINTS[name], args.repeat, args.top)
+        for name in args.entry_points or ENTRY_POINTS
+    ]
+    if args.json:
+        print(json.dumps([timing.as_dict() for timing in timings], indent=2))
+        return
+
+    for timing in timings:
+        samples = ", ".join(f"{sample:.2f}" for sample in timing.samples_s)
+        print(f"{timing.name} ({timing.module}): {timing.median_s:.2f}s [{samples}]")
+        for package, seconds in timing.slowest_imports:
+            print(f"    {package:<32} {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
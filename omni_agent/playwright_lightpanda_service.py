@@ -1,92 +1,829 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import json
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Iterator, Literal
 
-from fastapi import FastAPI
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+    async_playwright,
+)
+from playwright.async_api import Request as BrowserRequest
 from pydantic import BaseModel
 
+from omni_agent.core.content_budget import (
+    RequestBudget,
+    SpooledSections,
+    truncate_at_boundary,
+    truncate_html,
+)
+from omni_agent.core.http_fetcher import (
+    RATE_LIMIT_BACKEND as HTTP_RATE_LIMIT_BACKEND,
+)
+from omni_agent.core.http_fetcher import (
+    TIER_BROWSER,
+    TIER_HTTP,
+    http_fetcher,
+    tier_memory,
+)
+from omni_agent.core.markdown_extractor import extract_markdown
+from omni_agent.core.rate_limiter import THROTTLE_STATUS_CODES, scrape_rate_limiter
+from omni_agent.core.scrape_cache import scrape_cache, validator_metadata
 from omni_agent.core.settings import settings
+from omni_agent.core.single_flight import SingleFlight
+from omni_agent.core.url_utils import canonicalize_url, url_domain
 
+logger = logging.getLogger(__name__)
+
+SCRAPE_CACHE_VARIANT = "lightpanda"
+RATE_LIMIT_BACKEND = "lightpanda"
+
+
+@dataclass(eq=False)
+class _BrowserSlot:
+    """One CDP connection to Lightpanda and the context its pages are opened in."""
+
+    browser: Browser
+    context: BrowserContext
+    pages_served: int = 0
+    open_pages: int = 0
+    retired: bool = False
 
-async def scrape_urls_with_lightpanda(urls: list[str]) -> dict[str, Any]:
-    """Scrape multiple URLs using Playwright connected to Lightpanda (async).
 
-    Returns a dict with keys: status, combined_content.
+class LightpandaBrowserPool:
+    """Long-lived pool of CDP connections shared by every scrape request.
+
+    Connections are opened once and handed out round-robin. A slot is recycled
+    after ``max_pages_per_context`` pages or when its connection drops; the old
+    browser is closed as soon as its last open page is released.
     """
 
-    if not urls:
-        return {"status": "error", "combined_content": ""}
+    def __init__(
+        self,
+        size: int | None = None,
+        max_pages_per_context: int | None = None,
+        health_check_interval: float | None = None,
+    ) -> None:
+        self.size = max(1, size or settings.lightpanda_pool_size)
+        self.max_pages_per_context = max(
+            1, max_pages_per_context or settings.lightpanda_max_pages_per_context
+        )
+        self.health_check_interval = (
+            health_check_interval or settings.lightpanda_health_check_interval
+        )
+        self._playwright: Playwright | None = None
+        self._slots: list[_BrowserSlot | None] = []
+        self._next_slot = 0
+        self._lock = asyncio.Lock()
+        self._health_task: asyncio.Task[None] | None = None
 
-    if not settings.lightpanda_token:
+    @property
+    def ws_uri(self) -> str:
+        return f"{settings.lightpanda_ws_base}?token={settings.lightpanda_token}"
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    async def start(self) -> None:
+        """Start Playwright and warm up the pooled connections."""
+        async with self._lock:
+            if self._playwright is not None:
+                return
+            self._playwright = await async_playwright().start()
+            self._slots = [None] * self.size
+            if settings.lightpanda_token:
+                for index in range(self.size):
+                    try:
+                        self._slots[index] = await self._connect()
+                    except Exception:
+                        logger.exception("Failed to warm up Lightpanda connection")
+            self._health_task = asyncio.create_task(self._health_check_loop())
+        logger.info(f"Lightpanda browser pool started with {self.size} connections")
+
+    async def close(self) -> None:
+        """Close every pooled connection and stop Playwright."""
+        async with self._lock:
+            if self._health_task is not None:
+                self._health_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._health_task
+                self._health_task = None
+            for slot in self._slots:
+                if slot is not None:
+                    await self._dispose(slot)
+            self._slots = []
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+        logger.info("Lightpanda browser pool closed")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Open a page on a pooled connection and close it once the caller is done."""
+        slot = await self._checkout()
+        page: Page | None = None
+        try:
+            page = await slot.context.new_page()
+            yield page
+        finally:
+            if page is not None:
+                with suppress(Exception):
+                    await page.close()
+            slot.open_pages -= 1
+            if slot.retired and slot.open_pages == 0:
+                await self._dispose(slot)
+
+    async def _connect(self) -> _BrowserSlot:
+        assert self._playwright is not None
+        browser = await self._playwright.chromium.connect_over_cdp(self.ws_uri)
+        if browser.contexts:
+            context = browser.contexts[0]
+        else:
+            context = await browser.new_context()
+        return _BrowserSlot(browser=browser, context=context)
+
+    async def _checkout(self) -> _BrowserSlot:
+        if not self.started:
+            await self.start()
+
+        async with self._lock:
+            index = self._next_slot % self.size
+            self._next_slot += 1
+
+            slot = self._slots[index]
+            if slot is not None and not slot.browser.is_connected():
+                logger.warning(f"Lightpanda connection {index} dropped; reconnecting")
+                await self._retire(slot)
+                slot = None
+            elif slot is not None and slot.pages_served >= self.max_pages_per_context:
+                logger.info(
+                    f"Recycling Lightpanda connection {index} after "
+                    f"{slot.pages_served} pages"
+                )
+                await self._retire(slot)
+                slot = None
+
+            if slot is None:
+                slot = await self._connect()
+                self._slots[index] = slot
+
+            slot.pages_served += 1
+            slot.open_pages += 1
+            return slot
+
+    async def _retire(self, slot: _BrowserSlot) -> None:
+        slot.retired = True
+        if slot.open_pages == 0:
+            await self._dispose(slot)
+
+    async def _dispose(self, slot: _BrowserSlot) -> None:
+        with suppress(Exception):
+            await slot.browser.close()
+
+    async def _health_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            if not settings.lightpanda_token:
+                continue
+            async with self._lock:
+                for index, slot in enumerate(self._slots):
+                    if slot is not None and slot.browser.is_connected():
+                        continue
+                    if slot is not None:
+                        logger.warning(
+                            f"Health check: Lightpanda connection {index} is down"
+                        )
+                        await self._retire(slot)
+                    try:
+                        self._slots[index] = await self._connect()
+                    except Exception:
+                        self._slots[index] = None
+                        logger.exception(
+                            f"Health check: reconnecting Lightpanda connection "
+                            f"{index} failed"
+                        )
+
+
+browser_pool = LightpandaBrowserPool()
+
+
+FetchProfileName = Literal["full", "text+scripts", "text-only"]
+
+
+@dataclass(frozen=True)
+class FetchProfile:
+    """Which subresources a page may load while it is being scraped."""
+
+    name: str
+    blocked_resource_types: frozenset[str]
+    block_trackers: bool = True
+
+
+_MEDIA_RESOURCE_TYPES = frozenset(
+    {"image", "media", "font", "stylesheet", "texttrack", "manifest"}
+)
+FETCH_PROFILES: dict[str, FetchProfile] = {
+    "full": FetchProfile("full", frozenset(), block_trackers=False),
+    "text+scripts": FetchProfile("text+scripts", _MEDIA_RESOURCE_TYPES),
+    "text-only": FetchProfile(
+        "text-only",
+        _MEDIA_RESOURCE_TYPES
+        | {"script", "xhr", "fetch", "eventsource", "websocket", "other"},
+    ),
+}
+TRACKER_DOMAINS = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googletagservices.com",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "doubleclick.net",
+        "adservice.google.com",
+        "connect.facebook.net",
+        "amazon-adsystem.com",
+        "adnxs.com",
+        "criteo.com",
+        "criteo.net",
+        "taboola.com",
+        "outbrain.com",
+        "scorecardresearch.com",
+        "quantserve.com",
+        "chartbeat.com",
+        "chartbeat.net",
+        "hotjar.com",
+        "segment.com",
+        "segment.io",
+        "mixpanel.com",
+        "clarity.ms",
+        "nr-data.net",
+        "optimizely.com",
+        "mc.yandex.ru",
+    }
+)
+# Typical transfer sizes, used to estimate what a blocked request would have cost
+ESTIMATED_RESOURCE_BYTES: dict[str, int] = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 20_000,
+    "script": 30_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+DEFAULT_ESTIMATED_RESOURCE_BYTES = 2_000
+
+
+def get_fetch_profile(name: str | None) -> FetchProfile:
+    """Resolve a profile name, falling back to the configured default."""
+    profile_name = name or settings.scrape_fetch_profile
+    if profile_name not in FETCH_PROFILES:
+        raise ValueError(
+            f"Unknown fetch profile '{profile_name}'. "
+            f"Choose one of: {', '.join(FETCH_PROFILES)}"
+        )
+    return FETCH_PROFILES[profile_name]
+
+
+class _RequestFilter:
+    """Route handler that aborts requests a fetch profile does not need."""
+
+    def __init__(self, profile: FetchProfile) -> None:
+        self.profile = profile
+        self.blocked_domains = TRACKER_DOMAINS | set(settings.scrape_blocked_domains)
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.estimated_bytes_saved = 0
+
+    @property
+    def active(self) -> bool:
+        return bool(self.profile.blocked_resource_types) or self.profile.block_trackers
+
+    def stats(self) -> dict[str, int]:
         return {
-            "status": "error",
-            "combined_content": "Missing Lightpanda token. Set it in environment or .env.",
+            "allowed_requests": self.allowed_requests,
+            "blocked_requests": self.blocked_requests,
+            "estimated_bytes_saved": self.estimated_bytes_saved,
         }
 
-    lightpanda_cdp_ws_uri = (
-        f"{settings.lightpanda_ws_base}?token={settings.lightpanda_token}"
-    )
+    async def handle(self, route: Route) -> None:
+        request = route.request
+        if self._should_block(request):
+            self.blocked_requests += 1
+            self.estimated_bytes_saved += ESTIMATED_RESOURCE_BYTES.get(
+                request.resource_type, DEFAULT_ESTIMATED_RESOURCE_BYTES
+            )
+            await route.abort("blockedbyclient")
+        else:
+            self.allowed_requests += 1
+            await route.continue_()
 
-    async with async_playwright() as playwright:
-        browser: Browser = await playwright.chromium.connect_over_cdp(
-            lightpanda_cdp_ws_uri
+    def _should_block(self, request: BrowserRequest) -> bool:
+        if request.resource_type == "document" and request.frame.parent_frame is None:
+            return False
+        if request.resource_type in self.profile.blocked_resource_types:
+            return True
+        if not self.profile.block_trackers:
+            return False
+        host = url_domain(request.url)
+        return any(
+            host == domain or host.endswith("." + domain)
+            for domain in self.blocked_domains
         )
+
+
+@dataclass
+class PageResult:
+    """Outcome of scraping one URL, with per-stage timings in milliseconds."""
+
+    url: str
+    status: str
+    content: str = ""
+    error: str = ""
+    timings: dict[str, float] = field(default_factory=dict)
+    extraction_confidence: float = 0.0
+    # Raw HTML, kept only when extraction is not confident enough to stand alone
+    raw_content: str = ""
+    cached: bool = False
+    # True when this result was shared from an identical in-flight fetch
+    coalesced: bool = False
+    profile: str = ""
+    # Fetch tier that produced the content: "http" or "browser"
+    tier: str = ""
+    # Why the plain HTTP tier handed the page over to the browser, if it did
+    escalation_reason: str = ""
+    # True when the page or its Markdown was cut to fit a byte budget
+    truncated: bool = False
+    resource_stats: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        """Per-URL status record without the page content."""
+        return {
+            "url": self.url,
+            "status": self.status,
+            "error": self.error,
+            "content_length": len(self.content),
+            "extraction_confidence": self.extraction_confidence,
+            "cached": self.cached,
+            "coalesced": self.coalesced,
+            "profile": self.profile,
+            "tier": self.tier,
+            "escalation_reason": self.escalation_reason,
+            "truncated": self.truncated,
+            "resource_stats": self.resource_stats,
+            "timings": self.timings,
+        }
+
+    def record(self) -> dict[str, Any]:
+        """Per-URL status record including the page content."""
+        return {
+            **self.summary(),
+            "content": self.content,
+            "raw_content": self.raw_content,
+        }
+
+
+class _PageBudget:
+    """The ``page_timeout`` one URL may spend, shared by both fetch tiers.
+
+    Waiting for the host's rate limit and fetching draw on the same budget, so
+    escalating to the browser never extends a URL's deadline. Time queued for a
+    page slot is not counted.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.remaining = seconds
+
+    @contextmanager
+    def spend(self) -> Iterator[None]:
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self.remaining -= time.monotonic() - started_at
+
+    def timeout(self) -> asyncio.Timeout:
+        return asyncio.timeout(max(self.remaining, 0.0))
+
+
+class PageScheduler:
+    """Run each URL as an independent page pipeline under bounded concurrency.
+
+    ``max_open_pages`` caps pages open across the whole service and
+    ``max_pages_per_request`` caps pages open for one request. Every URL gets its
+    own ``page_timeout`` budget for waiting on its host and fetching, across both
+    tiers, so a slow page only ever costs its own result. Concurrent requests for
+    the same canonical URL share a single fetch, and every fetch first waits for
+    its host's turn on the shared ``scrape_rate_limiter``.
+
+    Unless the profile is ``full`` or the domain is known to need a browser, a URL
+    is first fetched with plain HTTP by ``http_fetcher`` and only rendered in
+    Lightpanda when that tier asks for escalation. The tier that worked is
+    remembered per domain in ``tier_memory``; a domain is pinned to the browser
+    only by a bot challenge or a JavaScript app shell.
+    """
+
+    def __init__(
+        self,
+        pool: LightpandaBrowserPool,
+        max_open_pages: int | None = None,
+        max_pages_per_request: int | None = None,
+        page_timeout: float | None = None,
+        network_idle_timeout: float | None = None,
+    ) -> None:
+        self.pool = pool
+        self.max_open_pages = max(1, max_open_pages or settings.scrape_max_open_pages)
+        self.max_pages_per_request = max(
+            1, max_pages_per_request or settings.scrape_max_pages_per_request
+        )
+        self.page_timeout = page_timeout or settings.scrape_page_timeout
+        self.network_idle_timeout = (
+            network_idle_timeout or settings.scrape_network_idle_timeout
+        )
+        self._service_slots = asyncio.Semaphore(self.max_open_pages)
+        self._inflight: SingleFlight[PageResult] = SingleFlight()
+
+    async def iter_results(
+        self, urls: list[str], profile: FetchProfile | None = None
+    ) -> AsyncIterator[PageResult]:
+        """Yield a ``PageResult`` for every URL as soon as its pipeline finishes."""
+        async for _, result in self.iter_indexed_results(urls, profile):
+            yield result
+
+    async def iter_indexed_results(
+        self, urls: list[str], profile: FetchProfile | None = None
+    ) -> AsyncIterator[tuple[int, PageResult]]:
+        """Like ``iter_results``, paired with the index of each URL in ``urls``."""
+        profile = profile or get_fetch_profile(None)
+        request_slots = asyncio.Semaphore(self.max_pages_per_request)
+
+        async def indexed(index: int, url: str) -> tuple[int, PageResult]:
+            return index, await self._run_pipeline(url, request_slots, profile)
+
+        tasks = [
+            asyncio.create_task(indexed(index, url)) for index, url in enumerate(urls)
+        ]
         try:
-            if browser.contexts:
-                browser_context: BrowserContext = browser.contexts[0]
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(
+        self, urls: list[str], profile: FetchProfile | None = None
+    ) -> list[PageResult]:
+        """Scrape every URL and return results in the order the URLs were given."""
+        profile = profile or get_fetch_profile(None)
+        request_slots = asyncio.Semaphore(self.max_pages_per_request)
+        return list(
+            await asyncio.gather(
+                *(self._run_pipeline(url, request_slots, profile) for url in urls)
+            )
+        )
+
+    async def _run_pipeline(
+        self, url: str, request_slots: asyncio.Semaphore, profile: FetchProfile
+    ) -> PageResult:
+        """Scrape a URL, joining an identical fetch already in flight if any."""
+        result, shared = await self._inflight.do(
+            f"{profile.name}|{canonicalize_url(url)}",
+            lambda: self._scrape(url, request_slots, profile),
+        )
+        if shared:
+            result = replace(result, url=url, coalesced=True)
+        return result
+
+    async def _scrape(
+        self, url: str, request_slots: asyncio.Semaphore, profile: FetchProfile
+    ) -> PageResult:
+        queued_at = time.perf_counter()
+        cache_variant = f"{SCRAPE_CACHE_VARIANT}:{profile.name}"
+        cached = await scrape_cache.lookup(url, cache_variant)
+        if cached is not None:
+            return PageResult(
+                url=url,
+                status="success",
+                content=cached.content,
+                extraction_confidence=cached.metadata.get("extraction_confidence", 0.0),
+                raw_content=cached.metadata.get("raw_content", ""),
+                truncated=cached.metadata.get("truncated", False),
+                cached=True,
+                profile=profile.name,
+                timings={"cache_ms": _elapsed_ms(queued_at, time.perf_counter())},
+            )
+
+        budget = _PageBudget(self.page_timeout)
+        escalation_reason = ""
+        if self._use_http_tier(url, profile):
+            http_metadata: dict[str, Any] = {"tier": TIER_HTTP}
+            result = await self._scrape_http(
+                url, request_slots, queued_at, budget, http_metadata
+            )
+            if result.status != "escalate":
+                result.profile = profile.name
+                if result.status == "success":
+                    http_metadata["extraction_confidence"] = (
+                        result.extraction_confidence
+                    )
+                    http_metadata["truncated"] = result.truncated
+                    await scrape_cache.put(
+                        url, cache_variant, result.content, http_metadata
+                    )
+                return result
+            escalation_reason = result.error
+            logger.info(f"Escalating {url} to the browser: {escalation_reason}")
+
+        with budget.spend():
+            allowed = await scrape_rate_limiter.acquire(
+                url, RATE_LIMIT_BACKEND, max_wait=budget.remaining
+            )
+        if not allowed:
+            return PageResult(
+                url=url,
+                status="rate_limited",
+                error="Host is throttled for longer than the page deadline",
+                escalation_reason=escalation_reason,
+                timings={"queued_ms": _elapsed_ms(queued_at, time.perf_counter())},
+            )
+
+        fetch_metadata: dict[str, Any] = {"tier": TIER_BROWSER}
+        request_filter = _RequestFilter(profile)
+        async with request_slots, self._service_slots:
+            started_at = time.perf_counter()
+            timings = {"queued_ms": _elapsed_ms(queued_at, started_at)}
+            try:
+                with budget.spend():
+                    async with budget.timeout():
+                        html = await self._fetch_page(
+                            url, timings, started_at, fetch_metadata, request_filter
+                        )
+            except TimeoutError:
+                html = ""
+                result = PageResult(
+                    url=url, status="timeout", error="Page deadline exceeded"
+                )
+            except Exception as exc:  # noqa: BLE001 - reported per URL
+                html = ""
+                result = PageResult(url=url, status="error", error=str(exc))
             else:
-                browser_context = await browser.new_context()
+                result = PageResult(url=url, status="empty")
+
+        result.profile = profile.name
+        result.tier = TIER_BROWSER
+        result.escalation_reason = escalation_reason
+        result.resource_stats = request_filter.stats()
+        if result.error:
+            logger.warning(f"Error scraping {url}: {result.error}")
+        elif html.strip():
+            html, result.truncated = truncate_html(html, settings.scrape_max_page_bytes)
+            try:
+                await self._extract(result, html, timings)
+            except Exception as exc:  # noqa: BLE001 - reported per URL
+                result.status = "error"
+                result.error = f"Extraction failed: {exc!r}"
+                logger.warning(f"Error extracting {url}: {result.error}")
 
-            page_list: list[Page] = []
-            for _ in urls:
-                page_list.append(await browser_context.new_page())
+        if result.status == "success":
+            tier_memory.remember(url, TIER_BROWSER)
+            fetch_metadata["extraction_confidence"] = result.extraction_confidence
+            if result.raw_content:
+                fetch_metadata["raw_content"] = result.raw_content
+            fetch_metadata["truncated"] = result.truncated
+            await scrape_cache.put(url, cache_variant, result.content, fetch_metadata)
 
-            navigation_tasks = [
-                page_list[i].goto(
-                    urls[i],
-                    wait_until="load",
-                    timeout=int(settings.default_timeout * 1000),
+        timings["total_ms"] = _elapsed_ms(started_at, time.perf_counter())
+        result.timings = timings
+        return result
+
+    def _use_http_tier(self, url: str, profile: FetchProfile) -> bool:
+        return (
+            settings.http_fetch_enabled
+            and profile.name != "full"
+            and tier_memory.preferred_tier(url) != TIER_BROWSER
+        )
+
+    async def _scrape_http(
+        self,
+        url: str,
+        request_slots: asyncio.Semaphore,
+        queued_at: float,
+        budget: _PageBudget,
+        fetch_metadata: dict[str, Any],
+    ) -> PageResult:
+        """Fetch a URL over plain HTTP; status "escalate" hands it to the browser.
+
+        The response's status code and cache validators are added to
+        ``fetch_metadata``.
+        """
+        with budget.spend():
+            allowed = await scrape_rate_limiter.acquire(
+                url, HTTP_RATE_LIMIT_BACKEND, max_wait=budget.remaining
+            )
+        if not allowed:
+            return PageResult(
+                url=url, status="escalate", error="HTTP tier throttled", tier=TIER_HTTP
+            )
+
+        async with request_slots:
+            started_at = time.perf_counter()
+            timings = {"queued_ms": _elapsed_ms(queued_at, started_at)}
+            try:
+                with budget.spend():
+                    async with budget.timeout():
+                        fetched = await http_fetcher.fetch(url)
+            except TimeoutError:
+                return PageResult(
+                    url=url,
+                    status="escalate",
+                    error="HTTP fetch deadline exceeded",
+                    tier=TIER_HTTP,
                 )
-                for i in range(len(urls))
-            ]
-            await asyncio.gather(*navigation_tasks, return_exceptions=True)
-
-            # Optional: wait for network to settle a bit on each page
-            network_idle_tasks = [
-                page_list[i].wait_for_load_state("networkidle")
-                for i in range(len(urls))
-            ]
-            await asyncio.gather(*network_idle_tasks, return_exceptions=True)
-
-            combined_sections: list[str] = []
-            html_content_tasks = [page_list[i].content() for i in range(len(urls))]
-            page_html_results = await asyncio.gather(
-                *html_content_tasks, return_exceptions=True
+            except Exception as exc:  # noqa: BLE001 - any HTTP-tier failure escalates
+                return PageResult(
+                    url=url,
+                    status="escalate",
+                    error=f"HTTP fetch failed: {exc!r}",
+                    tier=TIER_HTTP,
+                )
+        timings["http_ms"] = _elapsed_ms(started_at, time.perf_counter())
+        timings["total_ms"] = timings["http_ms"]
+        content, content_truncated = truncate_at_boundary(
+            fetched.content, settings.max_content_length
+        )
+
+        fetch_metadata.update(fetched.metadata)
+        # An error status or a weak page says nothing about the rest of the site
+        if fetched.needs_browser:
+            tier_memory.remember(url, TIER_BROWSER)
+        elif fetched.status == "success":
+            tier_memory.remember(url, TIER_HTTP)
+        return PageResult(
+            url=url,
+            status=fetched.status,
+            content=content,
+            error=fetched.reason,
+            extraction_confidence=fetched.confidence,
+            tier=TIER_HTTP,
+            truncated=fetched.truncated or content_truncated,
+            timings=timings,
+        )
+
+    async def _extract(
+        self, result: PageResult, html: str, timings: dict[str, float]
+    ) -> None:
+        """Convert the page HTML to Markdown, keeping the HTML if confidence is low."""
+        extract_started_at = time.perf_counter()
+        extraction = await asyncio.to_thread(extract_markdown, html, result.url)
+        timings["extract_ms"] = _elapsed_ms(extract_started_at, time.perf_counter())
+
+        result.content, content_truncated = truncate_at_boundary(
+            extraction.markdown, settings.max_content_length
+        )
+        result.truncated = result.truncated or content_truncated
+        result.extraction_confidence = extraction.confidence
+        if (
+            settings.markdown_llm_fallback
+            and extraction.confidence < settings.markdown_min_confidence
+        ):
+            result.raw_content = html
+        if result.content.strip() or result.raw_content:
+            result.status = "success"
+
+    async def _fetch_page(
+        self,
+        url: str,
+        timings: dict[str, float],
+        started_at: float,
+        fetch_metadata: dict[str, Any],
+        request_filter: _RequestFilter,
+    ) -> str:
+        async with self.pool.page() as page:
+            if request_filter.active:
+                await page.route("**/*", request_filter.handle)
+            response = await page.goto(
+                url,
+                wait_until="load",
+                timeout=int(self.page_timeout * 1000),
             )
+            timings["load_ms"] = _elapsed_ms(started_at, time.perf_counter())
+            if response is not None:
+                scrape_rate_limiter.record_response(
+                    url,
+                    RATE_LIMIT_BACKEND,
+                    response.status,
+                    response.headers.get("retry-after"),
+                )
+                if response.status in THROTTLE_STATUS_CODES:
+                    raise RuntimeError(f"Host answered HTTP {response.status}")
+                fetch_metadata["status_code"] = response.status
+                fetch_metadata.update(validator_metadata(response.headers))
 
-            for i, html_or_error in enumerate(page_html_results):
-                url = urls[i]
-                if isinstance(html_or_error, Exception):
-                    print(f"Error scraping {url}: {html_or_error}")
-                    continue
-                html = html_or_error or ""
-                if html.strip():
-                    combined_sections.append(f"# Content from {url}\n\n{html}\n\n---\n")
-
-            if not combined_sections:
-                return {
-                    "status": "error",
-                    "combined_content": "Could not scrape any content from the given URLs",
-                }
-
-            return {
-                "status": "success",
-                "combined_content": "\n".join(combined_sections),
-            }
-        finally:
-            await browser.close()
+            # Optional: give the network a short window to settle
+            with suppress(Exception):
+                await page.wait_for_load_state(
+                    "networkidle", timeout=int(self.network_idle_timeout * 1000)
+                )
+            return await page.content()
+
+
+def _elapsed_ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 1)
+
+
+page_scheduler = PageScheduler(browser_pool)
+
+
+async def scrape_urls_with_lightpanda(
+    urls: list[str], profile: str | None = None
+) -> dict[str, Any]:
+    """Scrape multiple URLs using Playwright connected to Lightpanda (async).
+
+    URLs are scheduled on the shared ``page_scheduler``; a failed or slow URL does
+    not discard the pages that did finish. Page content is returned as Markdown
+    extracted by ``extract_markdown``. ``profile`` names one of ``FETCH_PROFILES``
+    and defaults to ``settings.scrape_fetch_profile``.
+
+    Returns a dict with keys: status, combined_content, results (per-URL status).
+    """
+
+    if not urls:
+        return {"status": "error", "combined_content": "", "results": []}
+
+    if not settings.lightpanda_token:
+        return {
+            "status": "error",
+            "combined_content": "Missing Lightpanda token. Set it in environment or .env.",
+            "results": [],
+        }
+
+    # Pages are written to a spooled temp file as they finish and charged to the
+    # request's byte budget, so a large batch never holds every page in memory.
+    budget = RequestBudget()
+    summaries: list[dict[str, Any]] = [{} for _ in urls]
+    with SpooledSections() as sections:
+        async for index, result in page_scheduler.iter_indexed_results(
+            urls, get_fetch_profile(profile)
+        ):
+            if result.status == "success":
+                content, over_budget = budget.take(result.content or result.raw_content)
+                if content:
+                    sections.add(
+                        index, f"# Content from {result.url}\n\n{content}\n\n---\n"
+                    )
+                if over_budget:
+                    result = replace(result, truncated=True)
+            summaries[index] = result.summary()
+        combined_content = sections.read_ordered("\n") if len(sections) else ""
+
+    if not combined_content:
+        return {
+            "status": "error",
+            "combined_content": "Could not scrape any content from the given URLs",
+            "results": summaries,
+        }
+
+    return {
+        "status": "success",
+        "combined_content": combined_content,
+        "results": summaries,
+    }
+
+
+async def stream_scrape_records(
+    urls: list[str], profile: str | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield one record per URL (see ``PageResult.record``) as soon as it is ready."""
+    if not settings.lightpanda_token:
+        yield PageResult(
+            url="",
+            status="error",
+            error="Missing Lightpanda token. Set it in environment or .env.",
+        ).record()
+        return
+
+    budget = RequestBudget()
+    async for result in page_scheduler.iter_results(urls, get_fetch_profile(profile)):
+        content, content_over = budget.take(result.content)
+        raw_content, raw_over = budget.take(result.raw_content)
+        yield replace(
+            result,
+            content=content,
+            raw_content=raw_content,
+            truncated=result.truncated or content_over or raw_over,
+        ).record()
 
 
 async def run_example() -> None:
@@ -94,8 +831,13 @@ async def run_example() -> None:
     example_urls = [
         "https://publika.ge/article/ver-dadasturda-jgufuri-dzaladoba-tumca-ras-wers-mchedlishvili-8-piris-ganachenshi/"
     ]
-    result = await scrape_urls_with_lightpanda(example_urls)
-    print(result.get("combined_content", result.get("combined_content", "")))
+    try:
+        result = await scrape_urls_with_lightpanda(example_urls)
+        print(result.get("combined_content", result.get("combined_content", "")))
+    finally:
+        await browser_pool.close()
+        await http_fetcher.close()
+        await scrape_cache.close()
 
 
 def main() -> None:
@@ -103,16 +845,51 @@ def main() -> None:
 
 
 # -------- Minimal FastAPI app --------
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    await browser_pool.start()
+    try:
+        yield
+    finally:
+        await browser_pool.close()
+        await http_fetcher.close()
+        await scrape_cache.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 class ScrapeUrlsRequest(BaseModel):
     urls: list[str]
+    profile: FetchProfileName | None = None
 
 
 @app.post("/scrape")
 async def post_scrape(req: ScrapeUrlsRequest) -> dict[str, Any]:
-    return await scrape_urls_with_lightpanda(req.urls)
+    return await scrape_urls_with_lightpanda(req.urls, req.profile)
+
+
+@app.get("/cache/stats")
+async def get_cache_stats() -> dict[str, Any]:
+    return scrape_cache.stats.as_dict()
+
+
+@app.post("/scrape/stream")
+async def post_scrape_stream(
+    req: ScrapeUrlsRequest, request: Request
+) -> StreamingResponse:
+    """Stream one JSON record per URL as NDJSON, or as SSE when requested."""
+    use_sse = "text/event-stream" in request.headers.get("accept", "")
+
+    async def encode_records() -> AsyncIterator[str]:
+        async for record in stream_scrape_records(req.urls, req.profile):
+            line = json.dumps(record, ensure_ascii=False)
+            yield f"data: {line}\n\n" if use_sse else f"{line}\n"
+
+    return StreamingResponse(
+        encode_records(),
+        media_type="text/event-stream" if use_sse else "application/x-ndjson",
+    )
 
 
 if __name__ == "__main__":
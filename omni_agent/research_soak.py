@@ -0,0 +1,172 @@
+"""Soak test of the research stage: many fact-checks through one shared orchestrator.
+
+Runs ``research_orchestrator_agent`` again and again with a fake LLM, several
+fact-checks at a time, and reports traced memory after garbage collection,
+how many ``LlmAgent`` instances are still alive and how many sub-agents the
+shared orchestrator holds. Every run checks that it got the answers to its own
+questions only: a stale ``research_answer_<i>`` from an earlier fact-check is
+left in the session, and the last question of each run fails. Run with:
+
+    python -m omni_agent.research_soak [--runs 2000] [--concurrency 20] [--questions 6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import re
+import time
+import tracemalloc
+from typing import Any, AsyncGenerator
+
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from omni_agent.agents.research import single_question_research_agent
+from omni_agent.agents.research.research_orchestrator_agent import (
+    research_orchestrator_agent,
+)
+
+APP_NAME = "research_soak"
+USER_ID = "soak"
+QUESTION = re.compile(r"Question to research: (.+)")
+FAILING_SUFFIX = "(fails)"
+
+
+class FakeResearchLlm(BaseLlm):
+    """Answer every question with itself, or fail questions marked as failing."""
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        match = QUESTION.search(str(llm_request.config.system_instruction))
+        question = match.group(1).strip() if match else ""
+        await asyncio.sleep(0)
+        if question.endswith(FAILING_SUFFIX):
+            raise RuntimeError("fake research failure")
+        yield LlmResponse(
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=json.dumps({"question": question}))],
+            )
+        )
+
+
+def _questions(run: int, count: int) -> list[str]:
+    # Distinct years keep near-duplicate detection from merging the questions
+    questions = [
+        f"What did organisation R{run} report in {1900 + i}?" for i in range(count)
+    ]
+    questions[-1] = f"{questions[-1]} {FAILING_SUFFIX}"
+    return questions
+
+
+def _answered_question(answer: Any) -> str | None:
+    if isinstance(answer, str):
+        try:
+            answer = json.loads(answer)
+        except ValueError:
+            return None
+    if isinstance(answer, dict) and answer.get("status") != "unfinished":
+        return answer.get("question")
+    return None
+
+
+async def _fact_check(
+    runner: Runner, sessions: InMemorySessionService, run: int, questions: int
+) -> None:
+    asked = _questions(run, questions)
+    session = await sessions.create_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        state={
+            "gap_questions": {
+                "gap_questions": [
+                    {
+                        "id": f"Q{i + 1}",
+                        "question": question,
+                        "claim_id": "C1",
+                        "question_type": "temporal",
+                    }
+                    for i, question in enumerate(asked)
+                ]
+            },
+            # Left by an earlier fact-check; must not fill the failing question
+            f"research_answer_{questions - 1}": json.dumps({"question": "stale"}),
+        },
+    )
+    async for _ in runner.run_async(
+        user_id=USER_ID,
+        session_id=session.id,
+        new_message=types.Content(role="user", parts=[types.Part(text="research")]),
+    ):
+        pass
+
+    session = await sessions.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    )
+    answers = session.state["research_answers"]
+    answered = [_answered_question(answer) for answer in answers]
+    if answered[:-1] != asked[:-1] or answered[-1] is not None:
+        raise AssertionError(f"Run {run} got foreign answers: {answered}")
+    await sessions.delete_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+    )
+
+
+def _live_llm_agents() -> int:
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, LlmAgent))
+
+
+async def soak(runs: int, concurrency: int, questions: int) -> None:
+    single_question_research_agent.research_model = FakeResearchLlm(model="fake")
+    sessions = InMemorySessionService()
+    runner = Runner(
+        agent=research_orchestrator_agent, app_name=APP_NAME, session_service=sessions
+    )
+    checkpoints = {runs // 10, runs // 2, runs} - {0}
+
+    tracemalloc.start()
+    started_at = time.monotonic()
+    done = 0
+    while done < runs:
+        batch = range(done, min(done + concurrency, runs))
+        await asyncio.gather(
+            *(_fact_check(runner, sessions, run, questions) for run in batch)
+        )
+        previous, done = done, batch.stop
+        if any(previous < checkpoint <= done for checkpoint in checkpoints):
+            gc.collect()
+            traced, _ = tracemalloc.get_traced_memory()
+            print(
+                f"runs={done:6d} traced={traced / 1e6:6.2f}MB "
+                f"live LlmAgents={_live_llm_agents()} "
+                f"sub_agents={len(research_orchestrator_agent.sub_agents)}"
+            )
+    print(f"{runs} runs in {time.monotonic() - started_at:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000, help="Fact-checks to run")
+    parser.add_argument(
+        "--concurrency", type=int, default=20, help="Fact-checks run at once"
+    )
+    parser.add_argument(
+        "--questions", type=int, default=6, help="Gap questions per fact-check"
+    )
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    asyncio.run(soak(args.runs, args.concurrency, max(2, args.questions)))
+
+
+if __name__ == "__main__":
+    main()